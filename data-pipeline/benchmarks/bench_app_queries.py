@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+App query latency benchmark.
+
+Replays the SQL the app runs against the shipped DB (VocabRepositoryImpl and
+SrsRepositoryImpl) on two copies of the same synthetic database:
+
+  - before: the previous layout (single-column indexes, WAL, PRAGMA optimize)
+  - after:  finalize_database() (composite/NOCASE indexes, ANALYZE, VACUUM)
+
+An srs_card table is added to both copies the way the app creates it at first
+launch, with a share of the words already studied. Reports median and p95
+latency per query, the speedup, and the file size of each layout.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_app_queries.py
+    python benchmarks/bench_app_queries.py --counts 10000,100000 --plans
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_vocab_db as vocab  # noqa: E402
+
+# Indexes as SCHEMA_SQL created them before finalize_database() existed
+LEGACY_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_word_cefr ON word(cefr_level);
+CREATE INDEX IF NOT EXISTS idx_word_frequency ON word(frequency_rank);
+CREATE INDEX IF NOT EXISTS idx_word_pos ON word(pos);
+CREATE INDEX IF NOT EXISTS idx_example_word ON word_example(word_id);
+"""
+
+# As created by DatabaseDriverFactory.ensureNewTables()
+SRS_CARD_SQL = """
+CREATE TABLE IF NOT EXISTS srs_card (
+    word_id INTEGER PRIMARY KEY NOT NULL,
+    ease_factor REAL NOT NULL DEFAULT 2.5,
+    interval INTEGER NOT NULL DEFAULT 0,
+    repetitions INTEGER NOT NULL DEFAULT 0,
+    next_review INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'new',
+    total_reviews INTEGER NOT NULL DEFAULT 0,
+    correct_count INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+WORD_COLUMNS = "id, word, definition, pos, cefr_level, frequency_rank, phonetic, audio_url"
+STUDIED_SHARE = 0.1
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def synthetic_words(n: int, seed: int = 1) -> List[dict]:
+    """Enriched-word dicts shaped like enrich_words() output."""
+    rnd = random.Random(seed)
+    words = []
+    for rank in range(1, n + 1):
+        word = "".join(rnd.choice(LETTERS) for _ in range(rnd.randint(3, 10))) + str(rank)
+        words.append({
+            "word": word,
+            "definition": f"a synthetic definition of {word} " + "x" * rnd.randint(20, 80),
+            "pos": rnd.choice(vocab.KNOWN_POS),
+            "phonetic": f"/{word}/",
+            "pronunciations": [f"/{word}/"],
+            "examples": [f"An example sentence using {word} number {k}." for k in range(rnd.randint(0, 3))],
+            "metadata": json.dumps({"synonyms": [], "antonyms": [], "alt_definitions": [], "all_pos": []}),
+            "cefr_level": vocab.assign_cefr((rank - 1) / n),
+            "difficulty": round((rank - 1) / n, 6),
+            "frequency_rank": rank,
+        })
+    return words
+
+
+def add_srs_cards(path: Path, n: int, seed: int = 2):
+    rnd = random.Random(seed)
+    conn = sqlite3.connect(str(path))
+    conn.execute(SRS_CARD_SQL)
+    studied = rnd.sample(range(1, n + 1), int(n * STUDIED_SHARE))
+    conn.executemany("INSERT INTO srs_card (word_id, next_review) VALUES (?, ?)",
+                     [(w, rnd.randint(0, 10**6)) for w in studied])
+    conn.commit()
+    conn.close()
+
+
+def app_queries(words: List[dict], rnd: random.Random) -> List[Tuple[str, str, Callable[[], tuple]]]:
+    """(name, sql, params factory) for each app query."""
+    n = len(words)
+
+    def some_ids():
+        return tuple(rnd.randint(1, n) for _ in range(20))
+
+    ids_sql = f"SELECT {WORD_COLUMNS} FROM word WHERE id IN ({', '.join('?' * 20)})"
+    return [
+        ("by_id", f"SELECT {WORD_COLUMNS} FROM word WHERE id = ?",
+         lambda: (rnd.randint(1, n),)),
+        ("by_level", f"SELECT {WORD_COLUMNS} FROM word WHERE cefr_level = ? ORDER BY frequency_rank LIMIT ?",
+         lambda: (rnd.choice(vocab.CEFR_LEVELS), 20)),
+        ("by_ids", ids_sql, some_ids),
+        ("search_prefix", f"SELECT {WORD_COLUMNS} FROM word WHERE word LIKE ? ORDER BY frequency_rank LIMIT ?",
+         lambda: (rnd.choice(words)["word"][:3].upper() + "%", 20)),
+        ("by_text", f"SELECT {WORD_COLUMNS} FROM word WHERE word = ? COLLATE NOCASE LIMIT 1",
+         lambda: (rnd.choice(words)["word"].capitalize(),)),
+        ("random_by_level", f"SELECT {WORD_COLUMNS} FROM word WHERE cefr_level = ? ORDER BY RANDOM() LIMIT ?",
+         lambda: (rnd.choice(vocab.CEFR_LEVELS), 10)),
+        ("count_level", "SELECT COUNT(*) FROM word WHERE cefr_level = ?",
+         lambda: (rnd.choice(vocab.CEFR_LEVELS),)),
+        ("new_cards", "SELECT id FROM word WHERE id NOT IN (SELECT word_id FROM srs_card) "
+                      "ORDER BY frequency_rank LIMIT ?",
+         lambda: (20,)),
+        ("new_by_difficulty", "SELECT id FROM word WHERE id NOT IN (SELECT word_id FROM srs_card) "
+                              "ORDER BY difficulty LIMIT ?",
+         lambda: (20,)),
+    ]
+
+
+def time_queries(path: Path, queries, iterations: int) -> dict:
+    """Median/p95 latency in microseconds per query (fresh connection, warmed up)."""
+    conn = sqlite3.connect(str(path))
+    results = {}
+    for name, sql, params in queries:
+        for _ in range(3):
+            conn.execute(sql, params()).fetchall()
+        samples = []
+        for _ in range(iterations):
+            p = params()
+            start = time.perf_counter()
+            conn.execute(sql, p).fetchall()
+            samples.append((time.perf_counter() - start) * 1e6)
+        samples.sort()
+        results[name] = {
+            "median_us": round(statistics.median(samples), 1),
+            "p95_us": round(samples[int(len(samples) * 0.95) - 1], 1),
+        }
+    conn.close()
+    return results
+
+
+def print_plans(path: Path, queries):
+    conn = sqlite3.connect(str(path))
+    for name, sql, params in queries:
+        plan = " | ".join(r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params()))
+        print(f"  {name:<16} {plan}")
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="App query latency benchmark")
+    parser.add_argument("--counts", default="10000,100000", help="Deck sizes to build")
+    parser.add_argument("--iterations", type=int, default=300, help="Runs per query")
+    parser.add_argument("--plans", action="store_true", help="Print query plans for both layouts")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    vocab.log.setLevel("WARNING")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in [int(c) for c in args.counts.split(",")]:
+            words = synthetic_words(count)
+            before = Path(tmp) / f"before_{count}.db"
+            after = Path(tmp) / f"after_{count}.db"
+
+            vocab.create_database(before, words)
+            shutil.copy(before, after)
+
+            conn = sqlite3.connect(str(before))
+            conn.executescript(LEGACY_INDEX_SQL)
+            conn.execute("PRAGMA optimize")
+            conn.close()
+            vocab.finalize_database(after)
+
+            for path in (before, after):
+                add_srs_cards(path, count)
+
+            timings = {}
+            for label, path in (("before", before), ("after", after)):
+                timings[label] = time_queries(path, app_queries(words, random.Random(3)), args.iterations)
+                if args.plans:
+                    print(f"\n{label} ({count} words):")
+                    print_plans(path, app_queries(words, random.Random(3)))
+
+            print(f"\n{count:,} words: before {before.stat().st_size / 1024 / 1024:.2f} MB, "
+                  f"after {after.stat().st_size / 1024 / 1024:.2f} MB")
+            print(f"  {'Query':<16} {'Before med':>11} {'After med':>10} {'Before p95':>11} "
+                  f"{'After p95':>10} {'Speedup':>8}")
+            for name, b in timings["before"].items():
+                a = timings["after"][name]
+                speedup = b["median_us"] / a["median_us"] if a["median_us"] else 0
+                print(f"  {name:<16} {b['median_us']:>9.1f}us {a['median_us']:>8.1f}us "
+                      f"{b['p95_us']:>9.1f}us {a['p95_us']:>8.1f}us {speedup:>7.1f}x")
+            results.append({
+                "words": count,
+                "size_bytes": {"before": before.stat().st_size, "after": after.stat().st_size},
+                "timings": timings,
+            })
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
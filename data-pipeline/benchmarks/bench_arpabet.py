@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+ARPAbet -> IPA transcoder microbenchmark.
+
+Compares the original per-phone implementation (reproduced below as
+legacy_arpabet_to_ipa) with the table-driven, memoized arpabet_to_ipa() and the
+bulk build_ipa_table(), checking both produce identical IPA for every
+pronunciation. Uses the full CMU dictionary when NLTK data is installed,
+otherwise a synthetic dictionary of the same size.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_arpabet.py
+    python benchmarks/bench_arpabet.py --synthetic
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_vocab_db as vocab  # noqa: E402
+
+SYNTHETIC_ENTRIES = 123_000
+
+
+def legacy_arpabet_to_ipa(phones: List[str]) -> str:
+    """The transcoder as it was before the lookup table (reference implementation)."""
+    ipa_parts: List[str] = []
+    for phone in phones:
+        base = phone.rstrip("012")
+        stress = phone[-1] if phone[-1] in "012" else None
+        ipa_char = vocab.ARPABET_TO_IPA.get(base, base.lower())
+        if stress == "1":
+            ipa_parts.append("ˈ" + ipa_char)
+        elif stress == "2":
+            ipa_parts.append("ˌ" + ipa_char)
+        else:
+            if base == "AH" and stress == "0":
+                ipa_parts.append("ə")
+            else:
+                ipa_parts.append(ipa_char)
+    return "/" + "".join(ipa_parts) + "/"
+
+
+def synthetic_cmu(n: int, seed: int = 7) -> Dict[str, list]:
+    rnd = random.Random(seed)
+    vowels = [p for p in vocab.ARPABET_TO_IPA if p[0] in "AEIOU"]
+    consonants = [p for p in vocab.ARPABET_TO_IPA if p[0] not in "AEIOU"]
+    entries: Dict[str, list] = {}
+    for i in range(n):
+        variants = []
+        for _ in range(1 if rnd.random() < 0.9 else 2):
+            phones = []
+            for _ in range(rnd.randint(1, 4)):
+                phones.append(rnd.choice(consonants))
+                phones.append(rnd.choice(vowels) + rnd.choice("012"))
+            variants.append(phones)
+        entries[f"w{i}"] = variants
+    return entries
+
+
+def load_cmu(synthetic: bool) -> Dict[str, list]:
+    if not synthetic:
+        try:
+            return vocab.load_cmu_dict()
+        except (ImportError, LookupError) as e:
+            print(f"CMU dictionary unavailable ({type(e).__name__}), using synthetic data")
+    return synthetic_cmu(SYNTHETIC_ENTRIES)
+
+
+def timed(fn) -> float:
+    """Time one call with the cyclic GC off (as timeit does), since the CMU dict
+    holds ~250k lists that would otherwise be rescanned by every collection."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ARPAbet -> IPA transcoder benchmark")
+    parser.add_argument("--synthetic", action="store_true", help="Use synthetic data even if NLTK is installed")
+    args = parser.parse_args()
+
+    cmu = load_cmu(args.synthetic)
+    prons = [phones for variants in cmu.values() for phones in variants]
+    print(f"{len(cmu):,} entries, {len(prons):,} pronunciations\n")
+
+    # Correctness: identical output for every pronunciation
+    mismatches = sum(
+        1 for phones in prons if legacy_arpabet_to_ipa(phones) != vocab.arpabet_to_ipa(phones)
+    )
+    if mismatches:
+        print(f"FAIL: {mismatches} pronunciations differ from the legacy transcoder")
+        sys.exit(1)
+
+    vocab._transcode.cache_clear()
+    legacy = timed(lambda: [legacy_arpabet_to_ipa(p) for p in prons])
+    vocab._transcode.cache_clear()
+    cold = timed(lambda: [vocab.arpabet_to_ipa(p) for p in prons])
+    warm = timed(lambda: [vocab.arpabet_to_ipa(p) for p in prons])
+    vocab._transcode.cache_clear()
+    bulk = timed(lambda: vocab.build_ipa_table(cmu))
+
+    print(f"{'Variant':<34} {'Total ms':>9} {'ns/pron':>8} {'Speedup':>8}")
+    for name, seconds in [
+        ("legacy per-phone", legacy),
+        ("table, cold memo", cold),
+        ("table, warm memo", warm),
+        ("build_ipa_table (all variants)", bulk),
+    ]:
+        print(f"{name:<34} {seconds * 1000:>9.1f} {seconds / len(prons) * 1e9:>8.0f} "
+              f"{legacy / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
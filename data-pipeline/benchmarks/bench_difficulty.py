@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Difficulty scoring benchmark.
+
+Times difficulty.assign_difficulty() (word features, standardization, quantile
+levels) on synthetic select_words() output, and score_example_difficulty() on a
+built DB of the same size. Words get Zipf-distributed frequencies, sense counts
+and CMU-style pronunciations, so only the timings are meaningful.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_difficulty.py
+    python benchmarks/bench_difficulty.py --counts 10000,100000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import difficulty  # noqa: E402
+import generate_vocab_db as vocab  # noqa: E402
+from bench_text_compression import gloss_words  # noqa: E402
+
+VOWEL_PHONES = ("AA1", "AE1", "AH0", "EH1", "IH0", "IY1", "OW1", "UW1", "ER0")
+CONSONANT_PHONES = ("B", "D", "K", "L", "M", "N", "P", "R", "S", "T", "Z")
+
+
+def synthetic_selected(words: List[dict], seed: int = 5) -> Tuple[List[dict], Dict[str, list]]:
+    """select_words()-shaped dicts and a CMU-style dict for `words` (in rank order)."""
+    rnd = random.Random(seed)
+    selected, cmu = [], {}
+    for rank, w in enumerate(words, 1):
+        selected.append({
+            "word": w["word"],
+            "frequency": int(10**6 / rank ** 1.1),
+            "synset_count": max(1, int(rnd.paretovariate(1.5))),
+        })
+        if rnd.random() < 0.8:
+            cmu[w["word"]] = [[rnd.choice(CONSONANT_PHONES + VOWEL_PHONES) for _ in range(rnd.randint(2, 9))]]
+    return selected, cmu
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Difficulty scoring benchmark")
+    parser.add_argument("--counts", default="10000,100000", help="Deck sizes to score")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    vocab.log.setLevel("WARNING")
+    difficulty.log.setLevel("WARNING")
+    results = []
+    print(f"{'Words':>8} {'Examples':>9} {'Words s':>8} {'Examples s':>11}  Levels")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in [int(c) for c in args.counts.split(",")]:
+            words = gloss_words(count)
+            selected, cmu = synthetic_selected(words)
+            lemmas = {w["word"] for w in words}
+
+            start = time.perf_counter()
+            scored = difficulty.assign_difficulty(selected, cmu, lemmas, vocab.CEFR_QUANTILES)
+            word_seconds = time.perf_counter() - start
+            for w, s in zip(words, scored):
+                w["difficulty"], w["cefr_level"] = s["difficulty"], s["cefr_level"]
+
+            path = Path(tmp) / f"difficulty_{count}.db"
+            conn = vocab.open_new_database(path)
+            vocab.insert_words(conn, words)
+            start = time.perf_counter()
+            examples = difficulty.score_example_difficulty(conn)
+            example_seconds = time.perf_counter() - start
+            conn.close()
+
+            levels = Counter(s["cefr_level"] for s in scored)
+            print(f"{count:>8,} {examples:>9,} {word_seconds:>8.2f} {example_seconds:>11.2f}  "
+                  + " ".join(f"{level}={levels[level]}" for level in vocab.CEFR_LEVELS))
+            results.append({
+                "words": count, "examples": examples,
+                "word_seconds": round(word_seconds, 3), "example_seconds": round(example_seconds, 3),
+                "levels": dict(levels),
+            })
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Import-time regression benchmark for the pipeline scripts.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter several
+times per module, reports the median cumulative import time and fails if it
+exceeds the budget (BUDGET_FACTOR x the recorded baseline, so machine noise
+doesn't trip it) or if a heavy dependency (NLTK, edge-tts, numpy, pandas) is
+pulled in at import time. The report/verify paths depend on this staying cheap.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --runs 20 --json import_time.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PIPELINE_DIR = Path(__file__).resolve().parent.parent
+
+# Recorded median cumulative import time in milliseconds; re-record after an
+# intentional change. generate_audio is dominated by stdlib asyncio (~60 ms),
+# which it needs anyway.
+IMPORT_BASELINE_MS = {
+    "generate_vocab_db": 55.0,
+    "generate_audio": 120.0,
+}
+BUDGET_FACTOR = 2.0
+
+# Modules that must only load in the phases that need them
+FORBIDDEN_AT_IMPORT = ("nltk", "edge_tts", "numpy", "pandas", "requests")
+
+
+def measure_import(module: str) -> Tuple[float, List[str]]:
+    """Return (cumulative import time in ms, imported top-level packages)."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PIPELINE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_us = 0
+    imported = []
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] |   cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        imported.append(name.strip())
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000.0, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for pipeline modules")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per module (median is reported)")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results: Dict[str, dict] = {}
+    all_pass = True
+    print(f"{'Module':<22} {'Median ms':>10} {'Baseline':>10} {'Budget ms':>10}  Status")
+    for module, baseline in IMPORT_BASELINE_MS.items():
+        budget = baseline * BUDGET_FACTOR
+        timings = []
+        heavy: List[str] = []
+        for _ in range(args.runs):
+            ms, imported = measure_import(module)
+            timings.append(ms)
+            heavy = sorted({
+                name for name in imported
+                if name.split(".")[0] in FORBIDDEN_AT_IMPORT
+            })
+        median = statistics.median(timings)
+        passed = median <= budget and not heavy
+        all_pass = all_pass and passed
+        results[module] = {
+            "median_ms": round(median, 2),
+            "min_ms": round(min(timings), 2),
+            "baseline_ms": baseline,
+            "budget_ms": budget,
+            "heavy_imports": heavy,
+            "pass": passed,
+        }
+        status = "PASS" if passed else "FAIL"
+        print(f"{module:<22} {median:>10.2f} {baseline:>10.1f} {budget:>10.1f}  {status}")
+        if heavy:
+            print(f"  heavy imports at module load: {', '.join(heavy)}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    sys.exit(0 if all_pass else 1)
+
+
+if __name__ == "__main__":
+    main()
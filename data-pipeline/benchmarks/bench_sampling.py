@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Random word sampling benchmark.
+
+Compares the app's current random-word query (ORDER BY RANDOM() LIMIT k,
+optionally filtered by cefr_level) with sampling through the precomputed
+sample_ordinal / word_bucket structure: read the level's ordinal range from
+word_bucket, draw k distinct ordinals, fetch them with one indexed IN (...)
+lookup. Both run against finalized synthetic databases.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_sampling.py
+    python benchmarks/bench_sampling.py --counts 10000,100000 --k 10
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_vocab_db as vocab  # noqa: E402
+from bench_app_queries import WORD_COLUMNS, synthetic_words  # noqa: E402
+
+
+def order_by_random(conn: sqlite3.Connection, k: int, level: Optional[str], rnd: random.Random) -> list:
+    if level is None:
+        return conn.execute(f"SELECT {WORD_COLUMNS} FROM word ORDER BY RANDOM() LIMIT ?", (k,)).fetchall()
+    return conn.execute(
+        f"SELECT {WORD_COLUMNS} FROM word WHERE cefr_level = ? ORDER BY RANDOM() LIMIT ?", (level, k),
+    ).fetchall()
+
+
+def bucket_sample(conn: sqlite3.Connection, k: int, level: Optional[str], rnd: random.Random) -> list:
+    if level is None:
+        first, count = conn.execute("SELECT 0, COALESCE(SUM(word_count), 0) FROM word_bucket").fetchone()
+    else:
+        first, count = conn.execute(
+            "SELECT MIN(first_ordinal), COALESCE(SUM(word_count), 0) FROM word_bucket WHERE cefr_level = ?",
+            (level,),
+        ).fetchone()
+    ordinals = rnd.sample(range(first, first + count), min(k, count))
+    return conn.execute(
+        f"SELECT {WORD_COLUMNS} FROM word WHERE sample_ordinal IN ({', '.join('?' * len(ordinals))})",
+        ordinals,
+    ).fetchall()
+
+
+def time_sampler(
+    path: Path, sampler: Callable, k: int, level: Optional[str], iterations: int,
+) -> dict:
+    conn = sqlite3.connect(str(path))
+    rnd = random.Random(5)
+    for _ in range(3):
+        sampler(conn, k, level, rnd)
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        rows = sampler(conn, k, level, rnd)
+        samples.append((time.perf_counter() - start) * 1e6)
+        assert len(rows) == k
+    conn.close()
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 1),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Random word sampling benchmark")
+    parser.add_argument("--counts", default="10000,100000", help="Deck sizes to build")
+    parser.add_argument("--k", type=int, default=10, help="Words per sample")
+    parser.add_argument("--iterations", type=int, default=300, help="Samples per measurement")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    vocab.log.setLevel("WARNING")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in [int(c) for c in args.counts.split(",")]:
+            path = Path(tmp) / f"sample_{count}.db"
+            vocab.create_database(path, synthetic_words(count))
+            vocab.finalize_database(path)
+
+            print(f"\n{count:,} words, k={args.k}:")
+            print(f"  {'Filter':<8} {'RANDOM() med':>13} {'Bucket med':>11} "
+                  f"{'RANDOM() p95':>13} {'Bucket p95':>11} {'Speedup':>8}")
+            for level in (None, "A1", "B2"):
+                slow = time_sampler(path, order_by_random, args.k, level, args.iterations)
+                fast = time_sampler(path, bucket_sample, args.k, level, args.iterations)
+                speedup = slow["median_us"] / fast["median_us"] if fast["median_us"] else 0
+                print(f"  {level or 'all':<8} {slow['median_us']:>11.1f}us {fast['median_us']:>9.1f}us "
+                      f"{slow['p95_us']:>11.1f}us {fast['p95_us']:>9.1f}us {speedup:>7.1f}x")
+                results.append({
+                    "words": count, "level": level, "k": args.k,
+                    "order_by_random": slow, "bucket": fast,
+                })
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
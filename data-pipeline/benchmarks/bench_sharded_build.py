@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Sharded build scaling benchmark.
+
+Loads the NLTK sources once, selects the largest requested deck, then times the
+single-process build (enrich_words + create_database) against
+build_sharded_database() at increasing process counts for each deck size.
+Reports wall time, speedup over one process and parallel efficiency.
+
+Requires the NLTK corpora (wordnet, brown, cmudict). Note that WordNet yields
+roughly 70k single-word base-form candidates, so larger requests are capped at
+what select_words() can return.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_sharded_build.py
+    python benchmarks/bench_sharded_build.py --counts 10000,50000,100000 --jobs 1,2,4,8
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_vocab_db as vocab  # noqa: E402
+from difficulty import assign_difficulty, attested_lemmas  # noqa: E402
+
+SHARDS_PER_JOB = 4  # more shards than processes evens out slow rank ranges
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_jobs = ",".join(str(j) for j in (1, 2, 4, 8, 16, 32) if j <= cores)
+    parser = argparse.ArgumentParser(description="Sharded build scaling benchmark")
+    parser.add_argument("--counts", default="10000,50000,100000", help="Deck sizes to build")
+    parser.add_argument("--jobs", default=default_jobs, help="Process counts to compare")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    counts = [int(c) for c in args.counts.split(",")]
+    jobs_list = [int(j) for j in args.jobs.split(",")]
+
+    brown_freq, brown_pos = vocab.compute_brown_frequencies()
+    cmu = vocab.load_cmu_dict()
+    ipa_table = vocab.build_ipa_table(cmu)
+    wn_words = vocab.get_wordnet_words()
+    lemmas = attested_lemmas(wn_words, set(brown_freq) | set(cmu))
+    selected_all = vocab.select_words(wn_words, brown_freq, cmu, max(counts))
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "bench.db"
+        for count in counts:
+            selected = assign_difficulty(selected_all[:count], cmu, lemmas, vocab.CEFR_QUANTILES)
+            if len(selected) < count:
+                print(f"Note: only {len(selected)} words available for --count {count}")
+
+            start = time.perf_counter()
+            vocab.create_database(out, vocab.enrich_words(selected, cmu, brown_pos, ipa_table))
+            single = time.perf_counter() - start
+            results.append({"words": len(selected), "jobs": 0, "seconds": round(single, 2)})
+
+            for jobs in jobs_list:
+                start = time.perf_counter()
+                vocab.build_sharded_database(
+                    out, selected, brown_pos, ipa_table, shards=jobs * SHARDS_PER_JOB, jobs=jobs,
+                )
+                seconds = time.perf_counter() - start
+                results.append({"words": len(selected), "jobs": jobs, "seconds": round(seconds, 2)})
+
+    print(f"\n{'Words':>8} {'Procs':>6} {'Seconds':>9} {'Speedup':>8} {'Efficiency':>11}")
+    for count in sorted({r["words"] for r in results}):
+        rows = [r for r in results if r["words"] == count]
+        base = next(r["seconds"] for r in rows if r["jobs"] == 0)
+        for r in rows:
+            label = "single" if r["jobs"] == 0 else str(r["jobs"])
+            speedup = base / r["seconds"] if r["seconds"] else 0
+            efficiency = f"{speedup / r['jobs'] * 100:.0f}%" if r["jobs"] else "-"
+            print(f"{count:>8} {label:>6} {r['seconds']:>9.2f} {speedup:>7.2f}x {efficiency:>11}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Compressed text column benchmark.
+
+Builds the same synthetic deck plain and with each available --compress codec
+(zlib always; zstd if zstandard is installed), finalizes each, and reports the
+DB file size, the text compression ratio (dictionary included), per-row decode
+latency, and the latency of the app's by-id word + examples read with decoding.
+A "zlib, no dictionary" row shows what per-row compression gets without the
+shared dictionary.
+
+Definitions, examples and metadata are generated from WordNet-style gloss and
+example templates over a Zipf-weighted vocabulary, so the ratios are indicative
+only; run verify on a real build for the real numbers.
+
+Usage:
+    cd data-pipeline
+    python benchmarks/bench_text_compression.py
+    python benchmarks/bench_text_compression.py --counts 10000,100000
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import generate_vocab_db as vocab  # noqa: E402
+import text_codec  # noqa: E402
+from bench_app_queries import synthetic_words  # noqa: E402
+
+NOUNS = (
+    "person thing act state quality part group place time animal plant water body hand food money "
+    "work line side kind head house form power country family system question fact force change "
+    "light sound structure process condition substance surface device organism container movement "
+    "instrument material vessel tissue region area piece unit member rank disease feeling cloth"
+).split()
+VERBS = (
+    "make move cause give take put become change cover cut hold turn pass form keep bring carry "
+    "remove produce reduce increase express support contain separate attach raise strike"
+).split()
+ADJECTIVES = (
+    "small large long short high low good bad hard soft strong weak full empty open close new old "
+    "young white black red usually often especially very slightly formally informally physical "
+    "mental natural social public private"
+).split()
+GLOSSES = (
+    "a {a} {n} that {v}s a {n}",
+    "the act of {v}ing a {n}",
+    "(of a {n}) {a} or {a}",
+    "a person who {v}s {n}s",
+    "any of various {a} {n}s of the {n} family",
+    "having or showing {n}",
+    "capable of being {v}ed",
+    "of or relating to the {n} of a {n}",
+    "make {a} or more {a}",
+    "a {n} used to {v} {n}s; usually {a}",
+    "the {n} or {n} of being {a}",
+    "{v} by means of a {n}",
+)
+EXAMPLES = (
+    "{p} {v}ed the {a} {n} in the {n}",
+    "the {n} was too {a} to {v}",
+    "{p} will {v} the {n} tomorrow",
+    "they {v} a {n} every {n}",
+    "a {a} {n} of {n}",
+    "{p} {v}s {n}s for a living",
+)
+PRONOUNS = ("he", "she", "they", "we", "I", "you")
+
+
+def _zipf_pick(rnd: random.Random, items: List[str]) -> str:
+    return items[min(int(rnd.paretovariate(1.1)) - 1, len(items) - 1)]
+
+
+def _fill(rnd: random.Random, template: str) -> str:
+    out = template
+    for key, items in (("{n}", NOUNS), ("{v}", VERBS), ("{a}", ADJECTIVES), ("{p}", PRONOUNS)):
+        while key in out:
+            out = out.replace(key, _zipf_pick(rnd, items), 1)
+    return out
+
+
+def gloss_words(n: int, seed: int = 4) -> List[dict]:
+    """synthetic_words() with WordNet-style definitions, examples and metadata."""
+    rnd = random.Random(seed)
+    words = synthetic_words(n)
+    for w in words:
+        w["definition"] = _fill(rnd, rnd.choice(GLOSSES))
+        w["examples"] = [_fill(rnd, rnd.choice(EXAMPLES)) for _ in range(rnd.choice((0, 1, 1, 2, 3)))]
+        w["metadata"] = json.dumps({
+            "synonyms": [_zipf_pick(rnd, NOUNS) for _ in range(rnd.randint(0, 4))],
+            "antonyms": [_zipf_pick(rnd, NOUNS) for _ in range(rnd.randint(0, 1))],
+            "alt_definitions": [
+                {"pos": rnd.choice(vocab.KNOWN_POS), "definition": _fill(rnd, rnd.choice(GLOSSES))}
+                for _ in range(rnd.randint(0, 3))
+            ],
+            "all_pos": sorted({w["pos"], rnd.choice(vocab.KNOWN_POS)}),
+        }, ensure_ascii=False)
+    return words
+
+
+def no_dictionary_bytes(path: Path) -> int:
+    """Stored text bytes if each value were raw-deflated on its own (kept plain if not smaller)."""
+    conn = sqlite3.connect(str(path))
+    total = 0
+    for table, column in text_codec.COMPRESSED_COLUMNS:
+        for (value,) in conn.execute(f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL"):
+            raw = value.encode("utf-8")
+            c = zlib.compressobj(text_codec.ZLIB_LEVEL, zlib.DEFLATED, -15)
+            total += min(len(c.compress(raw) + c.flush()), len(raw))
+    conn.close()
+    return total
+
+
+def time_word_reads(path: Path, n: int, iterations: int) -> dict:
+    """Median/p95 (us) of the app's word-by-id + examples read, decoding if needed."""
+    conn = sqlite3.connect(str(path))
+    codec = text_codec.TextCodec.from_connection(conn)
+    decode = codec.decode if codec else (lambda v: v)
+    rnd = random.Random(7)
+    samples = []
+    for i in range(iterations + 20):
+        word_id = rnd.randint(1, n)
+        start = time.perf_counter()
+        row = conn.execute("SELECT word, definition, metadata FROM word WHERE id = ?", (word_id,)).fetchone()
+        definition, metadata = decode(row[1]), decode(row[2])
+        examples = [decode(s) for (s,) in conn.execute(
+            "SELECT sentence FROM word_example WHERE word_id = ?", (word_id,),
+        )]
+        elapsed = (time.perf_counter() - start) * 1e6
+        if i >= 20:
+            samples.append(elapsed)
+        assert definition and metadata is not None and examples is not None
+    conn.close()
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 1),
+        "p95_us": round(samples[int(len(samples) * 0.95) - 1], 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed text column benchmark")
+    parser.add_argument("--counts", default="10000,100000", help="Deck sizes to build")
+    parser.add_argument("--iterations", type=int, default=2000, help="Word reads per measurement")
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    vocab.log.setLevel("WARNING")
+    codecs = ["zlib"]
+    try:
+        text_codec.require_codec("zstd")
+        codecs.append("zstd")
+    except RuntimeError:
+        print("zstandard not installed; benchmarking zlib only")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in [int(c) for c in args.counts.split(",")]:
+            words = gloss_words(count)
+            print(f"\n{count:,} words:")
+            print(f"  {'Mode':<16} {'DB MB':>7} {'Text MB':>8} {'Ratio':>6} {'Decode p50':>11} "
+                  f"{'Decode p95':>11} {'Read p50':>9} {'Build s':>8}")
+            for mode in [""] + codecs:
+                path = Path(tmp) / f"text_{mode or 'plain'}_{count}.db"
+                start = time.perf_counter()
+                vocab.create_database(path, [dict(w) for w in words], compress=mode)
+                vocab.finalize_database(path)
+                build_seconds = time.perf_counter() - start
+                stats = vocab.verify_database(path, full=True)  # decode every value
+                reads = time_word_reads(path, count, args.iterations)
+                row = {
+                    "words": count, "mode": mode or "plain",
+                    "db_bytes": path.stat().st_size,
+                    "build_seconds": round(build_seconds, 2),
+                    "word_read": reads,
+                }
+                if mode:
+                    row.update({
+                        "text_raw_bytes": stats["text_raw_bytes"],
+                        "text_stored_bytes": stats["text_stored_bytes"],
+                        "ratio": stats["text_compression_ratio"],
+                        "decode_us_median": stats["text_decode_us_median"],
+                        "decode_us_p95": stats["text_decode_us_p95"],
+                    })
+                    print(f"  {mode:<16} {row['db_bytes'] / 2**20:>7.2f} "
+                          f"{row['text_stored_bytes'] / 2**20:>8.2f} {row['ratio']:>5.2f}x "
+                          f"{row['decode_us_median']:>9.2f}us {row['decode_us_p95']:>9.2f}us "
+                          f"{reads['median_us']:>7.1f}us {build_seconds:>8.1f}")
+                else:
+                    raw = no_dictionary_bytes(path)
+                    plain_text = sum(
+                        len(w["definition"].encode()) + len(w["metadata"].encode())
+                        + sum(len(e.encode()) for e in w["examples"]) for w in words
+                    )
+                    row["text_raw_bytes"] = plain_text
+                    row["no_dictionary_bytes"] = raw
+                    print(f"  {'plain':<16} {row['db_bytes'] / 2**20:>7.2f} {plain_text / 2**20:>8.2f} "
+                          f"{'1.00x':>6} {'-':>11} {'-':>11} {reads['median_us']:>7.1f}us {build_seconds:>8.1f}")
+                    print(f"  {'zlib, no dict':<16} {'-':>7} {raw / 2**20:>8.2f} "
+                          f"{plain_text / raw:>5.2f}x")
+                results.append(row)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Difficulty Model
+
+Scores every selected word (and every example sentence) for difficulty in one
+batch, and assigns CEFR levels by difficulty quantile instead of frequency rank.
+
+Word features (higher = harder):
+  - rarity:     -log(frequency + 1), the count select_words() ranked by (Brown,
+                or the --freq-source blend)
+  - polysemy:   -log(WordNet sense count); many senses = core vocabulary
+  - syllables:  vowel phones in the primary CMU pronunciation (spelling
+                vowel groups if the word has none)
+  - morphology: derivational prefixes/suffixes peeled off the word, counted only
+                when what is left is an attested WordNet lemma (so "order",
+                "regal" and "interest" have none, "teacher" and "unhappiness" do)
+  - length:     letters
+
+Each feature is standardized over the deck and combined with WORD_WEIGHTS; the
+weighted score is turned into a percentile (0 = easiest) that is stored as
+word.difficulty, and the levels are CEFR_QUANTILES ranges of it, so the app's
+SRS can take new cards in difficulty order from one index. Ties keep frequency
+rank order. Example sentences get 1-5 from their length, mean token length and
+their word's difficulty (score_example_difficulty(), run on the built DB).
+
+Only the feature extraction loops over words; standardization, weighting and
+ranking are numpy array operations.
+
+Usage:
+    cd data-pipeline
+    python generate_vocab_db.py                     # difficulty is always scored
+    python difficulty.py --count 2000 --word run --word ubiquitous
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import logging
+import math
+import re
+import sqlite3
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+# numpy is imported where used, so importing this module stays cheap.
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+WORD_WEIGHTS = {
+    "rarity": 0.45,
+    "polysemy": 0.20,
+    "syllables": 0.15,
+    "morphology": 0.10,
+    "length": 0.10,
+}
+EXAMPLE_WEIGHTS = {
+    "word": 0.50,
+    "tokens": 0.35,
+    "token_length": 0.15,
+}
+EXAMPLE_LEVELS = 5
+DIFFICULTY_DIGITS = 6
+
+PREFIXES = (
+    "counter", "inter", "super", "trans", "under", "over", "anti", "fore", "semi",
+    "dis", "mis", "non", "pre", "sub", "un", "re", "in", "im", "ir", "il", "de",
+)
+SUFFIXES = (
+    "ization", "ation", "ition", "ness", "ment", "ship", "hood", "ible", "able", "less",
+    "ful", "ous", "ive", "ism", "ist", "ity", "ize", "ise", "ence", "ance", "ical",
+    "ic", "al", "ly", "er", "or",
+)
+MIN_STEM = 3
+MIN_PREFIX_STEM = 4  # inter+est, re+gal: short remainders are mostly coincidences
+MAX_SUFFIXES = 2
+
+VOWEL_GROUP = re.compile(r"[aeiouy]+")
+TOKEN = re.compile(r"[A-Za-z']+")
+
+log = logging.getLogger("vocabquest-difficulty")
+
+
+# ---------------------------------------------------------------------------
+# Features
+# ---------------------------------------------------------------------------
+
+def syllable_count(word: str, pronunciations: List[List[str]]) -> int:
+    """Vowel phones (ARPAbet phones carrying a stress digit) of the first CMU pronunciation."""
+    if pronunciations:
+        return sum(1 for phone in pronunciations[0] if phone[-1].isdigit()) or 1
+    groups = VOWEL_GROUP.findall(word)
+    silent_e = len(groups) > 1 and word.endswith("e") and not word.endswith(("le", "ee"))
+    return max(len(groups) - silent_e, 1)
+
+
+def attested_lemmas(wn_words: Dict[str, dict], attested: Set[str]) -> Set[str]:
+    """WordNet lemmas that also occur in Brown or CMUdict: the stems affix_count() accepts."""
+    return set(wn_words) & attested
+
+
+def lemma_stem(stem: str, lemmas: Set[str], min_length: int = MIN_STEM) -> Optional[str]:
+    """`stem` as a lemma, undoing the e-drop and y->i of suffixation (happi -> happy), or None."""
+    if len(stem) < min_length:
+        return None
+    candidates = [stem, stem + "e"]
+    if stem.endswith("i"):
+        candidates.append(stem[:-1] + "y")
+    return next((c for c in candidates if c in lemmas), None)
+
+
+def affix_count(word: str, lemmas: Set[str]) -> int:
+    """Derivational affixes that can be peeled off while leaving an attested lemma."""
+    count = 0
+    stem = word
+    for _ in range(MAX_SUFFIXES):
+        peeled = None
+        for suffix in SUFFIXES:
+            if stem.endswith(suffix):
+                peeled = lemma_stem(stem[:-len(suffix)], lemmas)
+                if peeled is not None:
+                    break
+        if peeled is None:
+            break
+        stem = peeled
+        count += 1
+    if any(stem.startswith(p) and lemma_stem(stem[len(p):], lemmas, MIN_PREFIX_STEM) for p in PREFIXES):
+        count += 1
+    return count
+
+
+def word_features(selected: List[dict], cmu_dict: Dict[str, list], lemmas: Set[str]):
+    """(n, len(WORD_WEIGHTS)) feature matrix for select_words() output, columns in WORD_WEIGHTS order."""
+    import numpy as np
+
+    columns = {
+        "rarity": [-math.log(item.get("frequency", 0) + 1) for item in selected],
+        "polysemy": [-math.log(max(item.get("synset_count", 1), 1)) for item in selected],
+        "syllables": [syllable_count(item["word"], cmu_dict.get(item["word"], [])) for item in selected],
+        "morphology": [affix_count(item["word"], lemmas) for item in selected],
+        "length": [len(item["word"]) for item in selected],
+    }
+    return np.column_stack([np.asarray(columns[name], dtype=np.float64) for name in WORD_WEIGHTS])
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+def weighted_score(features, weights: Dict[str, float]):
+    """Weighted sum of standardized feature columns (constant columns contribute 0)."""
+    import numpy as np
+
+    std = features.std(axis=0)
+    z = (features - features.mean(axis=0)) / np.where(std > 0, std, 1.0)
+    return z @ np.asarray(list(weights.values()), dtype=np.float64)
+
+
+def percentiles(scores):
+    """Rank-based percentile in [0, 1) per score, 0 = lowest; ties keep input order.
+
+    Scores are rounded before ranking so the order doesn't hinge on the last
+    bits of floating point sums.
+    """
+    import numpy as np
+
+    order = np.argsort(np.round(scores, 9), kind="stable")
+    ranks = np.empty(len(scores), dtype=np.float64)
+    ranks[order] = np.arange(len(scores))
+    return np.round(ranks / max(len(scores), 1), DIFFICULTY_DIGITS)
+
+
+def level_indices(difficulty, cutoffs: List[float]):
+    """Index of the quantile range each difficulty falls in (same rule as assign_cefr())."""
+    import numpy as np
+
+    return np.searchsorted(np.asarray(cutoffs), difficulty, side="right")
+
+
+def assign_difficulty(
+    selected: List[dict],
+    cmu_dict: Dict[str, list],
+    lemmas: Set[str],
+    quantiles: List[Tuple[float, str]],
+) -> List[dict]:
+    """Copies of `selected` (rank order) with "difficulty" and quantile "cefr_level" added.
+
+    `lemmas` is attested_lemmas() output, the stems the morphology feature accepts.
+    """
+    start_time = time.time()
+    difficulty = percentiles(weighted_score(word_features(selected, cmu_dict, lemmas), WORD_WEIGHTS))
+    levels = [level for _, level in quantiles]
+    indices = level_indices(difficulty, [bound for bound, _ in quantiles[:-1]])
+
+    scored = [
+        {**item, "difficulty": float(d), "cefr_level": levels[i]}
+        for item, d, i in zip(selected, difficulty.tolist(), indices.tolist())
+    ]
+    log.info(f"Scored difficulty for {len(scored)} words in {time.time() - start_time:.2f}s")
+    return scored
+
+
+def score_example_difficulty(conn: sqlite3.Connection) -> int:
+    """Set word_example.difficulty (1-5) from sentence features and the word's difficulty.
+
+    Needs plain-text sentences, so it runs before text compression. Returns the
+    number of examples scored.
+    """
+    import numpy as np
+
+    rows = conn.execute(
+        """SELECT e.id, e.sentence, COALESCE(w.difficulty, 0.5)
+           FROM word_example e JOIN word w ON w.id = e.word_id ORDER BY e.id"""
+    ).fetchall()
+    if not rows:
+        return 0
+
+    tokens = [TOKEN.findall(sentence) for _, sentence, _ in rows]
+    features = np.column_stack([
+        np.asarray([r[2] for r in rows], dtype=np.float64),
+        np.asarray([len(t) for t in tokens], dtype=np.float64),
+        np.asarray([sum(map(len, t)) / len(t) if t else 0.0 for t in tokens], dtype=np.float64),
+    ])
+    levels = np.minimum(
+        (percentiles(weighted_score(features, EXAMPLE_WEIGHTS)) * EXAMPLE_LEVELS).astype(np.int64) + 1,
+        EXAMPLE_LEVELS,
+    )
+    conn.executemany(
+        "UPDATE word_example SET difficulty = ? WHERE id = ?",
+        zip(levels.tolist(), (r[0] for r in rows)),
+    )
+    conn.commit()
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Preview word difficulty for the selected vocabulary")
+    parser.add_argument("--count", "-n", type=int, default=2000, help="Number of words to select")
+    parser.add_argument("--word", action="append", default=[], help="Print the features and level of this word")
+    args = parser.parse_args()
+
+    import generate_vocab_db as vocab
+
+    brown_freq, _ = vocab.compute_brown_frequencies()
+    cmu_dict = vocab.load_cmu_dict()
+    wn_words = vocab.get_wordnet_words()
+    lemmas = attested_lemmas(wn_words, set(brown_freq) | set(cmu_dict))
+    selected = vocab.select_words(wn_words, brown_freq, cmu_dict, args.count)
+    scored = assign_difficulty(selected, cmu_dict, lemmas, vocab.CEFR_QUANTILES)
+
+    by_word = {item["word"]: (rank, item) for rank, item in enumerate(scored, 1)}
+    for word in args.word or [item["word"] for item in scored[:10]]:
+        if word.lower() not in by_word:
+            print(f"{word}: not selected")
+            continue
+        rank, item = by_word[word.lower()]
+        print(f"{item['word']:<20} {item['cefr_level']} difficulty {item['difficulty']:.3f} "
+              f"(rank {rank}, freq {item['frequency']}, senses {item['synset_count']}, "
+              f"syllables {syllable_count(item['word'], cmu_dict.get(item['word'], []))}, "
+              f"affixes {affix_count(item['word'], lemmas)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Database Export / Import
+
+Streams the vocabulary DB out as JSONL or Parquet for analytics and non-SQLite
+clients, and loads such an export back into a DB without re-running enrichment.
+
+Relations (one directory each):
+  - word:          every word column except the raw metadata JSON
+  - word_metadata: metadata parsed into fields (word_id, synonyms, antonyms, ...)
+  - word_example, word_pronunciation, word_related, ...: every other data table
+
+Derived tables (word_bucket, build_manifest, text_dictionary, sqlite_stat1) are
+not exported; import rebuilds them. Compressed text (--compress) is exported
+decoded, and import compresses it again with the source build's codec.
+
+Rows are streamed with fetchmany() into part files of at most `chunk_rows` rows,
+so memory stays bounded. Relations (and CEFR partitions) are written by parallel
+worker processes. With --partition-by-level, word-keyed relations are split into
+level=A1 ... level=C2 directories.
+
+A manifest.json records the layout, columns, row counts and the source DB's
+build manifest. Import checks the rebuilt DB's content hash against it.
+
+Usage:
+    cd data-pipeline
+    python export_db.py export --out exports/vocab
+    python export_db.py export --out exports/vocab --format parquet --partition-by-level
+    python export_db.py import --src exports/vocab --db /tmp/vocabquest.db
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import generate_vocab_db as vocab
+from text_codec import TextCodec, compress_text_columns
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+FORMATS = ("jsonl", "parquet")
+EXPORT_FORMAT = 1
+DEFAULT_CHUNK_ROWS = 50_000
+MANIFEST_FILE = "manifest.json"
+METADATA_RELATION = "word_metadata"
+DERIVED_TABLES = ("word_bucket", "build_manifest", "text_dictionary")
+
+log = logging.getLogger("vocabquest-export")
+
+
+# ---------------------------------------------------------------------------
+# Relations
+# ---------------------------------------------------------------------------
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _order_by(conn: sqlite3.Connection, table: str) -> str:
+    """Primary-key order (rowid for rowid tables)."""
+    pk = sorted((r[5], r[1]) for r in conn.execute(f"PRAGMA table_info({table})") if r[5])
+    without_rowid = "WITHOUT ROWID" in (conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()[0] or "").upper()
+    if without_rowid or (pk and len(pk) > 1):
+        return ", ".join(f"t.{name}" for _, name in pk)
+    return "t.rowid"
+
+
+def export_relations(conn: sqlite3.Connection) -> Dict[str, dict]:
+    """Describe each exported relation: columns, query and whether it is word-keyed."""
+    tables = [
+        r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+        if r[0] not in DERIVED_TABLES
+    ]
+    relations: Dict[str, dict] = {}
+    for table in tables:
+        columns = [c for c in _columns(conn, table) if not (table == "word" and c == "metadata")]
+        word_keyed = table == "word" or "word_id" in columns
+        join = "" if table == "word" else " JOIN word w ON w.id = t.word_id"
+        level = "t.cefr_level" if table == "word" else "w.cefr_level"
+        relations[table] = {
+            "columns": columns,
+            "sql": f"SELECT {', '.join('t.' + c for c in columns)} FROM {table} t"
+                   f"{join if word_keyed else ''}",
+            "level_column": level if word_keyed else None,
+            "order": _order_by(conn, table),
+        }
+    relations[METADATA_RELATION] = {
+        "columns": None,  # fields of the metadata JSON, known per record
+        "sql": "SELECT t.id, t.metadata FROM word t WHERE t.metadata IS NOT NULL",
+        "level_column": "t.cefr_level",
+        "order": "t.id",
+    }
+    return relations
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+def require_parquet():
+    """Check that the Parquet stack (pandas + pyarrow) is importable, else RuntimeError."""
+    try:
+        import pandas  # noqa: F401
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError(
+            "Parquet needs pandas and pyarrow: pip install pyarrow "
+            "(or pip install -r requirements-optional.txt)"
+        ) from e
+
+
+def _write_part(records: List[dict], path: Path, fmt: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "jsonl":
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+    else:
+        import pandas as pd
+
+        pd.DataFrame.from_records(records).to_parquet(path, index=False)
+
+
+def _export_task(task: dict) -> dict:
+    """Stream one relation (or one CEFR partition of it) into part files (runs in a worker)."""
+    name, relation, level = task["name"], task["relation"], task["level"]
+    out_dir = Path(task["out"]) / name
+    if level is not None:
+        out_dir = out_dir / f"level={level}"
+
+    sql, params = relation["sql"], ()
+    if level is not None:
+        sql += f" {'AND' if ' WHERE ' in sql else 'WHERE'} {relation['level_column']} = ?"
+        params = (level,)
+    sql += f" ORDER BY {relation['order']}"
+
+    conn = sqlite3.connect(f"file:{task['db']}?mode=ro", uri=True)
+    text_codec = TextCodec.from_connection(conn)
+    cursor = conn.execute(sql, params)
+    files: List[str] = []
+    rows = 0
+    while True:
+        chunk = cursor.fetchmany(task["chunk_rows"])
+        if not chunk:
+            break
+        if text_codec is not None:
+            chunk = [tuple(text_codec.decode(v) for v in row) for row in chunk]
+        if relation["columns"] is None:
+            records = [{"word_id": word_id, **json.loads(metadata)} for word_id, metadata in chunk]
+        else:
+            records = [dict(zip(relation["columns"], row)) for row in chunk]
+        path = out_dir / f"part-{len(files):05d}.{task['format']}"
+        _write_part(records, path, task["format"])
+        files.append(str(path.relative_to(task["out"])))
+        rows += len(chunk)
+    conn.close()
+    return {"name": name, "level": level, "files": files, "rows": rows}
+
+
+def export_database(
+    db_path: Path,
+    out_dir: Path,
+    fmt: str = "jsonl",
+    partition_by_level: bool = False,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    jobs: int = 0,
+) -> dict:
+    """Export the DB's relations to out_dir. Returns the export manifest."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}' (expected one of {FORMATS})")
+    if fmt == "parquet":
+        require_parquet()
+    start_time = time.time()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    relations = export_relations(conn)
+    levels = [r[0] for r in conn.execute(
+        "SELECT DISTINCT cefr_level FROM word WHERE cefr_level IS NOT NULL ORDER BY cefr_level"
+    )]
+    conn.close()
+
+    tasks = []
+    for name, relation in relations.items():
+        partitions = levels if partition_by_level and relation["level_column"] else [None]
+        for level in partitions:
+            tasks.append({
+                "name": name, "relation": relation, "level": level, "db": str(db_path),
+                "out": str(out_dir), "format": fmt, "chunk_rows": chunk_rows,
+            })
+
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    log.info(f"Exporting {len(relations)} relations from {db_path} as {fmt} "
+             f"({len(tasks)} tasks, {workers} processes)...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_export_task, tasks))
+
+    manifest = {
+        "format": EXPORT_FORMAT,
+        "data_format": fmt,
+        "partition_by_level": partition_by_level,
+        "source_sha256": vocab.file_sha256(db_path),
+        "build_manifest": vocab.read_build_manifest(db_path),
+        "relations": {},
+    }
+    for name, relation in relations.items():
+        parts = [r for r in results if r["name"] == name]
+        manifest["relations"][name] = {
+            "columns": relation["columns"],
+            "rows": sum(r["rows"] for r in parts),
+            "files": [f for r in parts for f in r["files"]],
+        }
+        log.info(f"  {name:<20} {manifest['relations'][name]['rows']:>9,} rows "
+                 f"in {len(manifest['relations'][name]['files'])} files")
+    (out_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+    log.info(f"  Exported to {out_dir} in {time.time() - start_time:.1f}s")
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# Import
+# ---------------------------------------------------------------------------
+
+def _plain(value):
+    """Convert numpy arrays/scalars from Parquet into plain Python values."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if hasattr(value, "tolist"):
+        return _plain(value.tolist())
+    return value
+
+
+def _read_part(path: str) -> List[dict]:
+    """Load one part file as a list of records (runs in a worker)."""
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    import pandas as pd
+
+    records = pd.read_parquet(path).to_dict("records")
+    return [
+        # Parquet stores missing values as NaN/None; drop them like absent JSON keys
+        {k: _plain(v) for k, v in r.items() if v is not None and not (isinstance(v, float) and v != v)}
+        for r in records
+    ]
+
+
+def _insert_records(conn: sqlite3.Connection, name: str, columns: Optional[List[str]], records: List[dict]):
+    if name == METADATA_RELATION:
+        conn.executemany(
+            "UPDATE word SET metadata = ? WHERE id = ?",
+            [(json.dumps({k: v for k, v in r.items() if k != "word_id"}, ensure_ascii=False), r["word_id"])
+             for r in records],
+        )
+        return
+    conn.executemany(
+        f"INSERT INTO {name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+        [tuple(r.get(c) for c in columns) for r in records],
+    )
+
+
+def import_database(src_dir: Path, db_path: Path, jobs: int = 0) -> bool:
+    """Rebuild a finalized DB from an export. True if its content hash matches the source."""
+    start_time = time.time()
+    manifest = json.loads((src_dir / MANIFEST_FILE).read_text())
+    relations = manifest["relations"]
+    if any(f.endswith(".parquet") for r in relations.values() for f in r["files"]):
+        require_parquet()
+    # word first (metadata updates and foreign keys refer to it)
+    order = ["word"] + sorted(n for n in relations if n not in ("word", METADATA_RELATION)) + [METADATA_RELATION]
+
+    conn = vocab.open_new_database(db_path, scratch=True)
+    workers = jobs or os.cpu_count() or 1
+    log.info(f"Importing {src_dir} into {db_path} ({workers} processes)...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for name in order:
+            relation = relations.get(name)
+            if relation is None:
+                continue
+            files = [str(src_dir / f) for f in relation["files"]]
+            # Parse a window of files in parallel, insert in order: memory stays bounded
+            for start in range(0, len(files), workers):
+                for records in pool.map(_read_part, files[start:start + workers]):
+                    _insert_records(conn, name, relation["columns"], records)
+            conn.commit()
+            log.info(f"  {name:<20} {relation['rows']:>9,} rows")
+
+    vocab.build_sample_buckets(conn)
+    build = manifest.get("build_manifest") or {}
+    codec = build.get("config", {}).get("compress")
+    if codec:
+        compress_text_columns(conn, codec)
+    conn.close()
+
+    page_size = build.get("config", {}).get("page_size", vocab.DEFAULT_PAGE_SIZE)
+    base = {k: v for k, v in build.items() if k not in ("row_counts", "content_hash")}
+    vocab.finalize_database(db_path, page_size, base or None)
+
+    expected = build.get("content_hash")
+    actual = vocab.read_build_manifest(db_path).get("content_hash")
+    log.info(f"  Imported in {time.time() - start_time:.1f}s")
+    if expected is None:
+        log.info("  Source had no build manifest; content not verified")
+        return True
+    if actual != expected:
+        log.warning(f"  Content hash {actual} does not match the source's {expected}")
+        return False
+    log.info("  Content hash matches the source DB")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Export the vocabulary DB to JSONL/Parquet, or import it back")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    exp = sub.add_parser("export", help="Export a DB to a directory")
+    exp.add_argument("--db", default=vocab.DEFAULT_OUTPUT, help="Source database")
+    exp.add_argument("--out", required=True, help="Export directory")
+    exp.add_argument("--format", default="jsonl", choices=FORMATS, help="File format")
+    exp.add_argument("--partition-by-level", action="store_true", help="One directory per CEFR level")
+    exp.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows per part file")
+    exp.add_argument("--jobs", "-j", type=int, default=0, help="Worker processes (default: all cores)")
+
+    imp = sub.add_parser("import", help="Build a DB from an export directory")
+    imp.add_argument("--src", required=True, help="Export directory")
+    imp.add_argument("--db", required=True, help="Database to create (replaced if it exists)")
+    imp.add_argument("--jobs", "-j", type=int, default=0, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    parquet = (args.format == "parquet" if args.command == "export"
+               else next(Path(args.src).rglob("*.parquet"), None) is not None)
+    if parquet:
+        try:
+            require_parquet()
+        except RuntimeError as e:
+            parser.error(str(e))
+
+    if args.command == "export":
+        export_database(Path(args.db), Path(args.out), args.format, args.partition_by_level,
+                        args.chunk_rows, args.jobs)
+    else:
+        sys.exit(0 if import_database(Path(args.src), Path(args.db), args.jobs) else 1)
+
+
+if __name__ == "__main__":
+    main()
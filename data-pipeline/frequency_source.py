@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Frequency Sources
+
+Counts word frequencies from a large local corpus so rare (C1/C2) words get a
+real frequency signal instead of Brown's zero. Two input formats are supported:
+
+  - text:   plain UTF-8 text of any size (tokenized into lowercase words)
+  - counts: pre-counted "word<whitespace>count" lines (e.g. SUBTLEX or
+            wordfreq exports); repeated words are summed
+
+The file is split into newline-aligned byte ranges that are counted in parallel
+worker processes and merged. Memory stays bounded: with a vocabulary (normally
+the WordNet candidate set) only those words are counted; without one, each
+partial count is pruned to the most common `max_terms` words.
+
+Results are cached as JSON in the cache directory, keyed by the file's
+path/size/mtime, format and vocabulary.
+
+Usage:
+    cd data-pipeline
+    python frequency_source.py corpus.txt --top 50
+    python generate_vocab_db.py --freq-source corpus.txt --freq-weight 0.7
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import FrozenSet, List, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+FORMATS = ("text", "counts")
+DEFAULT_CHUNK_MB = 64
+DEFAULT_MAX_TERMS = 500_000  # per-chunk cap when no vocabulary is given
+WORD_RE = re.compile(r"[^\W\d_]+")
+COUNT_SUFFIXES = (".tsv", ".csv", ".freq", ".counts")
+
+log = logging.getLogger("vocabquest-freq")
+
+
+# ---------------------------------------------------------------------------
+# Chunked counting
+# ---------------------------------------------------------------------------
+
+def detect_format(path: Path) -> str:
+    """Guess the format from the extension (counts files are .tsv/.csv/.freq/.counts)."""
+    return "counts" if path.suffix.lower() in COUNT_SUFFIXES else "text"
+
+
+def chunk_ranges(path: Path, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Split a file into byte ranges that start and end on line boundaries."""
+    size = path.stat().st_size
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                f.seek(end)
+                f.readline()  # extend to the end of the current line
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _prune(counts: Counter, max_terms: int) -> Counter:
+    if len(counts) <= max_terms:
+        return counts
+    return Counter(dict(counts.most_common(max_terms)))
+
+
+# Vocabulary for the current worker process, sent once via the pool initializer
+_worker_vocabulary: Optional[FrozenSet[str]] = None
+
+
+def _init_worker(vocabulary: Optional[FrozenSet[str]]):
+    global _worker_vocabulary
+    _worker_vocabulary = vocabulary
+
+
+def _count_chunk(task: tuple) -> Counter:
+    """Count one byte range (runs in a worker process)."""
+    path, start, end, fmt, max_terms = task
+    vocabulary = _worker_vocabulary
+    counts: Counter = Counter()
+    with open(path, "rb") as f:
+        f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            text = line.decode("utf-8", "ignore").lower()
+
+            if fmt == "counts":
+                parts = text.replace(",", " ").split()
+                if len(parts) < 2 or not parts[-1].isdigit():
+                    continue  # header or malformed line
+                word = parts[0]
+                if vocabulary is None or word in vocabulary:
+                    counts[word] += int(parts[-1])
+            else:
+                tokens = WORD_RE.findall(text)
+                if vocabulary is not None:
+                    tokens = [t for t in tokens if t in vocabulary]
+                counts.update(tokens)
+
+            if vocabulary is None and len(counts) > max_terms * 2:
+                counts = _prune(counts, max_terms)
+
+    return counts if vocabulary is not None else _prune(counts, max_terms)
+
+
+def count_frequencies(
+    path: Path,
+    fmt: str = "auto",
+    vocabulary: Optional[FrozenSet[str]] = None,
+    jobs: int = 0,
+    chunk_mb: int = DEFAULT_CHUNK_MB,
+    max_terms: int = DEFAULT_MAX_TERMS,
+) -> Counter:
+    """Stream a text or counts file through a process pool and merge the counts."""
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown frequency format '{fmt}' (expected one of {FORMATS})")
+
+    ranges = chunk_ranges(path, chunk_mb * 1024 * 1024)
+    workers = min(jobs or os.cpu_count() or 1, max(len(ranges), 1))
+    log.info(f"Counting {path} ({path.stat().st_size / 1024 / 1024:.0f} MB, {fmt}) "
+             f"in {len(ranges)} chunks with {workers} processes...")
+
+    start_time = time.time()
+    tasks = [(str(path), s, e, fmt, max_terms) for s, e in ranges]
+    total: Counter = Counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(vocabulary,),
+    ) as pool:
+        for i, partial in enumerate(pool.map(_count_chunk, tasks), 1):
+            total.update(partial)
+            if vocabulary is None:
+                total = _prune(total, max_terms)
+            if i % 10 == 0:
+                log.info(f"  Counted {i}/{len(tasks)} chunks ({time.time() - start_time:.0f}s elapsed)")
+
+    log.info(f"  {len(total)} words, {sum(total.values()):,} tokens "
+             f"in {time.time() - start_time:.1f}s")
+    return total
+
+
+# ---------------------------------------------------------------------------
+# Caching and blending
+# ---------------------------------------------------------------------------
+
+def _cache_key(path: Path, fmt: str, vocabulary: Optional[FrozenSet[str]]) -> str:
+    st = path.stat()
+    h = hashlib.sha256(f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}:{fmt}".encode())
+    if vocabulary is not None:
+        h.update("\n".join(sorted(vocabulary)).encode())
+    return h.hexdigest()[:16]
+
+
+def load_frequency_source(
+    path: Path,
+    fmt: str = "auto",
+    vocabulary: Optional[FrozenSet[str]] = None,
+    cache_dir: Path = Path("cache"),
+    jobs: int = 0,
+) -> Counter:
+    """Count a frequency source, reusing the cached result when the file is unchanged."""
+    fmt = detect_format(path) if fmt == "auto" else fmt
+    cache_file = cache_dir / f"freq_{path.stem}_{_cache_key(path, fmt, vocabulary)}.json"
+    if cache_file.exists():
+        try:
+            counts = Counter(json.loads(cache_file.read_text()))
+            log.info(f"Loaded cached frequencies for {path} ({len(counts)} words)")
+            return counts
+        except json.JSONDecodeError:
+            pass
+
+    counts = count_frequencies(path, fmt, vocabulary, jobs)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(dict(counts), ensure_ascii=False))
+    return counts
+
+
+def blend_frequencies(
+    brown_freq: Counter,
+    external: Counter,
+    weight: float,
+    vocabulary: Optional[FrozenSet[str]] = None,
+) -> Counter:
+    """Blend Brown and external counts: weight=1 uses only the external source.
+
+    Brown counts are first rescaled to the external corpus size (measured over
+    the shared vocabulary), so the blend mixes comparable magnitudes.
+    """
+    if weight >= 1.0:
+        return Counter(external)
+    if weight <= 0.0 or not external:
+        return Counter(brown_freq)
+
+    words = vocabulary if vocabulary is not None else set(brown_freq) | set(external)
+    brown_total = sum(brown_freq.get(w, 0) for w in words)
+    external_total = sum(external.get(w, 0) for w in words)
+    scale = external_total / brown_total if brown_total else 1.0
+
+    blended: Counter = Counter()
+    for w in words:
+        value = weight * external.get(w, 0) + (1.0 - weight) * brown_freq.get(w, 0) * scale
+        if value > 0:
+            blended[w] = value
+    return blended
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Count word frequencies from a large corpus file")
+    parser.add_argument("path", help="Plain-text corpus or word/count file")
+    parser.add_argument("--format", default="auto", choices=("auto",) + FORMATS, help="Input format")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Worker processes (default: all cores)")
+    parser.add_argument("--top", type=int, default=20, help="Print the N most common words")
+    args = parser.parse_args()
+
+    counts = count_frequencies(Path(args.path), args.format, jobs=args.jobs)
+    for word, count in counts.most_common(args.top):
+        print(f"{word:<20} {count:>12,}")
+
+
+if __name__ == "__main__":
+    main()
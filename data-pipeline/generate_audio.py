@@ -13,6 +13,11 @@ Usage:
     python generate_audio.py --voice en-US-EmmaNeural  # Use different voice
     python generate_audio.py --workers 5             # Fewer concurrent requests
     python generate_audio.py --report-only           # Just show stats
+    python generate_audio.py --metrics-port 9108     # Live metrics on :9108/metrics
+
+    # Matrix mode: every voice x every format, one synthesis per voice
+    python generate_audio.py --voices en-US-AndrewNeural,en-GB-SoniaNeural \
+        --formats vorbis:3,opus:24k,opus:16k --limit 500
 
 Prerequisites:
     pip install edge-tts
@@ -23,16 +28,24 @@ License: Internal (JWorks)
 
 import argparse
 import asyncio
+import json
 import logging
+import math
 import os
 import sqlite3
+import statistics
 import subprocess
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
+
+from pipeline_metrics import METRICS, add_metrics_arguments, request_outcome, start_from_args
 
-import edge_tts
+# edge_tts (and numpy for verification) are imported where used, so
+# --report-only and matrix summaries don't pay for them.
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -44,6 +57,25 @@ DEFAULT_VOICE = "en-US-AndrewNeural"
 DEFAULT_WORKERS = 10
 OGG_QUALITY = "3"  # libvorbis quality (0-10, 3 ≈ 112kbps, good for speech)
 
+# Codec name -> (ffmpeg encoder, file extension, quality flag)
+CODECS = {
+    "vorbis": ("libvorbis", ".ogg", "-q:a"),   # quality 0-10
+    "opus": ("libopus", ".opus", "-b:a"),      # bitrate, e.g. 24k
+}
+DEFAULT_FORMATS = "vorbis:" + OGG_QUALITY
+MATRIX_SUMMARY_FILE = "audio_matrix_summary.json"
+
+# Verification thresholds
+DEFAULT_REPORT = "audio_verification_report.json"
+ANALYSIS_SAMPLE_RATE = 16000  # decode rate for analysis (speech band is plenty)
+SILENCE_FRAME_MS = 10
+SILENCE_DBFS = -40.0          # frames quieter than this count as silence
+NEAR_SILENT_DBFS = -30.0      # clips peaking below this are effectively empty
+MIN_VOICED_MS = 80            # clips with less non-silent audio than this are mostly silent
+DURATION_Z_LIMIT = 3.0          # reported for review
+DURATION_Z_FAIL = 5.0           # fails verification (|z| > 3 is ~0.3% of clips by chance)
+MIN_BUCKET_SIZE = 20          # min clips per word-length bucket for z-scores
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -67,6 +99,64 @@ def load_words(db_path: str, limit: int = 0) -> List[Tuple[int, str]]:
     return words
 
 
+# ---------------------------------------------------------------------------
+# Output variants
+# ---------------------------------------------------------------------------
+
+class Variant(NamedTuple):
+    """One encoded output format (codec + quality)."""
+    codec: str
+    quality: str
+
+    @property
+    def name(self) -> str:
+        if self.codec == "vorbis":
+            return f"vorbis-q{self.quality}"
+        return f"{self.codec}-{self.quality}"
+
+    @property
+    def ext(self) -> str:
+        return CODECS[self.codec][1]
+
+    def ffmpeg_args(self) -> List[str]:
+        encoder, _, quality_flag = CODECS[self.codec]
+        args = ["-c:a", encoder, quality_flag, self.quality]
+        if self.codec == "opus":
+            args += ["-application", "voip"]  # tuned for speech at low bitrates
+        return args
+
+
+def parse_formats(spec: str) -> List[Variant]:
+    """Parse a format list like "vorbis:3,opus:24k" into variants."""
+    variants = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        codec, _, quality = item.partition(":")
+        if codec not in CODECS or not quality:
+            raise ValueError(
+                f"Invalid format '{item}' (expected codec:quality, codecs: {', '.join(CODECS)})"
+            )
+        variants.append(Variant(codec, quality))
+    if not variants:
+        raise ValueError("No output formats given")
+    return variants
+
+
+def variant_dir(output_root: Path, voice: str, variant: Variant) -> Path:
+    """Directory holding one voice x format variant in matrix mode."""
+    return output_root / voice / variant.name
+
+
+def encode_command(src: Path, outputs: List[Tuple[Variant, Path]]) -> List[str]:
+    """Build one ffmpeg command that decodes src once and encodes every output."""
+    cmd = ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src)]
+    for variant, path in outputs:
+        cmd += variant.ffmpeg_args() + [str(path)]
+    return cmd
+
+
 # ---------------------------------------------------------------------------
 # Audio generation
 # ---------------------------------------------------------------------------
@@ -89,19 +179,27 @@ async def generate_one(
     async with semaphore:
         try:
             # Generate MP3 with edge-tts
+            import edge_tts
+
             communicate = edge_tts.Communicate(word, voice)
-            await communicate.save(str(mp3_path))
+            tts_start = time.perf_counter()
+            try:
+                with METRICS.in_flight("tts"):
+                    await communicate.save(str(mp3_path))
+            except Exception as e:
+                METRICS.inc("requests_total", kind="tts", outcome=request_outcome(e))
+                raise
+            METRICS.observe("tts_seconds", time.perf_counter() - tts_start, voice=voice)
+            METRICS.inc("requests_total", kind="tts", outcome="ok")
 
             # Convert MP3 → OGG Vorbis
+            encode_start = time.perf_counter()
             result = subprocess.run(
-                [
-                    "ffmpeg", "-y", "-i", str(mp3_path),
-                    "-c:a", "libvorbis", "-q:a", OGG_QUALITY,
-                    str(ogg_path),
-                ],
+                encode_command(mp3_path, [(Variant("vorbis", OGG_QUALITY), ogg_path)]),
                 capture_output=True,
                 timeout=30,
             )
+            METRICS.observe("encode_seconds", time.perf_counter() - encode_start, formats="vorbis")
 
             # Clean up MP3
             if mp3_path.exists():
@@ -136,15 +234,24 @@ async def generate_batch(
 
     start_time = time.time()
     batch_size = 100
+    METRICS.stage_started("audio", total)
+    queued = 0  # words of the current batch not finished yet
+
+    async def tracked(word: str) -> Tuple[str, bool, int]:
+        nonlocal queued
+        result = await generate_one(word, output_dir, voice, semaphore)
+        METRICS.advance("audio", failed=not result[1])
+        queued -= 1
+        METRICS.set_gauge("queue_depth", queued, stage="audio")
+        return result
 
     for batch_start in range(0, total, batch_size):
         batch_end = min(batch_start + batch_size, total)
         batch = words[batch_start:batch_end]
+        queued = len(batch)
+        METRICS.set_gauge("queue_depth", queued, stage="audio")
 
-        tasks = [
-            generate_one(word, output_dir, voice, semaphore)
-            for _, word in batch
-        ]
+        tasks = [tracked(word) for _, word in batch]
         results = await asyncio.gather(*tasks)
 
         for word, ok, size in results:
@@ -172,32 +279,364 @@ async def generate_batch(
     return success, failed, total_bytes
 
 
+# ---------------------------------------------------------------------------
+# Matrix generation (voices x formats)
+# ---------------------------------------------------------------------------
+
+def plan_matrix(
+    words: List[Tuple[int, str]],
+    voices: List[str],
+    variants: List[Variant],
+    output_root: Path,
+) -> Dict[str, List[Tuple[str, List[Variant]]]]:
+    """Work out, per voice, which words still need which variants.
+
+    Each planned word is synthesized once and every missing variant is encoded
+    from that single decode, so adding a format never re-hits the TTS service.
+    """
+    plan: Dict[str, List[Tuple[str, List[Variant]]]] = {}
+    for voice in voices:
+        jobs = []
+        for _, word in words:
+            missing = [
+                v for v in variants
+                if not (variant_dir(output_root, voice, v) / f"{word}{v.ext}").exists()
+            ]
+            if missing:
+                jobs.append((word, missing))
+        plan[voice] = jobs
+    return plan
+
+
+async def generate_one_matrix(
+    word: str,
+    voice: str,
+    variants: List[Variant],
+    output_root: Path,
+    semaphore: asyncio.Semaphore,
+) -> Tuple[str, bool, Dict[str, int], float]:
+    """Synthesize a word once and encode it to all given variants.
+
+    Returns (word, success, {variant_name: file_size}, encode_seconds).
+    """
+    tmp_dir = output_root / voice / ".tmp"
+    mp3_path = tmp_dir / f"{word}.mp3"
+    outputs = [(v, variant_dir(output_root, voice, v) / f"{word}{v.ext}") for v in variants]
+
+    async with semaphore:
+        try:
+            import edge_tts
+
+            communicate = edge_tts.Communicate(word, voice)
+            tts_start = time.perf_counter()
+            try:
+                with METRICS.in_flight("tts"):
+                    await communicate.save(str(mp3_path))
+            except Exception as e:
+                METRICS.inc("requests_total", kind="tts", outcome=request_outcome(e))
+                raise
+            METRICS.observe("tts_seconds", time.perf_counter() - tts_start, voice=voice)
+            METRICS.inc("requests_total", kind="tts", outcome="ok")
+
+            encode_start = time.perf_counter()
+            result = subprocess.run(
+                encode_command(mp3_path, outputs),
+                capture_output=True,
+                timeout=30,
+            )
+            encode_seconds = time.perf_counter() - encode_start
+            # One ffmpeg call writes every variant, so it is one observation
+            METRICS.observe("encode_seconds", encode_seconds, formats="+".join(v.name for v in variants))
+
+            if mp3_path.exists():
+                mp3_path.unlink()
+
+            if result.returncode != 0 or not all(p.exists() for _, p in outputs):
+                for _, p in outputs:
+                    if p.exists():
+                        p.unlink()
+                return word, False, {}, encode_seconds
+
+            sizes = {v.name: p.stat().st_size for v, p in outputs}
+            return word, True, sizes, encode_seconds
+
+        except Exception:
+            for p in [mp3_path] + [p for _, p in outputs]:
+                if p.exists():
+                    p.unlink()
+            return word, False, {}, 0.0
+
+
+async def generate_matrix(
+    words: List[Tuple[int, str]],
+    voices: List[str],
+    variants: List[Variant],
+    output_root: Path,
+    workers: int,
+) -> dict:
+    """Generate every voice x variant combination. Returns a per-variant summary."""
+    plan = plan_matrix(words, voices, variants, output_root)
+    for voice in voices:
+        (output_root / voice / ".tmp").mkdir(parents=True, exist_ok=True)
+        for v in variants:
+            variant_dir(output_root, voice, v).mkdir(parents=True, exist_ok=True)
+        log.info(f"  Plan: {voice}: {len(plan[voice])}/{len(words)} words to synthesize")
+
+    semaphore = asyncio.Semaphore(workers)
+    batch_size = 100
+    summary: Dict[str, dict] = {}
+
+    for voice in voices:
+        jobs = plan[voice]
+        failed_words = []
+        encode_seconds: Dict[str, float] = {v.name: 0.0 for v in variants}
+        encoded_count: Dict[str, int] = {v.name: 0 for v in variants}
+        start_time = time.time()
+        stage = f"audio:{voice}"
+        METRICS.stage_started(stage, len(jobs))
+        queued = 0  # words of the current batch not finished yet
+
+        async def tracked(word: str, missing: List[Variant]) -> Tuple[str, bool, Dict[str, int], float]:
+            nonlocal queued
+            result = await generate_one_matrix(word, voice, missing, output_root, semaphore)
+            METRICS.advance(stage, failed=not result[1])
+            queued -= 1
+            METRICS.set_gauge("queue_depth", queued, stage=stage)
+            return result
+
+        for batch_start in range(0, len(jobs), batch_size):
+            batch = jobs[batch_start:batch_start + batch_size]
+            queued = len(batch)
+            METRICS.set_gauge("queue_depth", queued, stage=stage)
+            results = await asyncio.gather(*[tracked(word, missing) for word, missing in batch])
+            for (word, missing), (_, ok, sizes, seconds) in zip(batch, results):
+                if not ok:
+                    failed_words.append(word)
+                    continue
+                # Attribute shared decode+encode time evenly across variants
+                for v in missing:
+                    encode_seconds[v.name] += seconds / len(missing)
+                    encoded_count[v.name] += 1
+
+            done = min(batch_start + batch_size, len(jobs))
+            elapsed = time.time() - start_time
+            rate = done / elapsed if elapsed > 0 else 0
+            log.info(
+                f"  [{voice}] Progress: {done}/{len(jobs)} | "
+                f"Failed: {len(failed_words)} | Rate: {rate:.1f} words/s"
+            )
+
+        if failed_words:
+            log.warning(f"  [{voice}] Failed words ({len(failed_words)}): {failed_words[:20]}...")
+
+        for v in variants:
+            vdir = variant_dir(output_root, voice, v)
+            sizes = [f.stat().st_size for f in vdir.glob(f"*{v.ext}")]
+            total_bytes = sum(sizes)
+            seconds = encode_seconds[v.name]
+            summary[f"{voice}/{v.name}"] = {
+                "voice": voice,
+                "codec": v.codec,
+                "quality": v.quality,
+                "directory": str(vdir),
+                "files": len(sizes),
+                "expected_files": len(words),
+                "failed": len(failed_words),
+                "total_size_mb": round(total_bytes / 1024 / 1024, 2),
+                "avg_size_kb": round(total_bytes / len(sizes) / 1024, 2) if sizes else 0,
+                "encoded": encoded_count[v.name],
+                "encode_files_per_sec": (
+                    round(encoded_count[v.name] / seconds, 1) if seconds > 0 else None
+                ),
+            }
+
+    return summary
+
+
+def print_matrix_summary(summary: dict):
+    """Print a size/throughput table per variant, smallest first."""
+    print("\n" + "=" * 78)
+    print("EigoQuest Audio Matrix Summary")
+    print("=" * 78)
+    print(f"{'Variant':<40} {'Files':>7} {'Total MB':>9} {'Avg KB':>7} {'Enc/s':>7}")
+    for name, row in sorted(summary.items(), key=lambda kv: kv[1]["avg_size_kb"]):
+        rate = row["encode_files_per_sec"]
+        rate_str = f"{rate:.1f}" if rate is not None else "-"
+        print(
+            f"{name:<40} {row['files']:>7,} {row['total_size_mb']:>9.2f} "
+            f"{row['avg_size_kb']:>7.2f} {rate_str:>7}"
+        )
+    print("=" * 78)
+
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
 
-def verify_audio(output_dir: Path, expected_count: int) -> dict:
-    """Verify generated audio files."""
-    ogg_files = list(output_dir.glob("*.ogg"))
-    total_size = sum(f.stat().st_size for f in ogg_files)
+def analyze_clip(path: str) -> dict:
+    """Decode one clip to mono PCM and measure duration, peak level and silence.
+
+    voiced_ms counts non-silent frames. silence_ratio is measured after trimming
+    leading and trailing silence, since TTS pads short words ("a", "ox") with
+    far more silence than speech.
+
+    Runs in a worker thread; anything ffmpeg complains about (truncated pages,
+    bad headers) marks the clip as corrupt even if some samples came out.
+    """
+    import numpy as np
+
+    result = {"file": Path(path).name, "word": Path(path).stem}
+    try:
+        proc = subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-i", path,
+                "-f", "s16le", "-ac", "1", "-ar", str(ANALYSIS_SAMPLE_RATE), "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except subprocess.TimeoutExpired:
+        return {**result, "ok": False, "error": "decode timeout"}
+
+    stderr = proc.stderr.decode("utf-8", "replace").strip()
+    samples = np.frombuffer(proc.stdout, dtype=np.int16).astype(np.float32) / 32768.0
+    if proc.returncode != 0 or stderr or samples.size == 0:
+        return {**result, "ok": False, "error": stderr[:200] or "no audio samples"}
+
+    peak = float(np.abs(samples).max())
+    frame = ANALYSIS_SAMPLE_RATE * SILENCE_FRAME_MS // 1000
+    n_frames = samples.size // frame
+    voiced = np.zeros(0, dtype=bool)
+    if n_frames:
+        rms = np.sqrt(np.mean(samples[:n_frames * frame].reshape(n_frames, frame) ** 2, axis=1))
+        voiced = rms >= 10 ** (SILENCE_DBFS / 20)
+    voiced_at = np.flatnonzero(voiced)
+    if voiced_at.size:
+        silence_ratio = float(1.0 - np.mean(voiced[voiced_at[0]:voiced_at[-1] + 1]))
+    else:
+        silence_ratio = 1.0
+
+    return {
+        **result,
+        "ok": True,
+        "duration_sec": round(samples.size / ANALYSIS_SAMPLE_RATE, 3),
+        "peak_dbfs": round(20 * math.log10(peak), 1) if peak > 0 else -120.0,
+        "voiced_ms": int(voiced_at.size) * SILENCE_FRAME_MS,
+        "silence_ratio": round(silence_ratio, 3),
+    }
+
+
+def flag_duration_outliers(clips: List[dict]) -> List[dict]:
+    """Flag clips whose duration is a z-score outlier among words of similar length.
+
+    Words are bucketed by character count (long words share one bucket); buckets
+    too small for a stable estimate fall back to the global mean/stdev.
+    """
+    def bucket(word: str) -> int:
+        return min(len(word), 15)
+
+    durations = [c["duration_sec"] for c in clips]
+    if len(durations) < 2:
+        return []
+    global_stats = (statistics.fmean(durations), statistics.pstdev(durations))
+
+    by_bucket: Dict[int, List[float]] = defaultdict(list)
+    for c in clips:
+        by_bucket[bucket(c["word"])].append(c["duration_sec"])
+    bucket_stats = {
+        b: (statistics.fmean(d), statistics.pstdev(d))
+        for b, d in by_bucket.items() if len(d) >= MIN_BUCKET_SIZE
+    }
 
-    sizes = [f.stat().st_size for f in ogg_files]
-    avg_size = sum(sizes) / len(sizes) if sizes else 0
+    outliers = []
+    for c in clips:
+        mean, stdev = bucket_stats.get(bucket(c["word"]), global_stats)
+        if stdev <= 0:
+            continue
+        z = (c["duration_sec"] - mean) / stdev
+        if abs(z) > DURATION_Z_LIMIT:
+            outliers.append({
+                "word": c["word"],
+                "duration_sec": c["duration_sec"],
+                "z_score": round(z, 2),
+            })
+    outliers.sort(key=lambda o: -abs(o["z_score"]))
+    return outliers
+
+
+def verify_audio(
+    output_dir: Path,
+    words: List[Tuple[int, str]],
+    jobs: int = 0,
+    ext: str = ".ogg",
+) -> dict:
+    """Decode every clip (parallel ffmpeg subprocesses) and verify it against the word list.
+
+    Returns summary stats plus per-clip measurements under "clips".
+    """
+    audio_files = {f.stem: f for f in output_dir.glob(f"*{ext}")}
+    expected = {w for _, w in words}
+    missing = sorted(expected - audio_files.keys())
+    orphaned = sorted(audio_files.keys() - expected)
+
+    sizes = [f.stat().st_size for f in audio_files.values()]
+    total_size = sum(sizes)
+    avg_size = total_size / len(sizes) if sizes else 0
     min_size = min(sizes) if sizes else 0
     max_size = max(sizes) if sizes else 0
 
     # Check for suspiciously small files (likely errors)
-    tiny_files = [f.name for f in ogg_files if f.stat().st_size < 500]
+    tiny_files = sorted(f.name for f in audio_files.values() if f.stat().st_size < 500)
+
+    start = time.time()
+    paths = [str(f) for f in audio_files.values()]
+    workers = jobs or os.cpu_count() or 1
+    clips: List[dict] = []
+    if paths:
+        # The work happens in ffmpeg; threads just wait on it, with nothing to pickle
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            clips = list(pool.map(analyze_clip, paths))
+    decode_elapsed = time.time() - start
+    log.info(f"  Decoded {len(clips)} clips in {decode_elapsed:.1f}s ({workers} threads)")
+
+    decoded = [c for c in clips if c["ok"]]
+    corrupt = sorted(
+        ({"word": c["word"], "error": c["error"]} for c in clips if not c["ok"]),
+        key=lambda c: c["word"],
+    )
+    durations = sorted(c["duration_sec"] for c in decoded)
+    near_silent = sorted(c["word"] for c in decoded if c["peak_dbfs"] < NEAR_SILENT_DBFS)
+    mostly_silent = sorted(c["word"] for c in decoded if c["voiced_ms"] < MIN_VOICED_MS)
+
+    def percentile(p: float) -> float:
+        if not durations:
+            return 0.0
+        return durations[min(len(durations) - 1, int(p * len(durations)))]
 
     stats = {
-        "total_files": len(ogg_files),
-        "expected_files": expected_count,
-        "coverage_pct": round(len(ogg_files) / max(expected_count, 1) * 100, 1),
+        "total_files": len(audio_files),
+        "expected_files": len(words),
+        "coverage_pct": round((len(expected) - len(missing)) / max(len(words), 1) * 100, 1),
         "total_size_mb": round(total_size / 1024 / 1024, 1),
         "avg_size_kb": round(avg_size / 1024, 1),
         "min_size_kb": round(min_size / 1024, 1),
         "max_size_kb": round(max_size / 1024, 1),
         "tiny_files": tiny_files[:10],
+        "decoded_files": len(decoded),
+        "decode_seconds": round(decode_elapsed, 1),
+        "missing_words": missing,
+        "orphaned_files": orphaned,
+        "corrupt_files": corrupt,
+        "duration_sec": {
+            "mean": round(statistics.fmean(durations), 3) if durations else 0.0,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "max": durations[-1] if durations else 0.0,
+        },
+        "duration_outliers": flag_duration_outliers(decoded),
+        "near_silent": near_silent,
+        "mostly_silent": mostly_silent,
+        "clips": sorted(clips, key=lambda c: c["word"]),
     }
     return stats
 
@@ -214,14 +653,39 @@ def print_report(stats: dict):
     print(f"Avg file size:       {stats['avg_size_kb']} KB")
     print(f"Min file size:       {stats['min_size_kb']} KB")
     print(f"Max file size:       {stats['max_size_kb']} KB")
+    print(f"Decoded OK:          {stats['decoded_files']:,} ({stats['decode_seconds']}s)")
+    d = stats["duration_sec"]
+    print(f"Duration:            mean {d['mean']}s, p50 {d['p50']}s, p95 {d['p95']}s, max {d['max']}s")
 
     if stats["tiny_files"]:
         print(f"\nSuspiciously small files: {stats['tiny_files']}")
+    if stats["missing_words"]:
+        print(f"\nMissing audio ({len(stats['missing_words'])}): {stats['missing_words'][:10]}")
+    if stats["orphaned_files"]:
+        print(f"\nOrphaned files ({len(stats['orphaned_files'])}): {stats['orphaned_files'][:10]}")
+    if stats["corrupt_files"]:
+        print(f"\nCorrupt clips ({len(stats['corrupt_files'])}): "
+              f"{[c['word'] for c in stats['corrupt_files'][:10]]}")
+    if stats["duration_outliers"]:
+        print(f"\nDuration outliers (|z| > {DURATION_Z_LIMIT}, {len(stats['duration_outliers'])}):")
+        for o in stats["duration_outliers"][:10]:
+            print(f"  {o['word']:<20} {o['duration_sec']:>6.2f}s  z={o['z_score']:+.1f}")
+    if stats["near_silent"]:
+        print(f"\nNear-silent clips ({len(stats['near_silent'])}): {stats['near_silent'][:10]}")
+    if stats["mostly_silent"]:
+        print(f"\nMostly silent clips (< {MIN_VOICED_MS} ms voiced, {len(stats['mostly_silent'])}): "
+              f"{stats['mostly_silent'][:10]}")
 
     checks = [
         ("Coverage >= 99%", stats["coverage_pct"] >= 99),
         ("Total size < 200 MB", stats["total_size_mb"] < 200),
         ("No tiny files", len(stats["tiny_files"]) == 0),
+        ("No corrupt clips", len(stats["corrupt_files"]) == 0),
+        ("No orphaned files", len(stats["orphaned_files"]) == 0),
+        ("No near-silent clips", len(stats["near_silent"]) == 0),
+        (f"No clips under {MIN_VOICED_MS} ms of speech", len(stats["mostly_silent"]) == 0),
+        (f"No duration outliers beyond |z| > {DURATION_Z_FAIL}",
+         not any(abs(o["z_score"]) > DURATION_Z_FAIL for o in stats["duration_outliers"])),
     ]
 
     print("\nValidation Checks:")
@@ -238,6 +702,12 @@ def print_report(stats: dict):
     return all_pass
 
 
+def save_report(stats: dict, report_path: Path):
+    """Write the full verification results (including per-clip data) as JSON."""
+    report_path.write_text(json.dumps(stats, indent=2, ensure_ascii=False))
+    log.info(f"Verification report saved to {report_path}")
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -247,10 +717,23 @@ def main():
     parser.add_argument("--db", default=DEFAULT_DB, help="Path to vocabquest.db")
     parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT_DIR, help="Output directory for audio files")
     parser.add_argument("--voice", default=DEFAULT_VOICE, help=f"Edge TTS voice (default: {DEFAULT_VOICE})")
+    parser.add_argument(
+        "--voices",
+        help="Comma-separated voices for matrix mode (output goes to <output>/<voice>/<format>/)",
+    )
+    parser.add_argument(
+        "--formats",
+        help=f"Comma-separated codec:quality list for matrix mode (default: {DEFAULT_FORMATS}), "
+             f"e.g. vorbis:3,opus:24k,opus:16k",
+    )
     parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Concurrent workers")
     parser.add_argument("--limit", type=int, default=0, help="Limit number of words (0 = all)")
     parser.add_argument("--report-only", action="store_true", help="Only verify existing audio")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Parallel ffmpeg decodes for verification (0 = all cores)")
+    parser.add_argument("--report", default=DEFAULT_REPORT, help=f"JSON verification report path (default: {DEFAULT_REPORT})")
+    add_metrics_arguments(parser)
     args = parser.parse_args()
+    start_from_args(args)
 
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -259,9 +742,43 @@ def main():
     words = load_words(args.db, args.limit)
     log.info(f"Loaded {len(words)} words from database")
 
+    if args.voices or args.formats:
+        voices = [v.strip() for v in (args.voices or args.voice).split(",") if v.strip()]
+        try:
+            variants = parse_formats(args.formats or DEFAULT_FORMATS)
+        except ValueError as e:
+            parser.error(str(e))
+
+        summary_path = output_dir / MATRIX_SUMMARY_FILE
+        if args.report_only:
+            if summary_path.exists():
+                print_matrix_summary(json.loads(summary_path.read_text()))
+            else:
+                log.error(f"No matrix summary found at {summary_path}")
+                sys.exit(1)
+            return
+
+        log.info(
+            f"Generating audio matrix: {len(voices)} voices x {len(variants)} formats, "
+            f"workers={args.workers}"
+        )
+        start = time.time()
+        summary = asyncio.run(
+            generate_matrix(words, voices, variants, output_dir, args.workers)
+        )
+        log.info(f"\nMatrix generation complete in {(time.time() - start)/60:.1f} minutes")
+
+        summary_path.write_text(json.dumps(summary, indent=2))
+        log.info(f"Matrix summary saved to {summary_path}")
+        print_matrix_summary(summary)
+
+        complete = all(row["files"] >= row["expected_files"] for row in summary.values())
+        sys.exit(0 if complete else 1)
+
     if args.report_only:
-        stats = verify_audio(output_dir, len(words))
+        stats = verify_audio(output_dir, words, args.jobs)
         print_report(stats)
+        save_report(stats, Path(args.report))
         return
 
     # Check how many already exist (resume)
@@ -282,8 +799,9 @@ def main():
     log.info(f"  Success: {success}, Failed: {failed}, Size: {total_bytes/1024/1024:.1f} MB")
 
     # Verify
-    stats = verify_audio(output_dir, len(words))
+    stats = verify_audio(output_dir, words, args.jobs)
     all_pass = print_report(stats)
+    save_report(stats, Path(args.report))
 
     sys.exit(0 if all_pass else 1)
 
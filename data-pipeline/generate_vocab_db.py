@@ -5,7 +5,7 @@ EigoQuest Vocabulary Database Generator
 Generates a SQLite database with 10,000 English words for the EigoQuest app.
 
 Sources:
-  - NLTK WordNet: definitions, examples, synonyms/antonyms
+  - NLTK WordNet: definitions, examples, synonyms/antonyms, related words
   - NLTK Brown Corpus: word frequency data
   - NLTK CMU Pronouncing Dictionary: phonetic transcription (ARPAbet -> IPA)
   - Optional: Free Dictionary API for enhanced definitions and audio URLs
@@ -16,12 +16,20 @@ Usage:
     python generate_vocab_db.py
     python generate_vocab_db.py --output ../shared-core/src/commonMain/resources/vocabquest.db
     python generate_vocab_db.py --enrich-api    # Also fetch from Free Dictionary API
+    python generate_vocab_db.py --enrich-api --api-budget 2000   # Best coverage per request
     python generate_vocab_db.py --count 5000    # Generate fewer words for testing
+    python generate_vocab_db.py --count 60000 --shards 32   # Large deck, parallel shards
+    python generate_vocab_db.py --freq-source corpus.txt     # Rank by a large local corpus
+    python generate_vocab_db.py --check         # Rebuild in a temp dir, compare hash with --output
+    python generate_vocab_db.py --compress zlib -o /tmp/vocabquest.db   # Compressed text (not app-compatible yet)
+    python generate_vocab_db.py --enrich-api --metrics-port 9108   # Live metrics on :9108/metrics
 
 License: Internal (JWorks)
 """
 
 import argparse
+import hashlib
+import heapq
 import json
 import logging
 import math
@@ -31,11 +39,14 @@ import sqlite3
 import sys
 import time
 from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-import nltk
-from nltk.corpus import brown, cmudict, wordnet
+from pipeline_metrics import METRICS, add_metrics_arguments, request_outcome, start_from_args
+
+# NLTK and its corpora are imported inside the functions that need them, so the
+# report/verify paths (sqlite3 only) start without loading NLTK.
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -43,27 +54,51 @@ from nltk.corpus import brown, cmudict, wordnet
 
 DEFAULT_OUTPUT = "../shared-core/src/commonMain/resources/vocabquest.db"
 DEFAULT_WORD_COUNT = 10000
+DEFAULT_RELATED_K = 10
+DEFAULT_PAGE_SIZE = 4096  # matches the flash/OS page on Android and iOS
+
+# Build manifest: config keys that affect the DB contents. Inputs are the NLTK
+# corpora and --freq-source; the code is identified by PIPELINE_VERSION rather
+# than by hashing the scripts, so comment/refactor edits leave the DB bytes alone.
+MANIFEST_CONFIG_KEYS = (
+    "count", "enrich_api", "api_batch", "api_budget", "freq_format", "freq_weight", "related", "page_size",
+    "compress",
+)
+# Bump whenever a change alters what a build writes (schema, selection, scoring, ...).
+# It also invalidates run_pipeline.py's cached stages.
+PIPELINE_VERSION = 2
+MANIFEST_FORMAT = 2
+LARGE_INPUT_BYTES = 64 * 1024 * 1024
 MIN_WORD_LENGTH = 2
 MAX_WORD_LENGTH = 25
 
-# CEFR level boundaries (by frequency rank, 1-indexed)
+# CEFR level boundaries (by difficulty percentile, see difficulty.py)
 # Target distribution: A1+A2 ~30%, B1+B2 ~40%, C1+C2 ~30%
-CEFR_BOUNDARIES = [
-    (1000, "A1"),    # ranks 1-1000
-    (3000, "A2"),    # ranks 1001-3000
-    (5000, "B1"),    # ranks 3001-5000
-    (7000, "B2"),    # ranks 5001-7000
-    (9000, "C1"),    # ranks 7001-9000
-    (99999, "C2"),   # ranks 9001+
+CEFR_QUANTILES = [
+    (0.10, "A1"),    # easiest 10%
+    (0.30, "A2"),    # next 20%
+    (0.50, "B1"),
+    (0.70, "B2"),
+    (0.90, "C1"),
+    (1.00, "C2"),    # hardest 10%
 ]
+CEFR_LEVELS = ["A1", "A2", "B1", "B2", "C1", "C2"]
+KNOWN_POS = ["noun", "verb", "adj", "adv"]
+
+# WordNet POS tags (same values as nltk.corpus.wordnet.NOUN etc.)
+WN_NOUN = "n"
+WN_VERB = "v"
+WN_ADJ = "a"
+WN_ADJ_SAT = "s"
+WN_ADV = "r"
 
 # Map WordNet POS tags to human-readable
 WN_POS_MAP = {
-    wordnet.NOUN: "noun",
-    wordnet.VERB: "verb",
-    wordnet.ADJ: "adj",
-    wordnet.ADJ_SAT: "adj",
-    wordnet.ADV: "adv",
+    WN_NOUN: "noun",
+    WN_VERB: "verb",
+    WN_ADJ: "adj",
+    WN_ADJ_SAT: "adj",
+    WN_ADV: "adv",
 }
 
 # ARPAbet to IPA conversion
@@ -80,6 +115,22 @@ ARPABET_TO_IPA = {
     "Y": "j", "Z": "z", "ZH": "\u0292",
 }
 
+# Word completeness (score_completeness): weight of each field, summing to 1
+COMPLETENESS_WEIGHTS = {"examples": 0.4, "phonetic": 0.2, "audio_url": 0.25, "definition": 0.15}
+FULL_EXAMPLES = 2          # examples for full example credit
+FIRST_EXAMPLE_CREDIT = 0.75  # most of the credit: example coverage counts words with any
+FULL_DEFINITION_CHARS = 40  # definition length for full definition credit
+# Prior chance that a Free Dictionary API response fills a missing field. Refined
+# per CEFR level from the responses seen during the run (PRIOR_STRENGTH pseudo-counts).
+API_FIELD_PRIORS = {"examples": 0.3, "phonetic": 0.7, "audio_url": 0.6, "definition": 0.4}
+PRIOR_STRENGTH = 10
+DEFAULT_API_REPORT = "api_coverage_report.json"
+# A cached 404 is trusted this long, then the word is asked for again (404s can be transient)
+API_NOT_FOUND_TTL_DAYS = 30
+# A 429 is retried this many times, after API_RETRY_DELAY seconds doubling per retry
+API_MAX_RETRIES = 2
+API_RETRY_DELAY = 5.0
+
 # Words to always exclude (too basic/function or offensive)
 EXCLUDE_WORDS = {
     "a", "an", "the", "i", "me", "my", "we", "us", "our", "you", "your",
@@ -105,29 +156,70 @@ log = logging.getLogger("vocabquest")
 # ARPAbet -> IPA conversion
 # ---------------------------------------------------------------------------
 
+def _phone_to_ipa(phone: str) -> str:
+    """Convert a single ARPAbet token (with optional stress digit) to IPA."""
+    # Strip stress digit (0=no stress, 1=primary, 2=secondary)
+    base = phone.rstrip("012")
+    stress = phone[-1] if phone[-1] in "012" else None
+
+    ipa_char = ARPABET_TO_IPA.get(base, base.lower())
+
+    # Handle stress markers
+    if stress == "1":
+        return "\u02C8" + ipa_char  # primary stress
+    if stress == "2":
+        return "\u02CC" + ipa_char  # secondary stress
+    # Unstressed AH -> schwa
+    if base == "AH" and stress == "0":
+        return "\u0259"
+    return ipa_char
+
+
+# Every ARPAbet token, bare and with each stress digit, precomputed to IPA
+PHONE_TO_IPA = {
+    base + stress: _phone_to_ipa(base + stress)
+    for base in ARPABET_TO_IPA
+    for stress in ("", "0", "1", "2")
+}
+
+
+@lru_cache(maxsize=None)
+def _transcode(phones: Tuple[str, ...]) -> str:
+    table = PHONE_TO_IPA
+    try:
+        return "/" + "".join([table[p] for p in phones]) + "/"
+    except KeyError:
+        return "/" + "".join([table.get(p) or _phone_to_ipa(p) for p in phones]) + "/"
+
+
 def arpabet_to_ipa(phones: List[str]) -> str:
-    """Convert a CMU ARPAbet pronunciation to IPA."""
-    ipa_parts: List[str] = []
-    for phone in phones:
-        # Strip stress digit (0=no stress, 1=primary, 2=secondary)
-        base = phone.rstrip("012")
-        stress = phone[-1] if phone[-1] in "012" else None
-
-        ipa_char = ARPABET_TO_IPA.get(base, base.lower())
-
-        # Handle stress markers
-        if stress == "1":
-            ipa_parts.append("\u02C8" + ipa_char)  # primary stress
-        elif stress == "2":
-            ipa_parts.append("\u02CC" + ipa_char)  # secondary stress
-        else:
-            # Unstressed AH -> schwa
-            if base == "AH" and stress == "0":
-                ipa_parts.append("\u0259")
-            else:
-                ipa_parts.append(ipa_char)
+    """Convert a CMU ARPAbet pronunciation to IPA (memoized per pronunciation)."""
+    return _transcode(tuple(phones))
 
-    return "/" + "".join(ipa_parts) + "/"
+
+def build_ipa_table(cmu_dict: Dict[str, list]) -> Dict[str, List[str]]:
+    """Transcode every CMU entry, all pronunciation variants, to IPA.
+
+    Variants that collapse to the same IPA string are kept once, in CMU order,
+    so the first entry is always the transcription of cmu_dict[word][0].
+    """
+    start = time.perf_counter()
+    phone_table = PHONE_TO_IPA
+    table: Dict[str, List[str]] = {}
+    variant_count = 0
+    for word, variants in cmu_dict.items():
+        try:
+            ipa_variants = ["/" + "".join([phone_table[p] for p in phones]) + "/"
+                            for phones in variants]
+        except KeyError:
+            ipa_variants = [_transcode(tuple(phones)) for phones in variants]
+        if len(ipa_variants) > 1:
+            ipa_variants = list(dict.fromkeys(ipa_variants))
+        table[word] = ipa_variants
+        variant_count += len(ipa_variants)
+    log.info(f"  Transcoded {len(table)} CMU entries ({variant_count} pronunciations) "
+             f"to IPA in {time.perf_counter() - start:.2f}s")
+    return table
 
 
 # ---------------------------------------------------------------------------
@@ -136,6 +228,8 @@ def arpabet_to_ipa(phones: List[str]) -> str:
 
 def compute_brown_frequencies() -> Tuple[Counter, Dict[str, str]]:
     """Get word frequencies and primary POS from the Brown corpus."""
+    from nltk.corpus import brown
+
     log.info("Computing Brown corpus frequencies and POS tags...")
     freq = Counter()
     pos_counts: Dict[str, Counter] = defaultdict(Counter)
@@ -165,8 +259,36 @@ def compute_brown_frequencies() -> Tuple[Counter, Dict[str, str]]:
     return freq, primary_pos
 
 
+def load_blended_frequencies(
+    brown_freq: Counter,
+    wn_words: Dict[str, dict],
+    source: Path,
+    fmt: str = "auto",
+    weight: float = 1.0,
+    jobs: int = 0,
+) -> Counter:
+    """Count an external frequency source over the WordNet candidates and blend it with Brown."""
+    from frequency_source import blend_frequencies, load_frequency_source
+
+    vocabulary = frozenset(wn_words)
+    external = load_frequency_source(source, fmt, vocabulary, Path("cache"), jobs)
+    covered = sum(1 for w in vocabulary if external.get(w))
+    log.info(f"  External frequencies cover {covered}/{len(vocabulary)} candidates "
+             f"(Brown: {sum(1 for w in vocabulary if brown_freq.get(w))})")
+    return blend_frequencies(brown_freq, external, weight, vocabulary)
+
+
+def load_cmu_dict() -> Dict[str, list]:
+    """Load the CMU Pronouncing Dictionary (word -> list of ARPAbet variants)."""
+    from nltk.corpus import cmudict
+
+    return cmudict.dict()
+
+
 def get_wordnet_words() -> Dict[str, dict]:
     """Get all single-word lemmas from WordNet with their metadata."""
+    from nltk.corpus import wordnet
+
     log.info("Extracting WordNet lemmas...")
     words: Dict[str, dict] = {}
 
@@ -198,6 +320,8 @@ def get_wordnet_words() -> Dict[str, dict]:
 
 def filter_to_base_forms(candidates: List[dict]) -> List[dict]:
     """Remove inflected forms where the base form is also a candidate."""
+    from nltk.corpus import wordnet
+
     log.info("Filtering inflected forms...")
     word_set = {c["word"] for c in candidates}
     filtered = []
@@ -206,7 +330,7 @@ def filter_to_base_forms(candidates: List[dict]) -> List[dict]:
     for c in candidates:
         word = c["word"]
         is_inflected = False
-        for pos in [wordnet.VERB, wordnet.NOUN, wordnet.ADJ, wordnet.ADV]:
+        for pos in [WN_VERB, WN_NOUN, WN_ADJ, WN_ADV]:
             base = wordnet.morphy(word, pos)
             if base and base != word and base in word_set:
                 is_inflected = True
@@ -222,20 +346,26 @@ def filter_to_base_forms(candidates: List[dict]) -> List[dict]:
 
 def select_words(
     wn_words: Dict[str, dict],
-    brown_freq: Counter,
+    word_freq: Counter,
     cmu_dict: Dict[str, list],
     count: int,
 ) -> List[dict]:
-    """Score, filter, and select the top N words."""
+    """Score, filter, and select the top N words.
+
+    `word_freq` is the ranking frequency: Brown counts, or the --freq-source
+    blend. Each item keeps it as "frequency".
+    """
+    from nltk.corpus import wordnet
+
     log.info(f"Scoring and selecting top {count} words...")
 
     # Use log-frequency to compress range (avoids top words dominating)
-    max_log = math.log(max(brown_freq.values()) + 1) if brown_freq else 1.0
+    max_log = math.log(max(word_freq.values()) + 1) if word_freq else 1.0
 
     scored = []
     for word, meta in wn_words.items():
-        bf = brown_freq.get(word, 0)
-        bf_norm = math.log(bf + 1) / max_log
+        freq = word_freq.get(word, 0)
+        freq_norm = math.log(freq + 1) / max_log
 
         # Polysemy score (more meanings = more common)
         poly_norm = min(meta["synset_count"] / 30.0, 1.0)
@@ -252,18 +382,18 @@ def select_words(
         else:
             len_bonus = -0.01
 
-        score = bf_norm * 0.60 + poly_norm * 0.35 + cmu_bonus + len_bonus
+        score = freq_norm * 0.60 + poly_norm * 0.35 + cmu_bonus + len_bonus
 
         scored.append({
             "word": word,
             "score": score,
-            "brown_freq": bf,
+            "frequency": freq,
             "synset_count": meta["synset_count"],
             "synsets": meta["synsets"],
         })
 
     # Sort by score descending
-    scored.sort(key=lambda x: x["score"], reverse=True)
+    scored.sort(key=lambda x: (-x["score"], x["word"]))  # ties by word: reproducible order
 
     # Take extra candidates then filter inflected forms
     overselect = min(int(count * 1.4), len(scored))
@@ -277,7 +407,7 @@ def select_words(
             if c["word"] not in existing:
                 # Quick base-form check
                 is_inflected = False
-                for pos in [wordnet.VERB, wordnet.NOUN, wordnet.ADJ]:
+                for pos in [WN_VERB, WN_NOUN, WN_ADJ]:
                     base = wordnet.morphy(c["word"], pos)
                     if base and base != c["word"] and base in existing:
                         is_inflected = True
@@ -298,10 +428,10 @@ def select_words(
 # CEFR assignment
 # ---------------------------------------------------------------------------
 
-def assign_cefr(rank: int) -> str:
-    """Assign CEFR level based on frequency rank (1-indexed)."""
-    for boundary, level in CEFR_BOUNDARIES:
-        if rank <= boundary:
+def assign_cefr(difficulty: float) -> str:
+    """Assign CEFR level based on difficulty percentile (0 = easiest, < 1)."""
+    for boundary, level in CEFR_QUANTILES:
+        if difficulty < boundary:
             return level
     return "C2"
 
@@ -314,20 +444,25 @@ def enrich_word(
     word_data: dict,
     cmu_dict: Dict[str, list],
     brown_pos: Dict[str, str],
+    ipa_table: Optional[Dict[str, List[str]]] = None,
 ) -> dict:
-    """Enrich a word with definition, POS, phonetic, examples, synonyms."""
+    """Enrich a word with definition, POS, phonetic, examples, synonyms.
+
+    `ipa_table` is the output of build_ipa_table(); without it the word's CMU
+    variants are transcoded on the fly.
+    """
     word = word_data["word"]
     synsets = word_data["synsets"]
 
     # --- Determine primary POS from Brown corpus, fallback to WordNet ---
     pos = brown_pos.get(word)
-    pos_to_wn = {"noun": wordnet.NOUN, "verb": wordnet.VERB, "adj": wordnet.ADJ, "adv": wordnet.ADV}
+    pos_to_wn = {"noun": WN_NOUN, "verb": WN_VERB, "adj": WN_ADJ, "adv": WN_ADV}
 
     # Reorder synsets: prefer synsets matching the Brown POS
     if pos and pos in pos_to_wn:
         target_wn = pos_to_wn[pos]
-        pos_synsets = [ss for ss in synsets if ss.pos() in (target_wn, wordnet.ADJ_SAT) or
-                       (target_wn == wordnet.ADJ and ss.pos() == wordnet.ADJ_SAT)]
+        pos_synsets = [ss for ss in synsets if ss.pos() in (target_wn, WN_ADJ_SAT) or
+                       (target_wn == WN_ADJ and ss.pos() == WN_ADJ_SAT)]
         other = [ss for ss in synsets if ss not in pos_synsets]
         synsets = pos_synsets + other if pos_synsets else synsets
 
@@ -351,11 +486,14 @@ def enrich_word(
         if len(examples) >= 3:
             break
 
-    # --- IPA pronunciation from CMU dict ---
-    phonetic = None
-    if word in cmu_dict:
-        phones = cmu_dict[word][0]  # first pronunciation variant
-        phonetic = arpabet_to_ipa(phones)
+    # --- IPA pronunciations from CMU dict (first variant is the primary) ---
+    if ipa_table is not None:
+        pronunciations = ipa_table.get(word, [])
+    elif word in cmu_dict:
+        pronunciations = list(dict.fromkeys(arpabet_to_ipa(p) for p in cmu_dict[word]))
+    else:
+        pronunciations = []
+    phonetic = pronunciations[0] if pronunciations else None
 
     # --- Synonyms and antonyms from WordNet ---
     synonyms = set()
@@ -390,41 +528,117 @@ def enrich_word(
         "definition": definition,
         "pos": pos,
         "phonetic": phonetic,
+        "pronunciations": pronunciations,
         "examples": examples,
         "metadata": json.dumps(metadata, ensure_ascii=False),
     }
 
 
+def enrich_words(
+    selected: List[dict],
+    cmu_dict: Dict[str, list],
+    brown_pos: Dict[str, str],
+    ipa_table: Optional[Dict[str, List[str]]] = None,
+    first_rank: int = 1,
+) -> List[dict]:
+    """Enrich selected words in rank order.
+
+    Difficulty and CEFR level come from difficulty.assign_difficulty(), which
+    must have scored `selected` first.
+    """
+    start_time = time.time()
+    enriched_words = []
+    METRICS.stage_started("enrich", len(selected))
+
+    for i, word_data in enumerate(selected, 1):
+        rank = first_rank + i - 1
+        enriched = enrich_word(word_data, cmu_dict, brown_pos, ipa_table)
+        enriched["cefr_level"] = word_data["cefr_level"]
+        enriched["difficulty"] = word_data["difficulty"]
+        enriched["frequency_rank"] = rank
+        enriched_words.append(enriched)
+        METRICS.advance("enrich")
+
+        if i % 1000 == 0:
+            elapsed = time.time() - start_time
+            log.info(f"  Enriched {i}/{len(selected)} words ({elapsed:.0f}s elapsed)")
+
+    return enriched_words
+
+
 # ---------------------------------------------------------------------------
 # Optional: Free Dictionary API enrichment
 # ---------------------------------------------------------------------------
 
+def api_cache_file(word: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{word}.json"
+
+
+def read_api_cache(word: str, cache_dir: Path) -> Tuple[bool, Optional[list]]:
+    """(hit, response) from the API cache.
+
+    A 404 is cached as {"not_found": true, "ts": ...} and is a hit (with no
+    response) for API_NOT_FOUND_TTL_DAYS. Older markers, and the bare [] that
+    earlier builds wrote for 404s, are misses so the word is asked for again.
+    """
+    cache_file = api_cache_file(word, cache_dir)
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return False, None
+    if isinstance(data, dict) and data.get("not_found"):
+        if time.time() - data.get("ts", 0) > API_NOT_FOUND_TTL_DAYS * 86400:
+            return False, None
+        data = None
+    elif not data:
+        return False, None
+    METRICS.inc("api_cache_hits_total")
+    return True, data
+
+
 def enrich_from_api(word: str, cache_dir: Path) -> Optional[dict]:
     """Fetch additional data from Free Dictionary API (dictionaryapi.dev)."""
     import requests
 
-    cache_file = cache_dir / f"{word}.json"
-    if cache_file.exists():
-        try:
-            return json.loads(cache_file.read_text())
-        except json.JSONDecodeError:
-            pass
+    hit, data = read_api_cache(word, cache_dir)
+    if hit:
+        return data
+    cache_file = api_cache_file(word, cache_dir)
 
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
-    try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 200:
-            data = resp.json()
-            cache_file.write_text(json.dumps(data, ensure_ascii=False))
-            return data
-        elif resp.status_code == 429:
-            log.warning(f"  Rate limited on '{word}', sleeping 5s...")
-            time.sleep(5)
-            return None
-        else:
+    for attempt in range(API_MAX_RETRIES + 1):
+        request_start = time.perf_counter()
+        try:
+            with METRICS.in_flight("api"):
+                resp = requests.get(url, timeout=10)
+            METRICS.observe("api_request_seconds", time.perf_counter() - request_start)
+            if resp.status_code == 200:
+                METRICS.inc("requests_total", kind="api", outcome="ok")
+                data = resp.json()
+                cache_file.write_text(json.dumps(data, ensure_ascii=False))
+                return data
+            elif resp.status_code == 404:
+                METRICS.inc("requests_total", kind="api", outcome="not_found")
+                # No entry; don't spend a request on it again until the marker expires
+                cache_file.write_text(json.dumps({"not_found": True, "ts": int(time.time())}))
+                return None
+            elif resp.status_code == 429:
+                METRICS.inc("requests_total", kind="api", outcome="rate_limited")
+                delay = API_RETRY_DELAY * 2 ** attempt
+                if attempt == API_MAX_RETRIES:
+                    log.warning(f"  Rate limited on '{word}', giving up after {API_MAX_RETRIES} retries")
+                    time.sleep(API_RETRY_DELAY)  # still back off before the next word
+                    return None
+                log.warning(f"  Rate limited on '{word}', retrying in {delay:.0f}s...")
+                time.sleep(delay)
+                METRICS.inc("retries_total", kind="api")
+            else:
+                METRICS.inc("requests_total", kind="api", outcome="error")
+                return None
+        except Exception as e:
+            METRICS.inc("requests_total", kind="api", outcome=request_outcome(e))
             return None
-    except Exception:
-        return None
+    return None
 
 
 def apply_api_enrichment(enriched: dict, api_data: list) -> dict:
@@ -466,6 +680,193 @@ def apply_api_enrichment(enriched: dict, api_data: list) -> dict:
     return enriched
 
 
+def enrich_words_from_api(
+    enriched_words: List[dict],
+    api_batch: int,
+    cache_dir: Path,
+) -> List[dict]:
+    """Merge Free Dictionary API data into words (only ranks <= api_batch if set)."""
+    cache_dir.mkdir(exist_ok=True)
+    start_time = time.time()
+    METRICS.stage_started("api_enrich", sum(
+        1 for w in enriched_words if api_batch == 0 or w["frequency_rank"] <= api_batch
+    ))
+
+    for i, enriched in enumerate(enriched_words, 1):
+        rank = enriched["frequency_rank"]
+        if api_batch == 0 or rank <= api_batch:
+            api_data = enrich_from_api(enriched["word"], cache_dir)
+            if api_data:
+                enriched_words[i - 1] = apply_api_enrichment(enriched, api_data)
+            METRICS.advance("api_enrich")
+            time.sleep(0.15)  # rate limit (~7 requests/sec)
+
+        if i % 1000 == 0:
+            elapsed = time.time() - start_time
+            log.info(f"  API-enriched {i}/{len(enriched_words)} words ({elapsed:.0f}s elapsed)")
+
+    return enriched_words
+
+
+def example_credit(count: int) -> float:
+    if count <= 0:
+        return 0.0
+    if count >= FULL_EXAMPLES:
+        return 1.0
+    return FIRST_EXAMPLE_CREDIT + (1 - FIRST_EXAMPLE_CREDIT) * (count - 1) / (FULL_EXAMPLES - 1)
+
+
+def score_completeness(word: dict) -> Dict[str, float]:
+    """Per-field completeness of an enriched word in [0, 1] (weighted by COMPLETENESS_WEIGHTS)."""
+    return {
+        "examples": example_credit(len(word.get("examples", []))),
+        "phonetic": 1.0 if word.get("phonetic") else 0.0,
+        "audio_url": 1.0 if word.get("audio_url") else 0.0,
+        "definition": min(len(word.get("definition") or ""), FULL_DEFINITION_CHARS) / FULL_DEFINITION_CHARS,
+    }
+
+
+def completeness(word: dict) -> float:
+    return sum(COMPLETENESS_WEIGHTS[f] * v for f, v in score_completeness(word).items())
+
+
+def coverage_summary(words: List[dict]) -> dict:
+    """Coverage percentages and mean completeness over a word list."""
+    total = max(len(words), 1)
+    return {
+        "example_coverage_pct": round(sum(1 for w in words if w.get("examples")) / total * 100, 2),
+        "phonetic_coverage_pct": round(sum(1 for w in words if w.get("phonetic")) / total * 100, 2),
+        "audio_url_coverage_pct": round(sum(1 for w in words if w.get("audio_url")) / total * 100, 2),
+        "mean_completeness": round(sum(completeness(w) for w in words) / total, 4),
+    }
+
+
+class FieldRates:
+    """Chance that an API response fills each missing field, per CEFR level.
+
+    Starts from API_FIELD_PRIORS and is updated from every fetched response, so
+    the queue learns e.g. that C2 words rarely come back with examples.
+    """
+
+    def __init__(self):
+        self.hits: Dict[Tuple[str, str], float] = defaultdict(float)
+        self.trials: Dict[Tuple[str, str], int] = defaultdict(int)
+
+    def rate(self, level: str, field: str) -> float:
+        key = (level, field)
+        prior = API_FIELD_PRIORS[field]
+        return (self.hits[key] + prior * PRIOR_STRENGTH) / (self.trials[key] + PRIOR_STRENGTH)
+
+    def observe(self, level: str, before: Dict[str, float], after: Dict[str, float]):
+        for field, value in before.items():
+            if value < 1.0:
+                self.trials[(level, field)] += 1
+                if after[field] > value:
+                    self.hits[(level, field)] += 1
+
+    def expected_gain(self, word: dict) -> float:
+        level = word.get("cefr_level", "B1")
+        fields = score_completeness(word)
+        gain = 0.0
+        for field, value in fields.items():
+            if value >= 1.0:
+                continue
+            # The API adds at most one example; it can replace the whole definition
+            if field == "examples":
+                delta = example_credit(len(word.get("examples", [])) + 1) - value
+            else:
+                delta = 1.0 - value
+            gain += COMPLETENESS_WEIGHTS[field] * delta * self.rate(level, field)
+        return gain
+
+
+def enrich_words_prioritized(
+    enriched_words: List[dict],
+    budget: int,
+    cache_dir: Path,
+    report_every: int = 100,
+) -> Tuple[List[dict], dict]:
+    """Spend at most `budget` API requests on the words with the largest expected gain.
+
+    Cached responses are free and applied to every word first. The remaining
+    words go into a max-heap keyed by expected completeness gain (FieldRates).
+    Priorities are re-checked lazily on pop, since rates change as responses
+    arrive. Returns the words and a coverage report: coverage after every
+    `report_every` requests and the gain per 100 requests.
+    """
+    cache_dir.mkdir(exist_ok=True)
+    start_time = time.time()
+    before = coverage_summary(enriched_words)
+
+    # Free pass: apply cached responses
+    cache_hits = 0
+    uncached: List[int] = []
+    for i, word in enumerate(enriched_words):
+        hit, api_data = read_api_cache(word["word"], cache_dir)
+        if hit:
+            if api_data:
+                enriched_words[i] = apply_api_enrichment(word, api_data)
+            cache_hits += 1
+        else:
+            uncached.append(i)
+    after_cache = coverage_summary(enriched_words)
+    log.info(f"  Applied {cache_hits} cached API responses; {len(uncached)} words uncached")
+
+    rates = FieldRates()
+    heap = [(-rates.expected_gain(enriched_words[i]), enriched_words[i]["frequency_rank"], i) for i in uncached]
+    heapq.heapify(heap)
+    METRICS.stage_started("api_enrich", min(budget, len(uncached)))
+
+    curve = [{"requests": 0, **after_cache}]
+    requests_made = 0
+    while heap and requests_made < budget:
+        neg_gain, rank, i = heapq.heappop(heap)
+        gain = rates.expected_gain(enriched_words[i])
+        if gain <= 0:
+            continue
+        if heap and gain < -heap[0][0] - 1e-12:
+            heapq.heappush(heap, (-gain, rank, i))  # stale priority; re-queue
+            continue
+
+        word = enriched_words[i]
+        fields_before = score_completeness(word)
+        api_data = enrich_from_api(word["word"], cache_dir)
+        requests_made += 1
+        METRICS.advance("api_enrich")
+        if api_data:
+            enriched_words[i] = apply_api_enrichment(word, api_data)
+        rates.observe(word.get("cefr_level", "B1"), fields_before, score_completeness(enriched_words[i]))
+        time.sleep(0.15)  # rate limit (~7 requests/sec)
+
+        if requests_made % report_every == 0:
+            curve.append({"requests": requests_made, **coverage_summary(enriched_words)})
+            log.info(f"  {requests_made}/{budget} requests: example coverage "
+                     f"{curve[-1]['example_coverage_pct']}%, completeness "
+                     f"{curve[-1]['mean_completeness']} ({time.time() - start_time:.0f}s elapsed)")
+
+    after = coverage_summary(enriched_words)
+    if curve[-1]["requests"] != requests_made:
+        curve.append({"requests": requests_made, **after})
+    per_100 = {
+        key: round((after[key] - after_cache[key]) / requests_made * 100, 4) if requests_made else 0.0
+        for key in after
+    }
+    report = {
+        "budget": budget,
+        "requests": requests_made,
+        "cache_hits": cache_hits,
+        "before": before,
+        "after_cache": after_cache,
+        "after": after,
+        "gain_per_100_requests": per_100,
+        "curve": curve,
+    }
+    log.info(f"  API enrichment: {requests_made} requests, example coverage "
+             f"{before['example_coverage_pct']}% -> {after['example_coverage_pct']}% "
+             f"(+{per_100['example_coverage_pct']} pts per 100 requests)")
+    return enriched_words, report
+
+
 # ---------------------------------------------------------------------------
 # Database generation
 # ---------------------------------------------------------------------------
@@ -477,11 +878,13 @@ CREATE TABLE IF NOT EXISTS word (
     definition TEXT NOT NULL,
     pos TEXT NOT NULL,
     cefr_level TEXT,
+    difficulty REAL,
     frequency_rank INTEGER,
     phonetic TEXT,
     audio_url TEXT,
     etymology TEXT,
-    metadata TEXT
+    metadata TEXT,
+    sample_ordinal INTEGER
 );
 
 CREATE TABLE IF NOT EXISTS word_example (
@@ -492,47 +895,156 @@ CREATE TABLE IF NOT EXISTS word_example (
     difficulty INTEGER
 );
 
-CREATE INDEX IF NOT EXISTS idx_word_cefr ON word(cefr_level);
+CREATE TABLE IF NOT EXISTS word_pronunciation (
+    word_id INTEGER NOT NULL REFERENCES word(id),
+    variant INTEGER NOT NULL,
+    phonetic TEXT NOT NULL,
+    PRIMARY KEY (word_id, variant)
+) WITHOUT ROWID;
+
+-- Contiguous sample_ordinal range per (cefr_level, pos); see build_sample_buckets()
+CREATE TABLE IF NOT EXISTS word_bucket (
+    cefr_level TEXT NOT NULL,
+    pos TEXT NOT NULL,
+    first_ordinal INTEGER NOT NULL,
+    word_count INTEGER NOT NULL,
+    PRIMARY KEY (cefr_level, pos)
+) WITHOUT ROWID;
+
+-- JSON values keyed by: config, inputs, row_counts, content_hash, ...
+CREATE TABLE IF NOT EXISTS build_manifest (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS word_related (
+    word_id INTEGER NOT NULL REFERENCES word(id),
+    rank INTEGER NOT NULL,
+    related_id INTEGER NOT NULL REFERENCES word(id),
+    score REAL NOT NULL,
+    PRIMARY KEY (word_id, rank)
+) WITHOUT ROWID;
+
+-- Inflected forms and US/UK spellings -> base word (see word_forms.py). The app
+-- resolves text it meets with WHERE form = ? after an exact word lookup misses;
+-- the NOCASE primary key serves that lookup directly.
+CREATE TABLE IF NOT EXISTS word_form (
+    form TEXT NOT NULL COLLATE NOCASE,
+    word_id INTEGER NOT NULL REFERENCES word(id),
+    kind TEXT NOT NULL,
+    PRIMARY KEY (form, word_id)
+) WITHOUT ROWID;
+
+-- Shared dictionary for compressed text (--compress; see text_codec.py). When it
+-- has a row, BLOB values in word.definition, word.metadata and
+-- word_example.sentence are compressed against it; TEXT values are plain.
+CREATE TABLE IF NOT EXISTS text_dictionary (
+    id INTEGER PRIMARY KEY,
+    codec TEXT NOT NULL,
+    dictionary BLOB NOT NULL
+);
+"""
+
+# Indexes for the app's queries (VocabRepositoryImpl / SrsRepositoryImpl), built
+# by finalize_database() after the bulk load:
+#   WHERE cefr_level = ? ORDER BY frequency_rank LIMIT ?, COUNT(*) WHERE cefr_level = ?
+#       -> idx_word_cefr_rank (no sort, stops at LIMIT; the count never touches the table)
+#   WHERE id NOT IN (SELECT word_id FROM srs_card) ORDER BY frequency_rank LIMIT ?
+#       -> idx_word_frequency (covering: index entries carry the rowid/id)
+#   WHERE id NOT IN (SELECT word_id FROM srs_card) ORDER BY difficulty LIMIT ?
+#       -> idx_word_difficulty (same, in difficulty order; levels are difficulty ranges)
+#   WHERE word = ? COLLATE NOCASE, WHERE word LIKE 'prefix%'
+#       -> idx_word_nocase (LIKE is case-insensitive, so only a NOCASE index serves it)
+#   WHERE id = ? / id IN (...) -> INTEGER PRIMARY KEY
+#   WHERE sample_ordinal IN (...) (random sampling) -> idx_word_sample
+INDEX_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS idx_word_sample ON word(sample_ordinal);
+CREATE INDEX IF NOT EXISTS idx_word_cefr_rank ON word(cefr_level, frequency_rank);
 CREATE INDEX IF NOT EXISTS idx_word_frequency ON word(frequency_rank);
-CREATE INDEX IF NOT EXISTS idx_word_pos ON word(pos);
+CREATE INDEX IF NOT EXISTS idx_word_difficulty ON word(difficulty);
+CREATE INDEX IF NOT EXISTS idx_word_nocase ON word(word COLLATE NOCASE);
 CREATE INDEX IF NOT EXISTS idx_example_word ON word_example(word_id);
 """
 
 
-def create_database(
-    output_path: Path,
-    words: List[dict],
-) -> Tuple[int, int]:
-    """Write enriched words to SQLite database. Returns (word_count, example_count)."""
-    log.info(f"Creating database at {output_path}...")
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    if output_path.exists():
-        output_path.unlink()
-
-    conn = sqlite3.connect(str(output_path))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA synchronous=NORMAL")
+def finalize_database(
+    path: Path,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    manifest: Optional[dict] = None,
+) -> str:
+    """Prepare a built DB for shipping as a read-mostly asset. Returns its sha256.
+
+    Builds the app-query indexes, gathers planner statistics, records the build
+    manifest (if given) and rewrites the file with VACUUM INTO at `page_size`.
+    The rewrite is compact and defragmented, in rollback-journal (DELETE) mode
+    with no -wal/-shm side files, and its bytes depend only on the logical
+    contents. That makes identical inputs produce a byte-identical file however
+    the rows got there (single process or shards, WAL, commit batching).
+    """
+    start_time = time.time()
+    size_before = path.stat().st_size
+    conn = sqlite3.connect(str(path))
+    conn.executescript(INDEX_SQL)
+    conn.execute("ANALYZE")
+    if manifest is not None:
+        write_build_manifest(conn, manifest)
+    conn.execute(f"PRAGMA page_size={int(page_size)}")
+
+    rewritten = path.with_name(path.name + ".vacuum")
+    if rewritten.exists():
+        rewritten.unlink()
+    conn.execute("VACUUM INTO ?", (str(rewritten),))
+    conn.close()
+    rewritten.replace(path)
+
+    digest = file_sha256(path)
+    log.info(f"  Finalized {path.name}: {size_before / 1024 / 1024:.2f} MB -> "
+             f"{path.stat().st_size / 1024 / 1024:.2f} MB "
+             f"(page size {page_size}) in {time.time() - start_time:.1f}s, sha256 {digest[:16]}")
+    return digest
+
+
+def open_new_database(path: Path, scratch: bool = False) -> sqlite3.Connection:
+    """Create an empty database with the vocabulary schema (replacing any file).
+
+    Scratch databases (shard fragments) skip journaling and fsync entirely.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    conn = sqlite3.connect(str(path))
+    if scratch:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+    else:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
     conn.executescript(SCHEMA_SQL)
+    return conn
 
+
+def insert_words(
+    conn: sqlite3.Connection,
+    words: List[dict],
+    first_id: int = 1,
+) -> Tuple[int, int]:
+    """Insert enriched words with ids first_id, first_id+1, ... Returns (word_count, example_count)."""
     word_count = 0
     example_count = 0
 
-    for i, w in enumerate(words, 1):
-        # Determine context difficulty from CEFR
-        cefr = w.get("cefr_level", "B1")
-        cefr_difficulty = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 5}
-
+    for i, w in enumerate(words, first_id):
         conn.execute(
-            """INSERT INTO word (id, word, definition, pos, cefr_level,
+            """INSERT INTO word (id, word, definition, pos, cefr_level, difficulty,
                frequency_rank, phonetic, audio_url, etymology, metadata)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 i,
                 w["word"],
                 w["definition"],
                 w["pos"],
-                cefr,
+                w.get("cefr_level", "B1"),
+                w.get("difficulty"),
                 w.get("frequency_rank", i),
                 w.get("phonetic"),
                 w.get("audio_url"),
@@ -542,21 +1054,104 @@ def create_database(
         )
         word_count += 1
 
-        # Insert example sentences
+        # Insert example sentences (difficulty is scored once all are in)
         for ex in w.get("examples", []):
             conn.execute(
                 """INSERT INTO word_example (word_id, sentence, context, difficulty)
-                   VALUES (?, ?, ?, ?)""",
-                (i, ex, "general", cefr_difficulty.get(cefr, 3)),
+                   VALUES (?, ?, ?, NULL)""",
+                (i, ex, "general"),
             )
             example_count += 1
 
-        if i % 1000 == 0:
+        # Insert all CMU pronunciation variants (variant 0 = primary)
+        conn.executemany(
+            "INSERT INTO word_pronunciation (word_id, variant, phonetic) VALUES (?, ?, ?)",
+            [(i, v, ipa) for v, ipa in enumerate(w.get("pronunciations", []))],
+        )
+
+        if word_count % 1000 == 0:
             conn.commit()
-            log.info(f"  Inserted {i}/{len(words)} words...")
+            log.info(f"  Inserted {word_count}/{len(words)} words...")
+
+    conn.commit()
+    return word_count, example_count
+
+
+def build_sample_buckets(conn: sqlite3.Connection) -> int:
+    """Number words densely by (cefr_level, pos, frequency_rank) and record bucket ranges.
 
+    Every (cefr_level, pos) bucket, every level and the whole table then cover
+    a contiguous sample_ordinal range, so the app can draw random ordinals in
+    [first_ordinal, first_ordinal + word_count) and fetch them with one indexed
+    IN (...) lookup instead of ORDER BY RANDOM(). Returns the bucket count.
+    """
+    ids = conn.execute(
+        "SELECT id FROM word ORDER BY cefr_level, pos, frequency_rank, id"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE word SET sample_ordinal = ? WHERE id = ?",
+        [(ordinal, word_id) for ordinal, (word_id,) in enumerate(ids)],
+    )
+    conn.execute("DELETE FROM word_bucket")
+    conn.execute(
+        """INSERT INTO word_bucket (cefr_level, pos, first_ordinal, word_count)
+           SELECT cefr_level, pos, MIN(sample_ordinal), COUNT(*)
+           FROM word GROUP BY cefr_level, pos"""
+    )
+    conn.commit()
+    return conn.execute("SELECT COUNT(*) FROM word_bucket").fetchone()[0]
+
+
+def insert_related(conn: sqlite3.Connection, related: Dict[int, List[Tuple[int, float]]]) -> int:
+    """Insert related-word lists ({word_id: [(related_id, score), ...]}). Returns the row count."""
+    rows = [
+        (word_id, rank, related_id, score)
+        for word_id, neighbors in sorted(related.items())
+        for rank, (related_id, score) in enumerate(neighbors, 1)
+    ]
+    conn.executemany(
+        "INSERT INTO word_related (word_id, rank, related_id, score) VALUES (?, ?, ?, ?)", rows,
+    )
     conn.commit()
-    conn.execute("PRAGMA optimize")
+    return len(rows)
+
+
+def insert_word_forms(conn: sqlite3.Connection, forms: List[Tuple[str, int, str]]) -> int:
+    """Insert word_form rows ([(form, word_id, kind), ...]). Returns the row count."""
+    conn.executemany("INSERT INTO word_form (form, word_id, kind) VALUES (?, ?, ?)", forms)
+    conn.commit()
+    return len(forms)
+
+
+def create_database(
+    output_path: Path,
+    words: List[dict],
+    related: Optional[Dict[int, List[Tuple[int, float]]]] = None,
+    compress: str = "",
+    forms: Optional[List[Tuple[str, int, str]]] = None,
+) -> Tuple[int, int]:
+    """Write enriched words to SQLite database. Returns (word_count, example_count).
+
+    With `compress` ("zstd" or "zlib"), definitions, examples and metadata are
+    stored dictionary-compressed (text_codec.compress_text_columns()). `forms`
+    are word_form rows from word_forms.compute_word_forms().
+    """
+    log.info(f"Creating database at {output_path}...")
+
+    from difficulty import score_example_difficulty
+
+    conn = open_new_database(output_path)
+    word_count, example_count = insert_words(conn, words)
+    log.info(f"  Scored difficulty for {score_example_difficulty(conn)} examples")
+    log.info(f"  Built {build_sample_buckets(conn)} sampling buckets")
+    if related:
+        log.info(f"  Inserted {insert_related(conn, related)} related-word rows")
+    if forms:
+        log.info(f"  Inserted {insert_word_forms(conn, forms)} word forms")
+    if compress:
+        from text_codec import compress_text_columns
+
+        compress_text_columns(conn, compress)
     conn.close()
 
     log.info(f"  Database created: {word_count} words, {example_count} examples")
@@ -564,64 +1159,561 @@ def create_database(
 
 
 # ---------------------------------------------------------------------------
-# Verification
+# Build manifest (reproducible builds)
 # ---------------------------------------------------------------------------
 
-def verify_database(db_path: Path) -> dict:
-    """Run verification queries and return statistics."""
-    conn = sqlite3.connect(str(db_path))
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def content_fingerprint(path: Path) -> str:
+    """Fingerprint a file or directory by content (portable across machines, unlike mtimes).
+
+    Files over LARGE_INPUT_BYTES are sampled: size plus the first and last MiB.
+    """
+    if not path.exists():
+        return "missing"
+    files = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    h = hashlib.sha256()
+    for f in files:
+        size = f.stat().st_size
+        h.update(f"{f.relative_to(path) if f != path else f.name}:{size}\n".encode())
+        if size > LARGE_INPUT_BYTES:
+            with open(f, "rb") as fh:
+                h.update(fh.read(1024 * 1024))
+                fh.seek(-1024 * 1024, os.SEEK_END)
+                h.update(fh.read())
+        else:
+            h.update(file_sha256(f).encode())
+    return h.hexdigest()
 
-    stats = {}
 
-    # Total words
-    stats["total_words"] = conn.execute("SELECT COUNT(*) FROM word").fetchone()[0]
+def nltk_corpus_path(name: str) -> Path:
+    """Resolve an NLTK corpus directory, or a placeholder if it isn't installed."""
+    import nltk
+
+    for candidate in (f"corpora/{name}", f"corpora/{name}.zip"):
+        try:
+            return Path(nltk.data.find(candidate))
+        except LookupError:
+            continue
+    return Path(f"<nltk:{name}>")
 
-    # CEFR distribution
-    rows = conn.execute(
-        "SELECT cefr_level, COUNT(*) FROM word GROUP BY cefr_level ORDER BY cefr_level"
-    ).fetchall()
-    stats["cefr_distribution"] = {r[0]: r[1] for r in rows}
 
-    # POS distribution
-    rows = conn.execute(
-        "SELECT pos, COUNT(*) FROM word GROUP BY pos ORDER BY COUNT(*) DESC"
+def make_build_manifest(config: dict) -> dict:
+    """Describe a build: pipeline version, content-affecting config and input fingerprints.
+
+    No timestamps, paths or source-file hashes.
+
+    `config` needs MANIFEST_CONFIG_KEYS plus "freq_source" (path or empty).
+    """
+    inputs = {f"nltk:{name}": content_fingerprint(nltk_corpus_path(name))
+              for name in ("brown", "cmudict", "wordnet")}
+    if config.get("freq_source"):
+        inputs["freq_source"] = content_fingerprint(Path(config["freq_source"]))
+    return {
+        "format": MANIFEST_FORMAT,
+        "pipeline_version": PIPELINE_VERSION,
+        "config": {k: config[k] for k in MANIFEST_CONFIG_KEYS},
+        "inputs": inputs,
+        "sqlite_version": sqlite3.sqlite_version,  # the file format bytes depend on it
+    }
+
+
+def database_content_hash(conn: sqlite3.Connection) -> Tuple[str, Dict[str, int]]:
+    """Hash every table's schema and rows in a canonical order. Returns (sha256, row counts).
+
+    build_manifest and SQLite's internal tables (sqlite_stat1, ...) are excluded.
+    """
+    tables = conn.execute(
+        """SELECT name, sql FROM sqlite_master WHERE type = 'table'
+           AND name NOT LIKE 'sqlite_%' AND name != 'build_manifest' ORDER BY name"""
     ).fetchall()
-    stats["pos_distribution"] = {r[0]: r[1] for r in rows}
-
-    # Example coverage
-    stats["total_examples"] = conn.execute(
-        "SELECT COUNT(*) FROM word_example"
-    ).fetchone()[0]
-    stats["words_with_examples"] = conn.execute(
-        "SELECT COUNT(DISTINCT word_id) FROM word_example"
-    ).fetchone()[0]
+    h = hashlib.sha256()
+    row_counts: Dict[str, int] = {}
+    for name, sql in tables:
+        h.update(f"{name}\n{sql}\n".encode())
+        columns = len(conn.execute(f"SELECT * FROM {name} LIMIT 0").description)
+        order = ", ".join(str(i) for i in range(1, columns + 1))
+        count = 0
+        for row in conn.execute(f"SELECT * FROM {name} ORDER BY {order}"):
+            h.update(repr(row).encode())
+            h.update(b"\n")
+            count += 1
+        row_counts[name] = count
+    return h.hexdigest(), row_counts
+
+
+def write_build_manifest(conn: sqlite3.Connection, manifest: dict):
+    """Store the manifest plus row counts and the content hash in build_manifest."""
+    content_hash, row_counts = database_content_hash(conn)
+    entries = {**manifest, "row_counts": row_counts, "content_hash": content_hash}
+    conn.execute("DELETE FROM build_manifest")
+    conn.executemany(
+        "INSERT INTO build_manifest (key, value) VALUES (?, ?)",
+        [(key, json.dumps(value, sort_keys=True)) for key, value in sorted(entries.items())],
+    )
+    conn.commit()
+
+
+def read_build_manifest(path: Path) -> dict:
+    """Read build_manifest from a DB ({} if the file or table is missing)."""
+    if not path.exists():
+        return {}
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute("SELECT key, value FROM build_manifest").fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    conn.close()
+    return {key: json.loads(value) for key, value in rows}
+
+
+def compare_builds(existing: Path, fresh: Path) -> bool:
+    """Print how a fresh build compares to the existing file. True if byte-identical."""
+    fresh_hash = file_sha256(fresh)
+    existing_hash = file_sha256(existing) if existing.exists() else "missing"
+    print(f"\nExisting: {existing_hash}  {existing}")
+    print(f"Fresh:    {fresh_hash}")
+    if existing_hash == fresh_hash:
+        print("MATCH: byte-identical")
+        return True
+
+    old, new = read_build_manifest(existing), read_build_manifest(fresh)
+    if old.get("content_hash") == new.get("content_hash"):
+        print("MISMATCH: same content, different bytes (SQLite version or page size?)")
+    else:
+        print("MISMATCH: content differs")
+    for key in sorted(set(old) | set(new)):
+        if old.get(key) != new.get(key):
+            if isinstance(new.get(key), dict) and isinstance(old.get(key), dict):
+                changed = sorted(k for k in set(old[key]) | set(new[key])
+                                 if old[key].get(k) != new[key].get(k))
+                print(f"  {key}: {', '.join(changed)}")
+            else:
+                print(f"  {key}: {old.get(key)!r} -> {new.get(key)!r}")
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Sharded build (large decks)
+# ---------------------------------------------------------------------------
+
+def _build_shard(task: dict) -> Tuple[int, int, int]:
+    """Enrich one rank range and write it to a shard DB (runs in a worker process).
+
+    Synsets are looked up again here rather than pickled across processes; the
+    lookup is the same wordnet.synsets(word) call get_wordnet_words() made.
+    """
+    from nltk.corpus import wordnet
+
+    selected = [{**item, "synsets": wordnet.synsets(item["word"])} for item in task["words"]]
+    enriched = enrich_words(
+        selected, {}, task["brown_pos"], task["ipa_table"], first_rank=task["first_rank"],
+    )
+
+    conn = open_new_database(Path(task["path"]), scratch=True)
+    word_count, example_count = insert_words(conn, enriched, first_id=task["first_rank"])
+    conn.close()
+    return task["index"], word_count, example_count
+
+
+def merge_shards(output_path: Path, shard_paths: List[Path]) -> Tuple[int, int]:
+    """Merge shard DBs (in rank order) into output_path with ATTACH + INSERT ... SELECT.
+
+    Word ids are global ranks already, so rows copy straight across. Example ids
+    are reassigned in shard order, which yields the same ids as a single-process
+    build.
+    """
+    conn = open_new_database(output_path)
+    tables = [
+        r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+
+    for path in shard_paths:
+        conn.execute("ATTACH DATABASE ? AS shard", (str(path),))
+        for table in tables:
+            if table == "word_example":
+                conn.execute(
+                    """INSERT INTO word_example (word_id, sentence, context, difficulty)
+                       SELECT word_id, sentence, context, difficulty
+                       FROM shard.word_example ORDER BY id"""
+                )
+            else:
+                conn.execute(f"INSERT INTO main.{table} SELECT * FROM shard.{table}")
+        conn.commit()
+        conn.execute("DETACH DATABASE shard")
+
+    word_count = conn.execute("SELECT COUNT(*) FROM word").fetchone()[0]
+    example_count = conn.execute("SELECT COUNT(*) FROM word_example").fetchone()[0]
+    conn.close()
+    return word_count, example_count
+
+
+def build_sharded_database(
+    output_path: Path,
+    selected: List[dict],
+    brown_pos: Dict[str, str],
+    ipa_table: Dict[str, List[str]],
+    shards: int,
+    jobs: int = 0,
+    work_dir: Optional[Path] = None,
+    related: Optional[Dict[int, List[Tuple[int, float]]]] = None,
+    compress: str = "",
+    forms: Optional[List[Tuple[str, int, str]]] = None,
+) -> Tuple[int, int]:
+    """Enrich and write `selected` as rank-range shards in parallel, then merge.
+
+    Each shard gets only the Brown POS and IPA entries for its own words, so the
+    per-task payload stays small. Returns (word_count, example_count).
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    work_dir = work_dir or output_path.parent / (output_path.name + ".shards")
+    work_dir.mkdir(parents=True, exist_ok=True)
+    shards = max(1, min(shards, len(selected)))
+    size = math.ceil(len(selected) / shards)
+
+    tasks = []
+    for index, start in enumerate(range(0, len(selected), size)):
+        chunk = selected[start:start + size]
+        words = [{k: v for k, v in c.items() if k != "synsets"} for c in chunk]
+        tasks.append({
+            "index": index,
+            "first_rank": start + 1,
+            "words": words,
+            "brown_pos": {c["word"]: brown_pos[c["word"]] for c in chunk if c["word"] in brown_pos},
+            "ipa_table": {c["word"]: ipa_table[c["word"]] for c in chunk if c["word"] in ipa_table},
+            "path": str(work_dir / f"shard_{index:04d}.db"),
+        })
+
+    workers = jobs or os.cpu_count() or 1
+    log.info(f"Building {len(tasks)} shards of up to {size} words with {workers} processes...")
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        METRICS.stage_started("enrich", len(selected))
+        for index, word_count, example_count in pool.map(_build_shard, tasks):
+            METRICS.advance("enrich", word_count)
+            log.info(f"  Shard {index + 1}/{len(tasks)}: {word_count} words, {example_count} examples")
+    log.info(f"  Shards built in {time.time() - start_time:.1f}s")
+
+    log.info(f"Merging shards into {output_path}...")
+    shard_paths = [Path(t["path"]) for t in tasks]
+    word_count, example_count = merge_shards(output_path, shard_paths)
+    for path in shard_paths:
+        path.unlink()
+    work_dir.rmdir()
+
+    # Example difficulty percentiles, sampling ordinals, related words, word forms
+    # and the text dictionary span shards, so they are built after the merge
+    from difficulty import score_example_difficulty
+
+    conn = sqlite3.connect(str(output_path))
+    log.info(f"  Scored difficulty for {score_example_difficulty(conn)} examples")
+    log.info(f"  Built {build_sample_buckets(conn)} sampling buckets")
+    if related:
+        log.info(f"  Inserted {insert_related(conn, related)} related-word rows")
+    if forms:
+        log.info(f"  Inserted {insert_word_forms(conn, forms)} word forms")
+    if compress:
+        from text_codec import compress_text_columns
+
+        compress_text_columns(conn, compress)
+    conn.close()
+
+    log.info(f"  Database created: {word_count} words, {example_count} examples")
+    return word_count, example_count
+
+
+# ---------------------------------------------------------------------------
+# Verification
+# ---------------------------------------------------------------------------
+
+# Verification checks, run in registration order by verify_database(). Each takes
+# (conn, stats) and adds its results to stats; new checks only need the decorator.
+VERIFY_CHECKS: List[Tuple[str, Callable[[sqlite3.Connection, dict], None]]] = []
+
+
+def verification_check(name: str):
+    """Register a verification check under `name`."""
+    def register(fn):
+        VERIFY_CHECKS.append((name, fn))
+        return fn
+    return register
+
+
+@verification_check("word_aggregates")
+def check_word_aggregates(conn: sqlite3.Connection, stats: dict):
+    """Word count, CEFR/POS distributions, phonetic coverage, empty definitions.
+
+    One scan with conditional sums for the known CEFR levels and POS tags; a
+    GROUP BY only runs if some rows carry a value outside those lists.
+    """
+    level_sums = ", ".join(f"SUM(cefr_level = '{level}')" for level in CEFR_LEVELS)
+    pos_sums = ", ".join(f"SUM(pos = '{p}')" for p in KNOWN_POS)
+    row = conn.execute(
+        f"""SELECT COUNT(*), SUM(phonetic IS NOT NULL),
+                   SUM(definition IS NULL OR TRIM(definition) = ''),
+                   {level_sums}, {pos_sums}
+            FROM word"""
+    ).fetchone()
+    total, with_phonetic, empty_definitions = (v or 0 for v in row[:3])
+    level_counts = [v or 0 for v in row[3:3 + len(CEFR_LEVELS)]]
+    pos_counts = [v or 0 for v in row[3 + len(CEFR_LEVELS):]]
+
+    if sum(level_counts) == total:
+        cefr = {level: n for level, n in zip(CEFR_LEVELS, level_counts) if n}
+    else:
+        cefr = dict(conn.execute(
+            "SELECT cefr_level, COUNT(*) FROM word GROUP BY cefr_level ORDER BY cefr_level"
+        ).fetchall())
+    if sum(pos_counts) == total:
+        pos = {p: n for p, n in zip(KNOWN_POS, pos_counts) if n}
+    else:
+        pos = dict(conn.execute("SELECT pos, COUNT(*) FROM word GROUP BY pos").fetchall())
+
+    stats["total_words"] = total
+    stats["cefr_distribution"] = cefr
+    stats["pos_distribution"] = dict(sorted(pos.items(), key=lambda kv: (-kv[1], kv[0])))
+    stats["words_with_phonetic"] = with_phonetic
+    stats["phonetic_coverage_pct"] = round(with_phonetic / max(total, 1) * 100, 1)
+    stats["empty_definitions"] = empty_definitions
+
+
+@verification_check("example_aggregates")
+def check_example_aggregates(conn: sqlite3.Connection, stats: dict):
+    """Example count and coverage, duplicate sentences, orphan rows (one pass)."""
+    row = conn.execute(
+        """SELECT COALESCE(SUM(n), 0),
+                  COUNT(DISTINCT CASE WHEN NOT orphan THEN word_id END),
+                  COALESCE(SUM(n - 1), 0),
+                  COALESCE(SUM(CASE WHEN orphan THEN n ELSE 0 END), 0)
+           FROM (
+               SELECT word_id, COUNT(*) AS n,
+                      word_id NOT IN (SELECT id FROM word) AS orphan
+               FROM word_example GROUP BY word_id, sentence
+           )"""
+    ).fetchone()
+    stats["total_examples"], stats["words_with_examples"] = row[0], row[1]
     stats["example_coverage_pct"] = round(
         stats["words_with_examples"] / max(stats["total_words"], 1) * 100, 1
     )
+    stats["duplicate_examples"] = row[2]
+    stats["orphan_examples"] = row[3]
+
+
+@verification_check("pronunciations")
+def check_pronunciations(conn: sqlite3.Connection, stats: dict):
+    """Pronunciation variant counts from word_pronunciation."""
+    row = conn.execute(
+        """SELECT COUNT(*), COUNT(DISTINCT CASE WHEN variant > 0 THEN word_id END)
+           FROM word_pronunciation"""
+    ).fetchone()
+    stats["total_pronunciations"] = row[0]
+    stats["words_with_alt_pronunciations"] = row[1]
+
+
+@verification_check("difficulty")
+def check_difficulty(conn: sqlite3.Connection, stats: dict):
+    """Unscored words/examples, and CEFR levels whose difficulty ranges overlap.
+
+    Levels are difficulty quantiles, so each level's range must end below the
+    next level's start.
+    """
+    row = conn.execute(
+        """SELECT (SELECT COUNT(*) FROM word WHERE difficulty IS NULL),
+                  (SELECT COUNT(*) FROM word_example WHERE difficulty IS NULL)"""
+    ).fetchone()
+    stats["unscored_words"] = row[0]
+    stats["unscored_examples"] = row[1]
+    ranges = {
+        level: (low, high) for level, low, high in conn.execute(
+            "SELECT cefr_level, MIN(difficulty), MAX(difficulty) FROM word "
+            "WHERE difficulty IS NOT NULL GROUP BY cefr_level"
+        )
+    }
+    present = [level for level in CEFR_LEVELS if level in ranges]
+    stats["difficulty_level_overlaps"] = sum(
+        1 for a, b in zip(present, present[1:]) if ranges[a][1] >= ranges[b][0]
+    )
+    stats["example_difficulty_distribution"] = dict(
+        conn.execute(
+            "SELECT difficulty, COUNT(*) FROM word_example WHERE difficulty IS NOT NULL "
+            "GROUP BY difficulty ORDER BY difficulty"
+        ).fetchall()
+    )
 
-    # Phonetic coverage
-    stats["words_with_phonetic"] = conn.execute(
-        "SELECT COUNT(*) FROM word WHERE phonetic IS NOT NULL"
-    ).fetchone()[0]
-    stats["phonetic_coverage_pct"] = round(
-        stats["words_with_phonetic"] / max(stats["total_words"], 1) * 100, 1
+
+@verification_check("related_words")
+def check_related_words(conn: sqlite3.Connection, stats: dict):
+    """Related-word coverage and rows pointing at missing or self word ids."""
+    row = conn.execute(
+        """SELECT COUNT(*), COUNT(DISTINCT word_id),
+                  COALESCE(SUM(related_id = word_id
+                               OR related_id NOT IN (SELECT id FROM word)), 0)
+           FROM word_related"""
+    ).fetchone()
+    stats["total_related"] = row[0]
+    stats["words_with_related"] = row[1]
+    stats["invalid_related"] = row[2]
+
+
+@verification_check("word_forms")
+def check_word_forms(conn: sqlite3.Connection, stats: dict):
+    """Word form counts by kind, rows pointing at missing words, and forms that shadow a word."""
+    row = conn.execute(
+        """SELECT COUNT(*), COUNT(DISTINCT word_id),
+                  COALESCE(SUM(word_id NOT IN (SELECT id FROM word)), 0),
+                  COALESCE(SUM(form IN (SELECT word FROM word)), 0)
+           FROM word_form"""
+    ).fetchone()
+    stats["total_word_forms"] = row[0]
+    stats["words_with_forms"] = row[1]
+    stats["invalid_word_forms"] = row[2]
+    stats["shadowing_word_forms"] = row[3]
+    stats["word_forms_by_kind"] = dict(
+        conn.execute("SELECT kind, COUNT(*) FROM word_form GROUP BY kind ORDER BY kind").fetchall()
     )
 
-    # File size
-    stats["file_size_mb"] = round(db_path.stat().st_size / (1024 * 1024), 2)
 
-    # Sample words per CEFR level
+@verification_check("sample_buckets")
+def check_sample_buckets(conn: sqlite3.Connection, stats: dict):
+    """sample_ordinal is a dense 0..n-1 numbering and word_bucket ranges match it.
+
+    Buckets must tile the ordinals without gaps or overlaps, each level's buckets
+    must be adjacent, and every range must hold exactly that bucket's words.
+    """
+    total, distinct, low, high = conn.execute(
+        "SELECT COUNT(*), COUNT(DISTINCT sample_ordinal), MIN(sample_ordinal), MAX(sample_ordinal) FROM word"
+    ).fetchone()
+    dense = total == 0 or (distinct == total and low == 0 and high == total - 1)
+
+    buckets = conn.execute(
+        """SELECT b.cefr_level, b.first_ordinal, b.word_count,
+                  COUNT(w.id), MIN(w.sample_ordinal), MAX(w.sample_ordinal)
+           FROM word_bucket b
+           LEFT JOIN word w ON w.cefr_level = b.cefr_level AND w.pos = b.pos
+           GROUP BY b.cefr_level, b.pos
+           ORDER BY b.first_ordinal"""
+    ).fetchall()
+    errors = 0
+    expected_first = 0
+    levels_seen: List[str] = []
+    for level, first, count, actual, w_min, w_max in buckets:
+        if first != expected_first or actual != count or w_min != first or w_max != first + count - 1:
+            errors += 1
+        if level in levels_seen and levels_seen[-1] != level:
+            errors += 1  # level split into non-adjacent ranges
+        if not levels_seen or levels_seen[-1] != level:
+            levels_seen.append(level)
+        expected_first = first + count
+    if expected_first != total:
+        errors += 1
+
+    stats["total_buckets"] = len(buckets)
+    stats["sample_ordinals_dense"] = dense
+    stats["bucket_errors"] = errors
+
+
+@verification_check("build_manifest")
+def check_build_manifest(conn: sqlite3.Connection, stats: dict):
+    """Compare the DB with its embedded manifest.
+
+    By default only the manifest's per-table row counts are checked (one COUNT(*)
+    per table). The content hash is recomputed, a full pass over every table,
+    only with --full-verify.
+    """
+    try:
+        manifest = dict(conn.execute(
+            "SELECT key, value FROM build_manifest WHERE key IN ('content_hash', 'row_counts')"
+        ).fetchall())
+    except sqlite3.OperationalError:
+        manifest = {}
+    stats["content_hash"] = json.loads(manifest["content_hash"]) if "content_hash" in manifest else None
+    stats["content_hash_checked"] = bool(stats["full_verify"] and stats["content_hash"])
+    if stats["content_hash"] is None:
+        stats["content_hash_ok"] = None
+    elif stats["content_hash_checked"]:
+        stats["content_hash_ok"] = database_content_hash(conn)[0] == stats["content_hash"]
+    else:
+        row_counts = json.loads(manifest.get("row_counts", "{}"))
+        stats["content_hash_ok"] = all(
+            conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == count
+            for table, count in row_counts.items()
+        )
+
+
+@verification_check("text_compression")
+def check_text_compression(conn: sqlite3.Connection, stats: dict):
+    """Compression ratio and per-row decode latency of compressed text columns.
+
+    Decodes the first VERIFY_SAMPLE_ROWS rows of each column, or every value with
+    --full-verify; values that fail to decode are counted either way.
+    """
+    from text_codec import VERIFY_SAMPLE_ROWS, TextCodec, measure_columns
+
+    text_codec = TextCodec.from_connection(conn)
+    stats["text_codec"] = text_codec.codec if text_codec else None
+    if text_codec is None:
+        return
+    stats["text_sample_rows"] = None if stats["full_verify"] else VERIFY_SAMPLE_ROWS
+    measured = measure_columns(conn, text_codec, stats["text_sample_rows"])
+    raw = sum(c["raw_bytes"] for c in measured["columns"].values())
+    stored = sum(c["stored_bytes"] for c in measured["columns"].values())
+    if stats["text_sample_rows"] is None:
+        stored += len(text_codec.dictionary)  # a sample can't carry the whole dictionary
+    stats["text_dictionary_bytes"] = len(text_codec.dictionary)
+    stats["text_raw_bytes"] = raw
+    stats["text_stored_bytes"] = stored
+    stats["text_compression_ratio"] = round(raw / max(stored, 1), 2)
+    stats["text_columns"] = measured["columns"]
+    stats["text_decode_errors"] = measured["decode_errors"]
+    stats["text_decode_us_median"] = measured["decode_us_median"]
+    stats["text_decode_us_p95"] = measured["decode_us_p95"]
+
+
+@verification_check("samples")
+def check_samples(conn: sqlite3.Connection, stats: dict):
+    """First 5 words per CEFR level (indexed LIMIT lookups, not a scan)."""
+    from text_codec import TextCodec
+
+    text_codec = TextCodec.from_connection(conn)
     stats["samples"] = {}
-    for level in ["A1", "A2", "B1", "B2", "C1", "C2"]:
+    for level in CEFR_LEVELS:
         rows = conn.execute(
             "SELECT word, definition, pos FROM word WHERE cefr_level = ? "
             "ORDER BY frequency_rank LIMIT 5",
             (level,),
         ).fetchall()
         stats["samples"][level] = [
-            {"word": r[0], "definition": r[1], "pos": r[2]} for r in rows
+            {"word": r[0], "definition": text_codec.decode(r[1]) if text_codec else r[1], "pos": r[2]}
+            for r in rows
         ]
 
+
+def verify_database(db_path: Path, full: bool = False) -> dict:
+    """Run all registered verification checks and return statistics.
+
+    `full` (--full-verify) lets checks make whole-DB passes they skip by
+    default, such as recomputing the content hash.
+    """
+    conn = sqlite3.connect(str(db_path))
+
+    stats: dict = {"check_timings_ms": {}, "full_verify": full}
+    for name, check in VERIFY_CHECKS:
+        start = time.perf_counter()
+        check(conn, stats)
+        stats["check_timings_ms"][name] = round((time.perf_counter() - start) * 1000, 2)
+
+    # File size
+    stats["file_size_mb"] = round(db_path.stat().st_size / (1024 * 1024), 2)
+
     conn.close()
     return stats
 
@@ -636,11 +1728,46 @@ def print_report(stats: dict):
     print(f"Total examples:        {stats['total_examples']:,}")
     print(f"Example coverage:      {stats['example_coverage_pct']}%")
     print(f"Phonetic coverage:     {stats['phonetic_coverage_pct']}%")
+    print(f"Pronunciations:        {stats['total_pronunciations']:,} "
+          f"({stats['words_with_alt_pronunciations']:,} words with variants)")
     print(f"Database size:         {stats['file_size_mb']} MB")
+    print(f"Empty definitions:     {stats['empty_definitions']:,}")
+    print(f"Duplicate examples:    {stats['duplicate_examples']:,}")
+    print(f"Orphan examples:       {stats['orphan_examples']:,}")
+    print(f"Sampling buckets:      {stats['total_buckets']:,} "
+          f"(ordinals {'dense' if stats['sample_ordinals_dense'] else 'NOT dense'}, "
+          f"{stats['bucket_errors']:,} range errors)")
+    if stats["content_hash"]:
+        compared = "content" if stats["content_hash_checked"] else "row counts"
+        status = "match manifest" if stats["content_hash_ok"] else "DO NOT match manifest"
+        print(f"Content hash:          {stats['content_hash'][:16]} ({compared} {status})")
+    else:
+        print("Content hash:          no build manifest")
+    examples = ", ".join(f"{d}: {n:,}" for d, n in stats["example_difficulty_distribution"].items())
+    print(f"Difficulty:            {stats['unscored_words']:,} unscored words, "
+          f"{stats['difficulty_level_overlaps']:,} overlapping levels; examples {examples or 'none'} "
+          f"({stats['unscored_examples']:,} unscored)")
+    print(f"Related words:         {stats['total_related']:,} "
+          f"({stats['words_with_related']:,} words, {stats['invalid_related']:,} invalid)")
+    kinds = ", ".join(f"{n:,} {k}" for k, n in stats["word_forms_by_kind"].items())
+    print(f"Word forms:            {stats['total_word_forms']:,} "
+          f"({kinds + '; ' if kinds else ''}{stats['words_with_forms']:,} words, "
+          f"{stats['invalid_word_forms']:,} invalid, {stats['shadowing_word_forms']:,} shadowing a word)")
+    if stats["text_codec"]:
+        sample = (f"; first {stats['text_sample_rows']:,} rows per column, --full-verify for all"
+                  if stats["text_sample_rows"] else "")
+        print(f"Text compression:      {stats['text_codec']}, "
+              f"{stats['text_raw_bytes'] / 1024 / 1024:.2f} MB -> {stats['text_stored_bytes'] / 1024 / 1024:.2f} MB "
+              f"({stats['text_compression_ratio']}x {'excl.' if stats['text_sample_rows'] else 'incl.'} "
+              f"{stats['text_dictionary_bytes'] / 1024:.1f} KB dictionary)")
+        print(f"Text decode per row:   {stats['text_decode_us_median']} us median, "
+              f"{stats['text_decode_us_p95']} us p95 ({stats['text_decode_errors']:,} errors{sample})")
+    else:
+        print("Text compression:      off")
 
     print("\nCEFR Level Distribution:")
     total = stats["total_words"]
-    for level in ["A1", "A2", "B1", "B2", "C1", "C2"]:
+    for level in CEFR_LEVELS:
         count = stats["cefr_distribution"].get(level, 0)
         pct = count / total * 100 if total else 0
         bar = "#" * int(pct / 2)
@@ -652,13 +1779,17 @@ def print_report(stats: dict):
         print(f"  {pos:<6}: {count:>5} ({pct:>5.1f}%)")
 
     print("\nSample Words:")
-    for level in ["A1", "A2", "B1", "B2", "C1", "C2"]:
+    for level in CEFR_LEVELS:
         samples = stats["samples"].get(level, [])
         print(f"\n  [{level}]")
         for s in samples[:3]:
             defn = s["definition"][:60] + "..." if len(s["definition"]) > 60 else s["definition"]
             print(f"    {s['word']:<20} ({s['pos']}) - {defn}")
 
+    print("\nCheck Timings:")
+    for name, ms in stats["check_timings_ms"].items():
+        print(f"  {name:<20} {ms:>9.2f} ms")
+
     print("\n" + "=" * 70)
 
     # Check pass/fail criteria
@@ -667,6 +1798,20 @@ def print_report(stats: dict):
     checks.append(("Example coverage >= 60%", stats["example_coverage_pct"] >= 60))
     checks.append(("Database size < 10 MB", stats["file_size_mb"] < 10))
     checks.append(("All CEFR levels present", len(stats["cefr_distribution"]) == 6))
+    checks.append(("No empty definitions", stats["empty_definitions"] == 0))
+    checks.append(("No duplicate examples", stats["duplicate_examples"] == 0))
+    checks.append(("No orphan examples", stats["orphan_examples"] == 0))
+    checks.append(("Sampling buckets contiguous",
+                   stats["sample_ordinals_dense"] and stats["bucket_errors"] == 0))
+    checks.append(("Content matches build manifest", stats["content_hash_ok"] is not False))
+    checks.append(("Levels follow difficulty",
+                   stats["unscored_words"] == 0 and stats["unscored_examples"] == 0
+                   and stats["difficulty_level_overlaps"] == 0))
+    checks.append(("No invalid related words", stats["invalid_related"] == 0))
+    checks.append(("Word forms resolve to words",
+                   stats["invalid_word_forms"] == 0 and stats["shadowing_word_forms"] == 0))
+    if stats["text_codec"]:
+        checks.append(("Compressed text decodes", stats["text_decode_errors"] == 0))
 
     a1a2 = stats["cefr_distribution"].get("A1", 0) + stats["cefr_distribution"].get("A2", 0)
     b1b2 = stats["cefr_distribution"].get("B1", 0) + stats["cefr_distribution"].get("B2", 0)
@@ -718,12 +1863,91 @@ def main():
         default=0,
         help="Only enrich words in this rank range batch (e.g., 1000 = words 1-1000)",
     )
+    parser.add_argument(
+        "--api-budget",
+        type=int,
+        default=0,
+        help="Spend at most N API requests on the words with the largest expected "
+             "completeness gain (instead of --api-batch rank order)",
+    )
     parser.add_argument(
         "--report-only",
         action="store_true",
         help="Only run verification on existing database",
     )
+    parser.add_argument(
+        "--full-verify",
+        action="store_true",
+        help="Also recompute the content hash during verification (a full pass over every table)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Build into a temp dir and compare its hash with the existing --output (file untouched)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Enrich and write the DB as N rank-range shards in parallel, then merge "
+             "(for large decks; 0 = single process)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=0,
+        help="Worker processes for --shards, --freq-source and --related (default: all cores)",
+    )
+    parser.add_argument(
+        "--related",
+        type=int,
+        default=DEFAULT_RELATED_K,
+        help=f"Related words to precompute per word (default: {DEFAULT_RELATED_K}, 0 = skip)",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"SQLite page size of the shipped DB (default: {DEFAULT_PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--compress",
+        default="",
+        choices=["", "zstd", "zlib"],
+        help="Store definitions, examples and metadata compressed against a shared dictionary. "
+             "NOT app-compatible yet (the app has no decoder): needs an --output outside the app sources",
+    )
+    parser.add_argument(
+        "--freq-source",
+        help="Large local corpus (plain text) or word/count file to rank words by",
+    )
+    parser.add_argument(
+        "--freq-format",
+        default="auto",
+        choices=["auto", "text", "counts"],
+        help="Format of --freq-source (default: by extension, .tsv/.csv/.freq/.counts = counts)",
+    )
+    parser.add_argument(
+        "--freq-weight",
+        type=float,
+        default=1.0,
+        help="Weight of --freq-source vs. Brown when blending (1.0 = replace Brown)",
+    )
+    add_metrics_arguments(parser)
     args = parser.parse_args()
+    start_from_args(args)
+
+    if args.shards > 1 and args.enrich_api:
+        parser.error("--enrich-api is rate-limited and sequential; it can't be combined with --shards")
+    if args.compress:
+        from text_codec import check_app_output, require_codec
+
+        try:
+            require_codec(args.compress)
+            if not args.report_only:
+                check_app_output(Path(args.output))
+        except RuntimeError as e:
+            parser.error(str(e))
 
     output_path = Path(args.output)
 
@@ -732,10 +1956,17 @@ def main():
         if not output_path.exists():
             log.error(f"Database not found at {output_path}")
             sys.exit(1)
-        stats = verify_database(output_path)
+        stats = verify_database(output_path, args.full_verify)
         print_report(stats)
         sys.exit(0)
 
+    # --check builds into a scratch directory and leaves --output untouched
+    build_path = output_path
+    if args.check:
+        import tempfile
+
+        build_path = Path(tempfile.mkdtemp(prefix="vocabquest-check-")) / output_path.name
+
     start_time = time.time()
     log.info("=" * 50)
     log.info("EigoQuest Vocabulary Database Generator")
@@ -745,50 +1976,91 @@ def main():
     log.info("\n--- Phase 1: Loading data sources ---")
     brown_freq, brown_pos = compute_brown_frequencies()
 
-    cmu_entries = cmudict.dict()
-    log.info(f"CMU Pronouncing Dictionary: {len(cmu_entries)} entries")
+    cmu_entries = load_cmu_dict()
+    ipa_table = build_ipa_table(cmu_entries)
 
     wn_words = get_wordnet_words()
 
+    word_freq = brown_freq
+    if args.freq_source:
+        word_freq = load_blended_frequencies(
+            brown_freq, wn_words, Path(args.freq_source), args.freq_format,
+            args.freq_weight, args.jobs,
+        )
+
     # Phase 2: Select and rank words
     log.info("\n--- Phase 2: Selecting words ---")
-    selected = select_words(wn_words, brown_freq, cmu_entries, args.count)
+    selected = select_words(wn_words, word_freq, cmu_entries, args.count)
 
-    # Phase 3: Enrich words
-    log.info("\n--- Phase 3: Enriching words ---")
-    enriched_words = []
-    cache_dir = Path("cache")
-    cache_dir.mkdir(exist_ok=True)
+    from difficulty import assign_difficulty, attested_lemmas
 
-    for i, word_data in enumerate(selected, 1):
-        rank = i
-        cefr = assign_cefr(rank)
+    attested = set(brown_freq) | set(cmu_entries)
+    selected = assign_difficulty(selected, cmu_entries, attested_lemmas(wn_words, attested), CEFR_QUANTILES)
 
-        enriched = enrich_word(word_data, cmu_entries, brown_pos)
-        enriched["cefr_level"] = cefr
-        enriched["frequency_rank"] = rank
+    related = None
+    if args.related > 0:
+        from related_words import compute_related_words
 
-        # Optional API enrichment
-        if args.enrich_api:
-            if args.api_batch == 0 or rank <= args.api_batch:
-                api_data = enrich_from_api(word_data["word"], cache_dir)
-                if api_data:
-                    enriched = apply_api_enrichment(enriched, api_data)
-                time.sleep(0.15)  # rate limit (~7 requests/sec)
+        related = compute_related_words(selected, args.related, jobs=args.jobs)
 
-        enriched_words.append(enriched)
+    from word_forms import compute_word_forms
 
-        if i % 1000 == 0:
-            elapsed = time.time() - start_time
-            log.info(f"  Enriched {i}/{len(selected)} words ({elapsed:.0f}s elapsed)")
+    forms = compute_word_forms(selected, wn_words, attested)
+
+    if args.shards > 1:
+        # Phase 3+4: Enrich and write shards in parallel, then merge
+        log.info("\n--- Phase 3+4: Sharded enrichment and database build ---")
+        word_count, example_count = build_sharded_database(
+            build_path, selected, brown_pos, ipa_table, args.shards, args.jobs,
+            related=related, compress=args.compress, forms=forms,
+        )
+    else:
+        # Phase 3: Enrich words
+        log.info("\n--- Phase 3: Enriching words ---")
+        enriched_words = enrich_words(selected, cmu_entries, brown_pos, ipa_table)
+
+        # Optional API enrichment
+        if args.enrich_api and args.api_budget > 0:
+            enriched_words, api_report = enrich_words_prioritized(
+                enriched_words, args.api_budget, Path("cache"),
+            )
+            with open(DEFAULT_API_REPORT, "w") as f:
+                json.dump(api_report, f, indent=2)
+            log.info(f"API coverage report saved to {DEFAULT_API_REPORT}")
+        elif args.enrich_api:
+            enriched_words = enrich_words_from_api(enriched_words, args.api_batch, Path("cache"))
+
+        # Phase 4: Generate database
+        log.info("\n--- Phase 4: Generating database ---")
+        word_count, example_count = create_database(
+            build_path, enriched_words, related, args.compress, forms=forms,
+        )
 
-    # Phase 4: Generate database
-    log.info("\n--- Phase 4: Generating database ---")
-    word_count, example_count = create_database(output_path, enriched_words)
+    log.info("\n--- Phase 4b: Finalizing database ---")
+    manifest = make_build_manifest({
+        "count": args.count,
+        "enrich_api": args.enrich_api,
+        "api_batch": args.api_batch,
+        "api_budget": args.api_budget,
+        "freq_source": args.freq_source or "",
+        "freq_format": args.freq_format,
+        "freq_weight": args.freq_weight,
+        "related": args.related,
+        "page_size": args.page_size,
+        "compress": args.compress,
+    })
+    finalize_database(build_path, args.page_size, manifest)
+
+    if args.check:
+        import shutil
+
+        identical = compare_builds(output_path, build_path)
+        shutil.rmtree(build_path.parent)
+        sys.exit(0 if identical else 1)
 
     # Phase 5: Verification
     log.info("\n--- Phase 5: Verification ---")
-    stats = verify_database(output_path)
+    stats = verify_database(output_path, args.full_verify)
     all_pass = print_report(stats)
 
     elapsed = time.time() - start_time
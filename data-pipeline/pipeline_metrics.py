@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Pipeline Metrics
+
+In-process metrics for long pipeline runs: items/s, progress and ETA per stage,
+in-flight requests, request outcomes (ok / not_found / rate_limited / error), retries
+and latency histograms for TTS, ffmpeg encodes and API requests.
+
+The progress loops in generate_audio.generate_batch() / generate_matrix() and
+generate_vocab_db.enrich_words() / the API enrichment report into the module-
+level METRICS registry. Collection is a few dict updates under a lock; nothing
+is exposed unless asked for:
+
+  --metrics-port N     serve Prometheus text on http://127.0.0.1:N/metrics
+                       (and JSON on /metrics.json)
+  --metrics-file PATH  rewrite a JSON snapshot every --metrics-interval seconds
+
+Usage:
+    cd data-pipeline
+    python generate_audio.py --metrics-port 9108
+    python generate_vocab_db.py --enrich-api --metrics-file metrics.json
+    curl -s localhost:9108/metrics | grep vocabquest_stage
+
+License: Internal (JWorks)
+"""
+
+import atexit
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+PREFIX = "vocabquest"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_INTERVAL = 5.0
+DEFAULT_HOST = "127.0.0.1"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": {str(b): c for b, c in zip(self.buckets, self.counts)},
+        }
+
+
+class PipelineMetrics:
+    """Thread-safe counters, gauges, histograms and per-stage progress."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.stages: Dict[str, dict] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.gauges: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+
+    # --- progress ---
+
+    def stage_started(self, stage: str, total: int):
+        with self.lock:
+            self.stages[stage] = {"total": total, "done": 0, "failed": 0, "started": time.time()}
+
+    def advance(self, stage: str, n: int = 1, failed: bool = False):
+        with self.lock:
+            progress = self.stages.setdefault(
+                stage, {"total": 0, "done": 0, "failed": 0, "started": time.time()},
+            )
+            progress["done"] += n
+            if failed:
+                progress["failed"] += n
+
+    # --- counters, gauges, histograms ---
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels: str):
+        with self.lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def in_flight(self, kind: str):
+        """Count a request as in flight for the duration of the block."""
+        key = ("in_flight", (("kind", kind),))
+        with self.lock:
+            self.gauges[key] = self.gauges.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.gauges[key] -= 1
+
+    # --- export ---
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        with self.lock:
+            stages = {}
+            for name, p in self.stages.items():
+                elapsed = now - p["started"]
+                rate = p["done"] / elapsed if elapsed > 0 else 0.0
+                remaining = max(p["total"] - p["done"], 0)
+                stages[name] = {
+                    "done": p["done"],
+                    "total": p["total"],
+                    "failed": p["failed"],
+                    "items_per_sec": round(rate, 3),
+                    "eta_seconds": round(remaining / rate, 1) if rate > 0 and p["total"] else None,
+                    "elapsed_seconds": round(elapsed, 1),
+                }
+            return {
+                "timestamp": round(now, 3),
+                "uptime_seconds": round(now - self.started_at, 1),
+                "stages": stages,
+                "counters": [{"name": n, "labels": dict(l), "value": v} for (n, l), v in self.counters.items()],
+                "gauges": [{"name": n, "labels": dict(l), "value": v} for (n, l), v in self.gauges.items()],
+                "histograms": [{"name": n, "labels": dict(l), **h.to_dict()}
+                               for (n, l), h in self.histograms.items()],
+            }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        snap = self.snapshot()
+        lines = []
+
+        def label_str(labels: dict) -> str:
+            if not labels:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in sorted(labels.items())) + "}"
+
+        stage_fields = (
+            ("stage_items_done", "counter", "done"),
+            ("stage_items_total", "gauge", "total"),
+            ("stage_items_failed", "counter", "failed"),
+            ("stage_items_per_second", "gauge", "items_per_sec"),
+            ("stage_eta_seconds", "gauge", "eta_seconds"),
+        )
+        for metric, kind, field in stage_fields:
+            lines.append(f"# TYPE {PREFIX}_{metric} {kind}")
+            for stage, values in sorted(snap["stages"].items()):
+                if values[field] is not None:
+                    lines.append(f'{PREFIX}_{metric}{{stage="{stage}"}} {values[field]}')
+
+        for section, kind in (("counters", "counter"), ("gauges", "gauge")):
+            seen = set()
+            for item in sorted(snap[section], key=lambda i: (i["name"], sorted(i["labels"].items()))):
+                name = f"{PREFIX}_{item['name']}"
+                if name not in seen:
+                    lines.append(f"# TYPE {name} {kind}")
+                    seen.add(name)
+                lines.append(f"{name}{label_str(item['labels'])} {item['value']}")
+
+        seen = set()
+        for item in sorted(snap["histograms"], key=lambda i: (i["name"], sorted(i["labels"].items()))):
+            name = f"{PREFIX}_{item['name']}"
+            if name not in seen:
+                lines.append(f"# TYPE {name} histogram")
+                seen.add(name)
+            for bound, count in item["buckets"].items():
+                lines.append(f"{name}_bucket{label_str({**item['labels'], 'le': bound})} {count}")
+            lines.append(f"{name}_bucket{label_str({**item['labels'], 'le': '+Inf'})} {item['count']}")
+            lines.append(f"{name}_sum{label_str(item['labels'])} {item['sum']}")
+            lines.append(f"{name}_count{label_str(item['labels'])} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+
+# Registry the pipeline's progress loops report into
+METRICS = PipelineMetrics()
+
+
+def request_outcome(exc: Exception) -> str:
+    """Outcome label for a failed request (HTTP status if the exception carries one)."""
+    status = getattr(exc, "status", None) or getattr(exc, "code", None)
+    if status == 429:
+        return "rate_limited"
+    if status == 404:
+        return "not_found"
+    return "error"
+
+
+# ---------------------------------------------------------------------------
+# Exposure (opt-in)
+# ---------------------------------------------------------------------------
+
+def start_http_server(metrics: PipelineMetrics, port: int, host: str = DEFAULT_HOST):
+    """Serve /metrics (Prometheus text) and /metrics.json from a daemon thread."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/metrics.json"):
+                body = json.dumps(metrics.snapshot(), indent=2).encode()
+                content_type = "application/json"
+            elif self.path.startswith("/metrics"):
+                body = metrics.render_prometheus().encode()
+                content_type = "text/plain; version=0.0.4"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep scrapes out of the pipeline log
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def write_snapshot(metrics: PipelineMetrics, path: Path):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(metrics.snapshot(), indent=2))
+    tmp.replace(path)
+
+
+def start_json_flusher(metrics: PipelineMetrics, path: Path, interval: float = DEFAULT_INTERVAL):
+    """Rewrite a JSON snapshot every `interval` seconds, and once more at exit."""
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            write_snapshot(metrics, path)
+
+    threading.Thread(target=loop, name="metrics-json", daemon=True).start()
+    atexit.register(lambda: (stop.set(), write_snapshot(metrics, path)))
+    return stop
+
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--metrics-port", type=int, default=0,
+                        help="Serve live Prometheus metrics on 127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-file", default="",
+                        help="Periodically write a JSON metrics snapshot to this file")
+    parser.add_argument("--metrics-interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"Seconds between --metrics-file writes (default: {DEFAULT_INTERVAL})")
+
+
+def start_from_args(args, metrics: Optional[PipelineMetrics] = None):
+    """Start whichever exposure the --metrics-* arguments ask for."""
+    import logging
+
+    metrics = metrics or METRICS
+    log = logging.getLogger("vocabquest-metrics")
+    if args.metrics_port:
+        start_http_server(metrics, args.metrics_port)
+        log.info(f"Serving metrics on http://{DEFAULT_HOST}:{args.metrics_port}/metrics")
+    if args.metrics_file:
+        start_json_flusher(metrics, Path(args.metrics_file), args.metrics_interval)
+        log.info(f"Writing metrics to {args.metrics_file} every {args.metrics_interval:g}s")
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Related Words
+
+Precomputes the top-K related words for every selected word, restricted to the
+selected vocabulary, from WordNet Wu-Palmer similarity:
+
+    sim(a, b) = 2 * depth(lcs) / (dist(a, lcs) + dist(b, lcs) + 2 * depth(lcs))
+
+Each word is reduced to one ancestor profile (ancestor -> shortest distance
+from any of its top senses, plus the ancestor's depth). The max over common
+ancestors of the formula above is then the best Wu-Palmer score over all sense
+pairs. Profiles are built from memoized per-synset ancestor maps, so shared
+hypernym chains are walked once.
+
+Instead of comparing all n^2 pairs, an inverted index maps each ancestor to the
+words below it (sorted by distance). Each query visits its own ancestors in
+order of their best possible score and stops once no unseen candidate can beat
+the current K-th best. Queries run in batches across a process pool.
+
+Usage:
+    cd data-pipeline
+    python generate_vocab_db.py --related 10       # default; 0 disables
+    python related_words.py --count 2000 --word dog
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import heapq
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+DEFAULT_K = 10
+DEFAULT_MIN_SCORE = 0.5
+DEFAULT_MAX_SENSES = 3
+DEFAULT_BATCH_SIZE = 500
+
+log = logging.getLogger("vocabquest-related")
+
+# Profile: ancestor id -> (shortest distance from the word's senses, ancestor depth)
+Profile = Dict[int, Tuple[int, int]]
+
+
+# ---------------------------------------------------------------------------
+# Ancestor profiles
+# ---------------------------------------------------------------------------
+
+def synset_ancestors(synset, cache: Dict[str, Dict[str, Tuple[int, int]]]) -> Dict[str, Tuple[int, int]]:
+    """Map every hypernym of `synset` (and itself) to (distance, depth), memoized.
+
+    Depth is the longest root path + 1, as in NLTK's wup_similarity(); instance
+    hypernyms count as hypernyms.
+    """
+    name = synset.name()
+    found = cache.get(name)
+    if found is not None:
+        return found
+
+    merged: Dict[str, Tuple[int, int]] = {}
+    depth = 1
+    for parent in synset.hypernyms() + synset.instance_hypernyms():
+        parent_map = synset_ancestors(parent, cache)
+        depth = max(depth, parent_map[parent.name()][1] + 1)
+        for ancestor, (dist, ancestor_depth) in parent_map.items():
+            if ancestor not in merged or dist + 1 < merged[ancestor][0]:
+                merged[ancestor] = (dist + 1, ancestor_depth)
+    merged[name] = (0, depth)
+    cache[name] = merged
+    return merged
+
+
+def build_profiles(selected: List[dict], max_senses: int = DEFAULT_MAX_SENSES) -> List[Profile]:
+    """Build one interned ancestor profile per selected word (from its top senses)."""
+    cache: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    ids: Dict[str, int] = {}
+    profiles: List[Profile] = []
+
+    for item in selected:
+        profile: Profile = {}
+        for synset in item["synsets"][:max_senses]:
+            for ancestor, (dist, depth) in synset_ancestors(synset, cache).items():
+                key = ids.setdefault(ancestor, len(ids))
+                if key not in profile or dist < profile[key][0]:
+                    profile[key] = (dist, depth)
+        profiles.append(profile)
+
+    log.info(f"  {len(profiles)} profiles over {len(ids)} ancestors "
+             f"({len(cache)} synsets walked)")
+    return profiles
+
+
+def build_index(profiles: List[Profile]) -> Dict[int, List[Tuple[int, int]]]:
+    """Inverted index: ancestor id -> [(distance, word index)] sorted by distance."""
+    index: Dict[int, List[Tuple[int, int]]] = {}
+    for i, profile in enumerate(profiles):
+        for ancestor, (dist, _) in profile.items():
+            index.setdefault(ancestor, []).append((dist, i))
+    for postings in index.values():
+        postings.sort()
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Top-K queries
+# ---------------------------------------------------------------------------
+
+# Profiles and index for the current worker process, sent once via the initializer
+_worker_profiles: List[Profile] = []
+_worker_index: Dict[int, List[Tuple[int, int]]] = {}
+
+
+def _init_worker(profiles: List[Profile], index: Dict[int, List[Tuple[int, int]]]):
+    global _worker_profiles, _worker_index
+    _worker_profiles = profiles
+    _worker_index = index
+
+
+def top_related(
+    i: int,
+    profiles: List[Profile],
+    index: Dict[int, List[Tuple[int, int]]],
+    k: int,
+    min_score: float,
+) -> List[Tuple[int, float]]:
+    """Top-k (word index, score) neighbors of word i, best first, ties by index."""
+    # Best score reachable through each ancestor (a candidate at distance 0)
+    entries = sorted(
+        ((2 * depth / (dist + 2 * depth), ancestor, dist, depth)
+         for ancestor, (dist, depth) in profiles[i].items()),
+        reverse=True,
+    )
+
+    best: Dict[int, float] = {}
+    threshold = min_score
+    for bound, ancestor, dist, depth in entries:
+        if bound < threshold:
+            break
+        for other_dist, j in index[ancestor]:
+            score = 2 * depth / (dist + other_dist + 2 * depth)
+            if score < threshold:
+                break  # postings are sorted by distance, so scores only fall
+            if j != i and score > best.get(j, 0.0):
+                best[j] = score
+        if len(best) >= k:
+            threshold = max(threshold, heapq.nlargest(k, best.values())[-1])
+
+    ranked = sorted(best.items(), key=lambda kv: (-kv[1], kv[0]))[:k]
+    return [(j, round(score, 4)) for j, score in ranked]
+
+
+def _query_batch(task: tuple) -> List[Tuple[int, List[Tuple[int, float]]]]:
+    """Run top_related() for a range of word indices (runs in a worker process)."""
+    start, end, k, min_score = task
+    return [
+        (i, top_related(i, _worker_profiles, _worker_index, k, min_score))
+        for i in range(start, end)
+    ]
+
+
+def compute_related_words(
+    selected: List[dict],
+    k: int = DEFAULT_K,
+    min_score: float = DEFAULT_MIN_SCORE,
+    jobs: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_senses: int = DEFAULT_MAX_SENSES,
+) -> Dict[int, List[Tuple[int, float]]]:
+    """Top-k related words for each selected word.
+
+    `selected` is in rank order, so word ids are 1-based positions. Returns
+    {word_id: [(related_word_id, score), ...]} for words with any neighbor.
+    """
+    log.info(f"Computing top-{k} related words for {len(selected)} words...")
+    start_time = time.time()
+    profiles = build_profiles(selected, max_senses)
+    index = build_index(profiles)
+
+    tasks = [
+        (start, min(start + batch_size, len(profiles)), k, min_score)
+        for start in range(0, len(profiles), batch_size)
+    ]
+    workers = min(jobs or os.cpu_count() or 1, max(len(tasks), 1))
+
+    results: List[Tuple[int, List[Tuple[int, float]]]] = []
+    if workers == 1:
+        _init_worker(profiles, index)
+        for task in tasks:
+            results.extend(_query_batch(task))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(profiles, index),
+        ) as pool:
+            for batch in pool.map(_query_batch, tasks):
+                results.extend(batch)
+
+    related = {
+        i + 1: [(j + 1, score) for j, score in neighbors]
+        for i, neighbors in results if neighbors
+    }
+    pairs = sum(len(v) for v in related.values())
+    log.info(f"  {pairs} related pairs for {len(related)} words "
+             f"in {time.time() - start_time:.1f}s ({workers} processes)")
+    return related
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Preview related words for the selected vocabulary")
+    parser.add_argument("--count", "-n", type=int, default=2000, help="Number of words to select")
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="Neighbors per word")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Worker processes (default: all cores)")
+    parser.add_argument("--word", action="append", default=[], help="Print neighbors of this word")
+    args = parser.parse_args()
+
+    import generate_vocab_db as vocab
+
+    brown_freq, _ = vocab.compute_brown_frequencies()
+    selected = vocab.select_words(vocab.get_wordnet_words(), brown_freq, {}, args.count)
+    related = compute_related_words(selected, args.k, jobs=args.jobs)
+
+    positions = {item["word"]: i + 1 for i, item in enumerate(selected)}
+    for word in args.word or [item["word"] for item in selected[:10]]:
+        word_id: Optional[int] = positions.get(word)
+        if word_id is None:
+            print(f"{word}: not selected")
+            continue
+        neighbors = ", ".join(
+            f"{selected[j - 1]['word']} ({score:.2f})" for j, score in related.get(word_id, [])
+        )
+        print(f"{word}: {neighbors}")
+
+
+if __name__ == "__main__":
+    main()
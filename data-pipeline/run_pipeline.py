@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Pipeline Runner
+
+Runs the vocabulary database and audio builds as one DAG of cached, resumable
+stages. Each stage declares its upstream stages, the config keys and input files
+it reads, and the files it writes. A stage is skipped when its fingerprint
+(config + inputs + upstream fingerprints + PIPELINE_VERSION) matches the last
+completed run, so a re-run after a crash picks up from the last completed stage.
+generate_vocab_db.py is identified by PIPELINE_VERSION rather than by its source,
+so a comment edit there doesn't invalidate the DAG. Independent stages (e.g. audio
+for the selected words vs. DB enrichment) run concurrently.
+
+Usage:
+    cd data-pipeline
+    source venv/bin/activate
+    python run_pipeline.py                      # Build everything that is stale
+    python run_pipeline.py --dry-run            # Show which stages would run
+    python run_pipeline.py --force enrich       # Re-run a stage (and downstream)
+    python run_pipeline.py --until db           # Stop after the DB is written
+    python run_pipeline.py --no-audio           # Skip audio generation
+    python run_pipeline.py --enrich-api --api-batch 1000
+    python run_pipeline.py --export exports/vocab --export-format parquet
+    python run_pipeline.py --metrics-port 9108  # Live progress on :9108/metrics
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import pickle
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Set, Tuple
+
+import generate_vocab_db as vocab
+from pipeline_metrics import METRICS, add_metrics_arguments, start_from_args
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+PIPELINE_DIR = Path(__file__).resolve().parent
+DEFAULT_STATE_DIR = "cache/pipeline"
+DEFAULT_JOBS = 3
+STATE_FILE = "state.json"
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S",
+)
+log = logging.getLogger("vocabquest-pipeline")
+
+
+# ---------------------------------------------------------------------------
+# Stage cache (pickle with WordNet synsets stored by name)
+# ---------------------------------------------------------------------------
+
+class _ResultPickler(pickle.Pickler):
+    """Pickle stage results, storing WordNet synsets by name.
+
+    Synsets hold a reference to the corpus reader and can't be pickled directly;
+    they are re-resolved through wordnet.synset() on load.
+    """
+
+    def persistent_id(self, obj):
+        if type(obj).__name__ == "Synset" and hasattr(obj, "name"):
+            return ("synset", obj.name())
+        return None
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        kind, name = pid
+        if kind == "synset":
+            from nltk.corpus import wordnet
+
+            return wordnet.synset(name)
+        raise pickle.UnpicklingError(f"Unknown persistent id: {kind}")
+
+
+def save_result(path: Path, result: Any):
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        _ResultPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(result)
+    tmp.replace(path)
+
+
+def load_result(path: Path) -> Any:
+    with open(path, "rb") as f:
+        return _ResultUnpickler(f).load()
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+class Stage(NamedTuple):
+    """A pipeline step. run(config, upstream_results) returns a picklable result."""
+    name: str
+    deps: Tuple[str, ...]
+    config_keys: Tuple[str, ...]
+    inputs: Callable[[dict], List[Path]]
+    outputs: Callable[[dict], List[Path]]
+    run: Callable[[dict, Dict[str, Any]], Any]
+
+
+def _no_files(config: dict) -> List[Path]:
+    return []
+
+
+def _audio_source(config: dict) -> List[Path]:
+    return [PIPELINE_DIR / "generate_audio.py"]
+
+
+def run_brown(config: dict, deps: Dict[str, Any]) -> Any:
+    return vocab.compute_brown_frequencies()
+
+
+def run_cmu(config: dict, deps: Dict[str, Any]) -> Any:
+    return vocab.load_cmu_dict()
+
+
+def run_ipa(config: dict, deps: Dict[str, Any]) -> Any:
+    return vocab.build_ipa_table(deps["cmu"])
+
+
+def run_wordnet(config: dict, deps: Dict[str, Any]) -> Any:
+    return vocab.get_wordnet_words()
+
+
+def run_frequency(config: dict, deps: Dict[str, Any]) -> Any:
+    brown_freq, _ = deps["brown"]
+    if not config["freq_source"]:
+        return brown_freq
+    return vocab.load_blended_frequencies(
+        brown_freq, deps["wordnet"], Path(config["freq_source"]), config["freq_format"],
+        config["freq_weight"], config["shard_jobs"],
+    )
+
+
+def run_select(config: dict, deps: Dict[str, Any]) -> Any:
+    return vocab.select_words(deps["wordnet"], deps["frequency"], deps["cmu"], config["count"])
+
+
+def run_related(config: dict, deps: Dict[str, Any]) -> Any:
+    if config["related"] <= 0:
+        return None
+    from related_words import compute_related_words
+
+    return compute_related_words(deps["select"], config["related"], jobs=config["shard_jobs"])
+
+
+def run_difficulty(config: dict, deps: Dict[str, Any]) -> Any:
+    from difficulty import assign_difficulty, attested_lemmas
+
+    brown_freq, _ = deps["brown"]
+    lemmas = attested_lemmas(deps["wordnet"], set(brown_freq) | set(deps["cmu"]))
+    return assign_difficulty(deps["select"], deps["cmu"], lemmas, vocab.CEFR_QUANTILES)
+
+
+def run_forms(config: dict, deps: Dict[str, Any]) -> Any:
+    from word_forms import compute_word_forms
+
+    brown_freq, _ = deps["brown"]
+    return compute_word_forms(deps["select"], deps["wordnet"], set(brown_freq) | set(deps["cmu"]))
+
+
+def run_enrich(config: dict, deps: Dict[str, Any]) -> Any:
+    if config["shards"] > 1:
+        return None  # enrichment happens inside the sharded DB build
+    _, brown_pos = deps["brown"]
+    return vocab.enrich_words(deps["difficulty"], deps["cmu"], brown_pos, deps["ipa"])
+
+
+def run_api_enrich(config: dict, deps: Dict[str, Any]) -> Any:
+    words = deps["enrich"]
+    if not config["enrich_api"] or words is None:
+        return words
+    if config["api_budget"] > 0:
+        words, report = vocab.enrich_words_prioritized(words, config["api_budget"], PIPELINE_DIR / "cache")
+        with open(PIPELINE_DIR / vocab.DEFAULT_API_REPORT, "w") as f:
+            json.dump(report, f, indent=2)
+        return words
+    return vocab.enrich_words_from_api(words, config["api_batch"], PIPELINE_DIR / "cache")
+
+
+def run_db(config: dict, deps: Dict[str, Any]) -> Any:
+    output = Path(config["output"])
+    if config["shards"] > 1:
+        _, brown_pos = deps["brown"]
+        word_count, example_count = vocab.build_sharded_database(
+            output, deps["difficulty"], brown_pos, deps["ipa"], config["shards"], config["shard_jobs"],
+            related=deps["related"], compress=config["compress"], forms=deps["forms"],
+        )
+    else:
+        word_count, example_count = vocab.create_database(
+            output, deps["api_enrich"], deps["related"], config["compress"], forms=deps["forms"],
+        )
+    return {"word_count": word_count, "example_count": example_count}
+
+
+def run_finalize(config: dict, deps: Dict[str, Any]) -> Any:
+    output = Path(config["output"])
+    digest = vocab.finalize_database(output, config["page_size"], vocab.make_build_manifest(config))
+    return {"size_bytes": output.stat().st_size, "sha256": digest}
+
+
+def run_export(config: dict, deps: Dict[str, Any]) -> Any:
+    if not config["export_dir"]:
+        return None
+    import export_db
+
+    manifest = export_db.export_database(
+        Path(config["output"]), Path(config["export_dir"]), config["export_format"],
+        config["export_partition"], jobs=config["shard_jobs"],
+    )
+    return {name: r["rows"] for name, r in manifest["relations"].items()}
+
+
+def run_audio(config: dict, deps: Dict[str, Any]) -> Any:
+    if not config["audio"]:
+        return None
+    import asyncio
+    import generate_audio
+
+    words = [(rank, w["word"]) for rank, w in enumerate(deps["select"], 1)]
+    output_dir = Path(config["audio_output"])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    success, failed, total_bytes = asyncio.run(generate_audio.generate_batch(
+        words, output_dir, config["voice"], config["audio_workers"],
+    ))
+    return {"success": success, "failed": failed, "total_bytes": total_bytes}
+
+
+def run_verify(config: dict, deps: Dict[str, Any]) -> Any:
+    db_path = Path(config["output"])
+    stats = vocab.verify_database(db_path)
+    all_pass = vocab.print_report(stats)
+    with open(PIPELINE_DIR / "verification_report.json", "w") as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+
+    if config["audio"]:
+        import generate_audio
+
+        words = generate_audio.load_words(str(db_path))
+        audio_stats = generate_audio.verify_audio(Path(config["audio_output"]), words)
+        all_pass = generate_audio.print_report(audio_stats) and all_pass
+        generate_audio.save_report(audio_stats, PIPELINE_DIR / generate_audio.DEFAULT_REPORT)
+
+    if not all_pass:
+        raise RuntimeError("Verification checks failed")
+    return {"all_pass": all_pass}
+
+
+STAGES: List[Stage] = [
+    Stage("brown", (), (),
+          lambda c: [vocab.nltk_corpus_path("brown")], _no_files, run_brown),
+    Stage("cmu", (), (),
+          lambda c: [vocab.nltk_corpus_path("cmudict")], _no_files, run_cmu),
+    Stage("ipa", ("cmu",), (),
+          _no_files, _no_files, run_ipa),
+    Stage("wordnet", (), (),
+          lambda c: [vocab.nltk_corpus_path("wordnet")], _no_files, run_wordnet),
+    Stage("frequency", ("brown", "wordnet"), ("freq_source", "freq_format", "freq_weight"),
+          lambda c: [Path(c["freq_source"])] if c["freq_source"] else [], _no_files, run_frequency),
+    Stage("select", ("frequency", "cmu", "wordnet"), ("count",),
+          _no_files, _no_files, run_select),
+    Stage("related", ("select",), ("related",),
+          lambda c: [PIPELINE_DIR / "related_words.py"], _no_files, run_related),
+    Stage("difficulty", ("select", "wordnet", "brown", "cmu"), (),
+          lambda c: [PIPELINE_DIR / "difficulty.py"], _no_files, run_difficulty),
+    Stage("forms", ("select", "wordnet", "brown", "cmu"), (),
+          lambda c: [PIPELINE_DIR / "word_forms.py"], _no_files, run_forms),
+    Stage("enrich", ("difficulty", "cmu", "brown", "ipa"), ("shards",),
+          _no_files, _no_files, run_enrich),
+    Stage("api_enrich", ("enrich",), ("enrich_api", "api_batch", "api_budget"),
+          _no_files, _no_files, run_api_enrich),
+    Stage("db", ("api_enrich", "difficulty", "brown", "ipa", "related", "forms"),
+          ("output", "shards", "compress"),
+          lambda c: [PIPELINE_DIR / "text_codec.py", PIPELINE_DIR / "difficulty.py"],
+          lambda c: [Path(c["output"])], run_db),
+    Stage("finalize", ("db",), ("output",) + vocab.MANIFEST_CONFIG_KEYS,
+          _no_files, lambda c: [Path(c["output"])], run_finalize),
+    Stage("export", ("finalize",), ("output", "export_dir", "export_format", "export_partition"),
+          lambda c: [PIPELINE_DIR / "export_db.py"],
+          lambda c: [Path(c["export_dir"])] if c["export_dir"] else [], run_export),
+    Stage("audio", ("select",), ("audio", "audio_output", "voice"),
+          _audio_source, lambda c: [Path(c["audio_output"])] if c["audio"] else [], run_audio),
+    Stage("verify", ("finalize", "audio"), ("audio",),
+          _audio_source, _no_files, run_verify),
+]
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+class PipelineRunner:
+    """Schedules stages over a thread pool, skipping those that are up to date."""
+
+    def __init__(self, stages: List[Stage], config: dict, state_dir: Path):
+        self.stages = {s.name: s for s in stages}
+        self.order = [s.name for s in stages]
+        self.config = config
+        self.state_dir = state_dir
+        self.state_path = state_dir / STATE_FILE
+        self.state: Dict[str, dict] = (
+            json.loads(self.state_path.read_text()) if self.state_path.exists() else {}
+        )
+        self.results: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+        self.fingerprints = self._compute_fingerprints()
+
+    def _compute_fingerprints(self) -> Dict[str, str]:
+        fingerprints: Dict[str, str] = {}
+        for name in self.order:
+            stage = self.stages[name]
+            payload = {
+                "stage": name,
+                "pipeline_version": vocab.PIPELINE_VERSION,
+                "config": {k: self.config[k] for k in stage.config_keys},
+                "inputs": {str(p): vocab.content_fingerprint(p) for p in stage.inputs(self.config)},
+                "deps": {d: fingerprints[d] for d in stage.deps},
+            }
+            fingerprints[name] = hashlib.sha256(
+                json.dumps(payload, sort_keys=True).encode()
+            ).hexdigest()
+        return fingerprints
+
+    def _result_path(self, name: str) -> Path:
+        return self.state_dir / f"{name}.pkl"
+
+    def is_fresh(self, name: str) -> bool:
+        entry = self.state.get(name)
+        return (
+            entry is not None
+            and entry["fingerprint"] == self.fingerprints[name]
+            and self._result_path(name).exists()
+            and all(p.exists() for p in self.stages[name].outputs(self.config))
+        )
+
+    def wanted(self, until: str = "") -> Set[str]:
+        """Stages needed to reach `until` (all stages if empty)."""
+        if not until:
+            return set(self.order)
+        return self._ancestors(until) | {until}
+
+    def plan(self, force: Set[str], until: str = "") -> List[str]:
+        """Return the stages that need to run, in dependency order."""
+        wanted = self.wanted(until)
+        stale: Set[str] = set()
+        for name in self.order:
+            if name not in wanted:
+                continue
+            if name in force or not self.is_fresh(name) or stale & set(self.stages[name].deps):
+                stale.add(name)
+        return [n for n in self.order if n in stale]
+
+    def _ancestors(self, name: str) -> Set[str]:
+        found: Set[str] = set()
+        pending = list(self.stages[name].deps)
+        while pending:
+            dep = pending.pop()
+            if dep not in found:
+                found.add(dep)
+                pending.extend(self.stages[dep].deps)
+        return found
+
+    def _dep_results(self, name: str) -> Dict[str, Any]:
+        results = {}
+        for dep in self.stages[name].deps:
+            with self.lock:
+                if dep not in self.results:
+                    log.info(f"[{name}] Loading cached result of '{dep}'")
+                    self.results[dep] = load_result(self._result_path(dep))
+                results[dep] = self.results[dep]
+        return results
+
+    def _run_stage(self, name: str) -> float:
+        start = time.time()
+        log.info(f"[{name}] Starting")
+        with METRICS.in_flight("stage"):
+            result = self.stages[name].run(self.config, self._dep_results(name))
+        save_result(self._result_path(name), result)
+        elapsed = time.time() - start
+        METRICS.observe("stage_seconds", elapsed, stage=name)
+
+        with self.lock:
+            self.results[name] = result
+            self.state[name] = {
+                "fingerprint": self.fingerprints[name],
+                "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "seconds": round(elapsed, 1),
+            }
+            tmp = self.state_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.state, indent=2))
+            tmp.replace(self.state_path)
+        log.info(f"[{name}] Done in {elapsed:.1f}s")
+        return elapsed
+
+    def run(self, to_run: List[str], jobs: int) -> bool:
+        """Run the planned stages concurrently as their dependencies complete."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        pending = list(to_run)
+        done: Set[str] = set()
+        failed = False
+        METRICS.stage_started("pipeline", len(to_run))
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            running = {}
+            while pending or running:
+                if not failed:
+                    for name in list(pending):
+                        if all(d in done or d not in to_run for d in self.stages[name].deps):
+                            pending.remove(name)
+                            running[pool.submit(self._run_stage, name)] = name
+                METRICS.set_gauge("queue_depth", len(pending), stage="pipeline")
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                        METRICS.advance("pipeline")
+                    except Exception:
+                        log.exception(f"[{name}] Failed")
+                        METRICS.advance("pipeline", failed=True)
+                        failed = True
+
+        if failed and pending:
+            log.error(f"Not run due to failure: {', '.join(pending)}")
+        return not failed
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the EigoQuest data pipeline as cached stages")
+    parser.add_argument("--output", "-o", default=vocab.DEFAULT_OUTPUT, help="Output database path")
+    parser.add_argument("--count", "-n", type=int, default=vocab.DEFAULT_WORD_COUNT, help="Number of words")
+    parser.add_argument("--enrich-api", action="store_true", help="Also fetch data from Free Dictionary API")
+    parser.add_argument("--api-batch", type=int, default=0, help="Only API-enrich words with rank <= N")
+    parser.add_argument("--api-budget", type=int, default=0,
+                        help="API requests to spend on the largest expected coverage gains")
+    parser.add_argument("--freq-source", help="Large corpus or word/count file to rank words by")
+    parser.add_argument("--freq-format", default="auto", choices=["auto", "text", "counts"],
+                        help="Format of --freq-source")
+    parser.add_argument("--freq-weight", type=float, default=1.0,
+                        help="Weight of --freq-source vs. Brown (1.0 = replace Brown)")
+    parser.add_argument("--related", type=int, default=vocab.DEFAULT_RELATED_K,
+                        help="Related words per word (0 = skip)")
+    parser.add_argument("--shards", type=int, default=0, help="Build the DB as N parallel rank-range shards")
+    parser.add_argument("--shard-jobs", type=int, default=0, help="Processes for --shards (default: all cores)")
+    parser.add_argument("--page-size", type=int, default=vocab.DEFAULT_PAGE_SIZE,
+                        help="SQLite page size of the shipped DB")
+    parser.add_argument("--compress", default="", choices=["", "zstd", "zlib"],
+                        help="Dictionary-compress definitions, examples and metadata. NOT app-compatible "
+                             "yet (the app has no decoder): needs an --output outside the app sources")
+    parser.add_argument("--export", metavar="DIR", default="",
+                        help="Also export the DB to this directory (JSONL/Parquet)")
+    parser.add_argument("--export-format", default="jsonl", choices=["jsonl", "parquet"],
+                        help="File format for --export")
+    parser.add_argument("--export-partition-by-level", action="store_true",
+                        help="Partition --export by CEFR level")
+    parser.add_argument("--no-audio", action="store_true", help="Skip audio generation and verification")
+    parser.add_argument("--audio-output", default="../shared-core/src/commonMain/resources/audio",
+                        help="Output directory for audio files")
+    parser.add_argument("--voice", default="en-US-AndrewNeural", help="Edge TTS voice")
+    parser.add_argument("--audio-workers", type=int, default=10, help="Concurrent TTS requests")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help="Stages to run concurrently")
+    parser.add_argument("--state-dir", default=DEFAULT_STATE_DIR, help="Stage cache/state directory")
+    parser.add_argument("--force", action="append", default=[], metavar="STAGE",
+                        help="Re-run a stage even if up to date (repeatable, 'all' for everything)")
+    parser.add_argument("--until", metavar="STAGE", default="", help="Only run up to this stage")
+    parser.add_argument("--dry-run", action="store_true", help="Show the plan without running it")
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    if args.shards > 1 and args.enrich_api:
+        parser.error("--enrich-api can't be combined with --shards")
+    if args.compress:
+        from text_codec import check_app_output, require_codec
+
+        try:
+            require_codec(args.compress)
+            check_app_output(Path(args.output))
+        except RuntimeError as e:
+            parser.error(str(e))
+
+    stage_names = [s.name for s in STAGES]
+    for name in args.force + ([args.until] if args.until else []):
+        if name != "all" and name not in stage_names:
+            parser.error(f"Unknown stage '{name}' (stages: {', '.join(stage_names)})")
+
+    config = {
+        "output": str(Path(args.output).resolve()),
+        "count": args.count,
+        "enrich_api": args.enrich_api,
+        "api_batch": args.api_batch,
+        "api_budget": args.api_budget,
+        "freq_source": str(Path(args.freq_source).resolve()) if args.freq_source else "",
+        "freq_format": args.freq_format,
+        "freq_weight": args.freq_weight,
+        "related": args.related,
+        "shards": args.shards,
+        "shard_jobs": args.shard_jobs,
+        "page_size": args.page_size,
+        "compress": args.compress,
+        "export_dir": str(Path(args.export).resolve()) if args.export else "",
+        "export_format": args.export_format,
+        "export_partition": args.export_partition_by_level,
+        "audio": not args.no_audio,
+        "audio_output": str(Path(args.audio_output).resolve()),
+        "voice": args.voice,
+        "audio_workers": args.audio_workers,
+    }
+
+    runner = PipelineRunner(STAGES, config, Path(args.state_dir))
+    force = set(stage_names) if "all" in args.force else set(args.force)
+    to_run = runner.plan(force, args.until)
+
+    log.info("=" * 50)
+    log.info("EigoQuest Pipeline")
+    log.info("=" * 50)
+    wanted = runner.wanted(args.until)
+    for name in stage_names:
+        if name not in wanted:
+            status = "not requested"
+        else:
+            status = "run" if name in to_run else "up to date"
+        log.info(f"  {name:<12} {status}")
+
+    if args.dry_run or not to_run:
+        return
+
+    start_from_args(args)
+    start = time.time()
+    ok = runner.run(to_run, args.jobs)
+    log.info(f"\nPipeline {'finished' if ok else 'FAILED'} in {time.time() - start:.1f}s")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Compressed Text Columns
+
+Optional compressed storage for the bulky text columns (word.definition,
+word.metadata, word_example.sentence). One dictionary is trained on those
+values and embedded in the DB (text_dictionary table); each value is then
+compressed on its own against it, so the app can still fetch and decode a
+single row. Values that don't get smaller stay plain TEXT, so readers decide
+per value by storage type: BLOB = compressed, TEXT = plain.
+
+Codecs:
+  - zstd: zstandard frames (content size, no checksum or dict id) against a
+          trained zstd dictionary. Needs zstandard
+          (requirements-optional.txt).
+  - zlib: raw deflate (no zlib header or checksum) against a preset dictionary
+          of frequent word n-grams, at most 32 KiB (the deflate window). Only
+          needs the standard library; Android's Inflater(nowrap=true) and
+          iOS's libz decode it natively.
+
+Training is deterministic, so compressed builds stay byte-reproducible.
+TextCodec is the Python reference decoder for the app's implementation.
+
+Not app-compatible yet: the app (shared-core VocabRepositoryImpl) reads these
+columns with getString() and has no decoder, so compressed builds are refused
+for outputs inside the app sources (check_app_output()).
+
+Usage:
+    cd data-pipeline
+    python generate_vocab_db.py --compress zlib --output vocabquest.db
+    python text_codec.py --db vocabquest.db --word dog     # decode rows for a word
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import logging
+import sqlite3
+import statistics
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# zstandard is imported where used (and only when the zstd codec is requested).
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CODECS = ("zstd", "zlib")
+COMPRESSED_COLUMNS = (
+    ("word", "definition"),
+    ("word", "metadata"),
+    ("word_example", "sentence"),
+)
+DEFAULT_DICT_SIZE = 32 * 1024
+ZLIB_MAX_DICT = 32 * 1024  # deflate can only reach back this far
+ZLIB_LEVEL = 9
+ZSTD_LEVEL = 19
+ZSTD_TRAIN_K = 256  # fixed COVER parameters: no randomized parameter search
+ZSTD_TRAIN_D = 8
+MAX_TRAINING_SAMPLES = 50_000
+MAX_NGRAM = 4
+MATCH_COST = 3  # rough bytes per back-reference, for scoring dictionary n-grams
+VERIFY_SAMPLE_ROWS = 2000  # rows per column decoded by the default verify
+
+# App source trees that bundle the DB; compressed text can't ship there until the
+# app has a decoder.
+REPO_DIR = Path(__file__).resolve().parent.parent
+APP_DIRS = ("shared-core", "android-app")
+
+log = logging.getLogger("vocabquest-text")
+
+
+# ---------------------------------------------------------------------------
+# Dictionary training
+# ---------------------------------------------------------------------------
+
+def training_samples(conn: sqlite3.Connection, limit: int = MAX_TRAINING_SAMPLES) -> List[bytes]:
+    """Plain values of every compressed column, strided down to about `limit` samples."""
+    samples: List[bytes] = []
+    for table, column in COMPRESSED_COLUMNS:
+        samples.extend(
+            value.encode("utf-8") for (value,) in conn.execute(
+                f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY rowid"
+            )
+        )
+    step = max(1, len(samples) // limit)
+    return samples[::step]
+
+
+def train_zlib_dictionary(samples: List[bytes], size: int = ZLIB_MAX_DICT) -> bytes:
+    """Preset dictionary of the word n-grams that save the most bytes across samples.
+
+    An n-gram scores (samples containing it - 1) * (length - MATCH_COST). The
+    best are picked greedily (skipping ones already contained in the picks) and
+    placed last, where back-references are shortest.
+    """
+    size = min(size, ZLIB_MAX_DICT)
+    counts: Counter = Counter()
+    for sample in samples:
+        tokens = sample.split(b" ")
+        grams = set()
+        for n in range(1, MAX_NGRAM + 1):
+            for i in range(len(tokens) - n + 1):
+                grams.add(b" ".join(tokens[i:i + n]) + b" ")
+        counts.update(grams)
+
+    ranked = sorted(
+        ((df - 1) * (len(gram) - MATCH_COST), gram)
+        for gram, df in counts.items() if df > 1 and len(gram) > MATCH_COST
+    )
+    picked: List[bytes] = []
+    joined = bytearray()
+    for _, gram in reversed(ranked):
+        if len(joined) >= size:
+            break
+        if gram in joined:
+            continue
+        picked.append(gram)
+        joined += gram
+    return b"".join(reversed(picked))[-size:]
+
+
+def train_dictionary(codec: str, samples: List[bytes], size: int = DEFAULT_DICT_SIZE) -> bytes:
+    if codec == "zlib":
+        return train_zlib_dictionary(samples, size)
+    zstandard = require_codec(codec)
+    trained = zstandard.train_dictionary(
+        size, samples, k=ZSTD_TRAIN_K, d=ZSTD_TRAIN_D, level=ZSTD_LEVEL,
+    )
+    return trained.as_bytes()
+
+
+def require_codec(codec: str):
+    """Check that a codec is usable; returns the zstandard module for zstd."""
+    if codec not in CODECS:
+        raise ValueError(f"Unknown text codec '{codec}' (expected one of {CODECS})")
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(
+                "--compress zstd needs zstandard: pip install zstandard "
+                "(or pip install -r requirements-optional.txt)"
+            ) from e
+        return zstandard
+    return None
+
+
+def check_app_output(output: Path):
+    """Refuse a compressed build whose output is inside the app sources (RuntimeError)."""
+    resolved = output.resolve()
+    for name in APP_DIRS:
+        if resolved.is_relative_to(REPO_DIR / name):
+            raise RuntimeError(
+                f"--compress output {output} is inside {name}/, but the app can't decode "
+                "compressed text yet; build it to another --output"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Reference codec
+# ---------------------------------------------------------------------------
+
+class TextCodec:
+    """Compress/decompress single values against a shared dictionary."""
+
+    def __init__(self, codec: str, dictionary: bytes):
+        self.codec = codec
+        self.dictionary = dictionary
+        zstandard = require_codec(codec)
+        if zstandard is None:
+            # Loading a preset dictionary rehashes it, so copy one primed compressor per value
+            self._zlib_primed = zlib.compressobj(
+                ZLIB_LEVEL, zlib.DEFLATED, -15, 9, zlib.Z_DEFAULT_STRATEGY, dictionary,
+            )
+        else:
+            dict_data = zstandard.ZstdCompressionDict(dictionary)
+            self._compressor = zstandard.ZstdCompressor(
+                level=ZSTD_LEVEL, dict_data=dict_data,
+                write_checksum=False, write_content_size=True, write_dict_id=False,
+            )
+            self._decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+
+    @classmethod
+    def from_connection(cls, conn: sqlite3.Connection) -> Optional["TextCodec"]:
+        """Codec embedded in a DB, or None if its text is stored plain."""
+        try:
+            row = conn.execute("SELECT codec, dictionary FROM text_dictionary ORDER BY id LIMIT 1").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return cls(row[0], row[1]) if row else None
+
+    def compress(self, text: str) -> bytes:
+        raw = text.encode("utf-8")
+        if self.codec == "zstd":
+            return self._compressor.compress(raw)
+        compressor = self._zlib_primed.copy()
+        return compressor.compress(raw) + compressor.flush()
+
+    def decompress(self, blob: bytes) -> str:
+        if self.codec == "zstd":
+            return self._decompressor.decompress(blob).decode("utf-8")
+        decompressor = zlib.decompressobj(-15, self.dictionary)
+        return (decompressor.decompress(blob) + decompressor.flush()).decode("utf-8")
+
+    def decode(self, value):
+        """Column value as stored -> text (BLOBs are compressed, anything else is plain)."""
+        return self.decompress(value) if isinstance(value, bytes) else value
+
+
+# ---------------------------------------------------------------------------
+# Build step
+# ---------------------------------------------------------------------------
+
+def compress_text_columns(
+    conn: sqlite3.Connection,
+    codec: str = "zlib",
+    dict_size: int = DEFAULT_DICT_SIZE,
+) -> dict:
+    """Train a dictionary on COMPRESSED_COLUMNS, store it and rewrite the columns as BLOBs.
+
+    Each compressed value is decoded again before it is written. Returns
+    {"codec", "dictionary_bytes", "columns": {table.column: {rows, compressed,
+    raw_bytes, stored_bytes}}}.
+    """
+    start_time = time.time()
+    dictionary = train_dictionary(codec, training_samples(conn), dict_size)
+    text_codec = TextCodec(codec, dictionary)
+    conn.execute("DELETE FROM text_dictionary")
+    conn.execute("INSERT INTO text_dictionary (id, codec, dictionary) VALUES (1, ?, ?)", (codec, dictionary))
+
+    columns: Dict[str, dict] = {}
+    for table, column in COMPRESSED_COLUMNS:
+        rows = conn.execute(
+            f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = 'text' ORDER BY rowid"
+        ).fetchall()
+        updates: List[Tuple[bytes, int]] = []
+        raw_bytes = stored_bytes = 0
+        for rowid, text in rows:
+            raw = len(text.encode("utf-8"))
+            blob = text_codec.compress(text)
+            raw_bytes += raw
+            if len(blob) < raw:
+                if text_codec.decompress(blob) != text:
+                    raise RuntimeError(f"{table}.{column} row {rowid} does not round-trip through {codec}")
+                updates.append((blob, rowid))
+                stored_bytes += len(blob)
+            else:
+                stored_bytes += raw
+        conn.executemany(f"UPDATE {table} SET {column} = ? WHERE rowid = ?", updates)
+        columns[f"{table}.{column}"] = {
+            "rows": len(rows), "compressed": len(updates),
+            "raw_bytes": raw_bytes, "stored_bytes": stored_bytes,
+        }
+    conn.commit()
+
+    raw_total = sum(c["raw_bytes"] for c in columns.values())
+    stored_total = sum(c["stored_bytes"] for c in columns.values()) + len(dictionary)
+    log.info(f"  Compressed text with {codec} ({len(dictionary) / 1024:.1f} KB dictionary): "
+             f"{raw_total / 1024 / 1024:.2f} MB -> {stored_total / 1024 / 1024:.2f} MB "
+             f"({raw_total / max(stored_total, 1):.2f}x) in {time.time() - start_time:.1f}s")
+    return {"codec": codec, "dictionary_bytes": len(dictionary), "columns": columns}
+
+
+def measure_columns(conn: sqlite3.Connection, text_codec: TextCodec, limit: Optional[int] = None) -> dict:
+    """Decode compressed values: sizes, per-row decode latency and failures.
+
+    With `limit`, only the first `limit` rows (by rowid) of each column are
+    decoded, so sizes and the ratio describe that sample; None decodes everything.
+    """
+    columns: Dict[str, dict] = {}
+    latencies: List[float] = []
+    errors = 0
+    for table, column in COMPRESSED_COLUMNS:
+        raw_bytes = stored_bytes = compressed = rows = 0
+        for (value,) in conn.execute(
+            f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY rowid LIMIT ?",
+            (-1 if limit is None else limit,),
+        ):
+            rows += 1
+            if not isinstance(value, bytes):
+                size = len(value.encode("utf-8"))
+                raw_bytes += size
+                stored_bytes += size
+                continue
+            compressed += 1
+            stored_bytes += len(value)
+            start = time.perf_counter()
+            try:
+                text = text_codec.decompress(value)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - start) * 1e6)
+            raw_bytes += len(text.encode("utf-8"))
+        columns[f"{table}.{column}"] = {
+            "rows": rows, "compressed": compressed, "raw_bytes": raw_bytes, "stored_bytes": stored_bytes,
+        }
+
+    latencies.sort()
+    return {
+        "columns": columns,
+        "decode_errors": errors,
+        "decode_us_median": round(statistics.median(latencies), 2) if latencies else None,
+        "decode_us_p95": round(latencies[int(len(latencies) * 0.95) - 1], 2) if latencies else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode compressed text columns of a vocabulary DB")
+    parser.add_argument("--db", required=True, help="Database to read")
+    parser.add_argument("--word", action="append", default=[], help="Print the decoded rows of this word")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    text_codec = TextCodec.from_connection(conn)
+    if text_codec is None:
+        print("Text is stored plain (no text_dictionary)")
+        sys.exit(0)
+    print(f"Codec: {text_codec.codec}, dictionary {len(text_codec.dictionary):,} bytes")
+
+    for word in args.word:
+        row = conn.execute(
+            "SELECT id, definition, metadata FROM word WHERE word = ? COLLATE NOCASE", (word,),
+        ).fetchone()
+        if row is None:
+            print(f"\n{word}: not found")
+            continue
+        print(f"\n{word}: {text_codec.decode(row[1])}")
+        print(f"  metadata: {text_codec.decode(row[2])}")
+        for (sentence,) in conn.execute(
+            "SELECT sentence FROM word_example WHERE word_id = ? ORDER BY id", (row[0],),
+        ):
+            print(f"  - {text_codec.decode(sentence)}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+EigoQuest Word Forms
+
+Maps inflected forms and US/UK spelling variants to the selected word they
+belong to, for the word_form table. The app resolves text it meets ("running",
+"colour", "went") with one indexed lookup instead of doing morphology on device.
+
+Forms come from, in order of precedence:
+  1. WordNet exception lists (noun.exc, verb.exc, ...): went -> go, mice -> mouse
+  2. WordNet morphology: lemmas that morphy() reduces to a selected word, the
+     same test filter_to_base_forms() drops them with (running -> run)
+  3. Regular inflection rules (plural/3sg, -ed, -ing, -er/-est, with e-drop,
+     y -> i and consonant doubling) applied to every selected word. A generated
+     form is kept only if it appears in the Brown corpus or the CMU dictionary
+     and is not a WordNet lemma itself.
+  4. Spelling variants (-our/-or, -tre/-ter, -ise/-ize, -ogue/-og, ae/e, ...) that
+     are WordNet lemmas sharing a synset with the word, plus their attested
+     inflections (colour, colours -> color)
+
+Forms that are selected words themselves are left out: the exact word lookup
+already finds them.
+
+Usage:
+    cd data-pipeline
+    python generate_vocab_db.py                     # word_form is always built
+    python word_forms.py --count 2000 --word run --word colour
+
+License: Internal (JWorks)
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+VOWELS = "aeiou"
+EXCEPTION_FILES = (("n", "noun"), ("v", "verb"), ("a", "adj"), ("r", "adv"))
+MORPHY_POS = ("v", "n", "a", "r")
+
+# (UK, US) endings, tried in both directions
+SPELLING_SUFFIXES = (
+    ("our", "or"),          # colour / color
+    ("tre", "ter"),         # centre / center
+    ("isation", "ization"),
+    ("ise", "ize"),         # organise / organize
+    ("yse", "yze"),         # analyse / analyze
+    ("ogue", "og"),         # catalogue / catalog
+    ("ence", "ense"),       # defence / defense
+    ("mme", "m"),           # programme / program
+    ("l", "ll"),            # fulfil / fulfill
+)
+# (UK, US) infixes, tried at every position in both directions
+SPELLING_INFIXES = (
+    ("ae", "e"),            # anaemia / anemia
+    ("oe", "e"),            # oestrogen / estrogen
+    ("ll", "l"),            # jewellery / jewelry
+)
+
+KIND_INFLECTION = "inflection"
+KIND_SPELLING = "spelling"
+
+log = logging.getLogger("vocabquest-forms")
+
+# word -> (WordNet POS letters, synset names)
+LemmaIndex = Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]]
+# (form, word_id, kind)
+FormRow = Tuple[str, int, str]
+
+
+# ---------------------------------------------------------------------------
+# Inflection and spelling rules
+# ---------------------------------------------------------------------------
+
+def _consonant_y(word: str) -> bool:
+    return len(word) > 1 and word[-1] == "y" and word[-2] not in VOWELS
+
+
+def _doubles(word: str) -> bool:
+    """Ends consonant-vowel-consonant (stop, big, travel): may double before a suffix."""
+    return (
+        len(word) >= 3 and word[-1] not in VOWELS + "wxy"
+        and word[-2] in VOWELS and word[-3] not in VOWELS
+    )
+
+
+def s_forms(word: str) -> List[str]:
+    """Plural / third person singular candidates."""
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        return [word + "es"]
+    if _consonant_y(word):
+        return [word[:-1] + "ies"]
+    forms = [word + "s"]
+    if word.endswith("o"):
+        forms.append(word + "es")
+    if word.endswith("fe"):
+        forms.append(word[:-2] + "ves")
+    elif word.endswith("f"):
+        forms.append(word[:-1] + "ves")
+    return forms
+
+
+def past_forms(word: str) -> List[str]:
+    if word.endswith("e"):
+        return [word + "d"]
+    if _consonant_y(word):
+        return [word[:-1] + "ied"]
+    forms = [word + "ed"]
+    if _doubles(word):
+        forms.append(word + word[-1] + "ed")
+    if word.endswith("c"):
+        forms.append(word + "ked")  # panic -> panicked
+    return forms
+
+
+def ing_forms(word: str) -> List[str]:
+    if word.endswith("ie"):
+        return [word[:-2] + "ying"]
+    if word.endswith("e") and not word.endswith(("ee", "ye", "oe")):
+        return [word[:-1] + "ing", word + "ing"]  # make -> making, singe -> singeing
+    forms = [word + "ing"]
+    if _doubles(word):
+        forms.append(word + word[-1] + "ing")
+    if word.endswith("c"):
+        forms.append(word + "king")
+    return forms
+
+
+def comparative_forms(word: str) -> List[str]:
+    if word.endswith("e"):
+        return [word + "r", word + "st"]
+    if _consonant_y(word):
+        return [word[:-1] + "ier", word[:-1] + "iest"]
+    forms = [word + "er", word + "est"]
+    if _doubles(word):
+        forms += [word + word[-1] + "er", word + word[-1] + "est"]
+    return forms
+
+
+INFLECTION_RULES: Dict[str, Tuple[Callable[[str], List[str]], ...]] = {
+    "n": (s_forms,),
+    "v": (s_forms, past_forms, ing_forms),
+    "a": (comparative_forms,),
+    "s": (comparative_forms,),
+    "r": (comparative_forms,),
+}
+
+
+def regular_inflections(word: str, pos: FrozenSet[str]) -> List[str]:
+    """Rule-generated inflection candidates for every WordNet POS of `word` (unvalidated)."""
+    forms: List[str] = []
+    for p in sorted(pos):
+        for rule in INFLECTION_RULES.get(p, ()):
+            forms.extend(f for f in rule(word) if f != word and f not in forms)
+    return forms
+
+
+def spelling_candidates(word: str) -> List[str]:
+    """US <-> UK spelling candidates of `word` (unvalidated)."""
+    found: List[str] = []
+    for uk, us in SPELLING_SUFFIXES:
+        for a, b in ((uk, us), (us, uk)):
+            if word.endswith(a) and len(word) > len(a) + 1:
+                found.append(word[:-len(a)] + b)
+    for uk, us in SPELLING_INFIXES:
+        for a, b in ((uk, us), (us, uk)):
+            start = word.find(a)
+            while start != -1:
+                found.append(word[:start] + b + word[start + len(a):])
+                start = word.find(a, start + 1)
+    return sorted(set(f for f in found if f != word))
+
+
+# ---------------------------------------------------------------------------
+# Building the table
+# ---------------------------------------------------------------------------
+
+def build_word_forms(
+    selected_words: List[str],
+    lemmas: LemmaIndex,
+    attested: Set[str],
+    exceptions: Dict[str, Dict[str, List[str]]],
+    morphy: Callable[[str, str], Optional[str]],
+) -> List[FormRow]:
+    """Word form rows for `selected_words` (rank order, word id = position + 1).
+
+    `lemmas` indexes every WordNet candidate lemma, `attested` is the corpus and
+    dictionary vocabulary used to accept rule-generated forms, `exceptions` maps
+    WordNet POS -> {irregular form: [base forms]}. Rows are sorted by form.
+    """
+    ids = {word: i for i, word in enumerate(selected_words, 1)}
+    rows: Dict[Tuple[str, int], str] = {}
+
+    def add(form: str, word_id: int, kind: str):
+        if form not in ids and (form, word_id) not in rows:
+            rows[(form, word_id)] = kind
+
+    # 1. Irregular forms from the exception lists
+    for pos in sorted(exceptions):
+        for form, bases in sorted(exceptions[pos].items()):
+            for base in bases:
+                if base in ids and form != base:
+                    add(form, ids[base], KIND_INFLECTION)
+
+    # 2. Lemmas that WordNet morphology reduces to a selected word
+    for lemma in sorted(lemmas):
+        if lemma in ids:
+            continue
+        for pos in MORPHY_POS:
+            base = morphy(lemma, pos)
+            if base and base != lemma and base in ids:
+                add(lemma, ids[base], KIND_INFLECTION)
+
+    # 3. Attested regular inflections that aren't lemmas of their own
+    def attested_inflections(word: str, pos: FrozenSet[str]) -> List[str]:
+        return [f for f in regular_inflections(word, pos) if f in attested and f not in lemmas]
+
+    for word, word_id in ids.items():
+        pos = lemmas[word][0] if word in lemmas else frozenset()
+        for form in attested_inflections(word, pos):
+            add(form, word_id, KIND_INFLECTION)
+
+    # 4. Spelling variants sharing a synset, and their inflections
+    for word, word_id in ids.items():
+        if word not in lemmas:
+            continue
+        _, synsets = lemmas[word]
+        for variant in spelling_candidates(word):
+            if variant not in lemmas or not synsets & lemmas[variant][1]:
+                continue
+            add(variant, word_id, KIND_SPELLING)
+            for form in attested_inflections(variant, lemmas[variant][0]):
+                add(form, word_id, KIND_SPELLING)
+
+    return sorted((form, word_id, kind) for (form, word_id), kind in rows.items())
+
+
+# ---------------------------------------------------------------------------
+# WordNet inputs
+# ---------------------------------------------------------------------------
+
+def lemma_index(wn_words: Dict[str, dict]) -> LemmaIndex:
+    """word -> (POS letters, synset names) for get_wordnet_words() output."""
+    return {
+        word: (frozenset(s.pos() for s in meta["synsets"]), frozenset(s.name() for s in meta["synsets"]))
+        for word, meta in wn_words.items()
+    }
+
+
+def load_exceptions() -> Dict[str, Dict[str, List[str]]]:
+    """WordNet exception lists as {pos: {form: [bases]}} (single alphabetic words only)."""
+    from nltk.corpus import wordnet
+
+    exceptions: Dict[str, Dict[str, List[str]]] = {}
+    for pos, name in EXCEPTION_FILES:
+        table: Dict[str, List[str]] = {}
+        for line in wordnet.open(f"{name}.exc"):
+            fields = line.split()
+            if len(fields) < 2 or not fields[0].isalpha():
+                continue
+            table[fields[0].lower()] = [b.lower() for b in fields[1:] if b.isalpha()]
+        exceptions[pos] = table
+    return exceptions
+
+
+def compute_word_forms(
+    selected: List[dict],
+    wn_words: Dict[str, dict],
+    attested: Set[str],
+) -> List[FormRow]:
+    """word_form rows for the selected words (in rank order) from WordNet and the attested vocabulary."""
+    from nltk.corpus import wordnet
+
+    log.info(f"Generating inflected forms and spelling variants for {len(selected)} words...")
+    start_time = time.time()
+    rows = build_word_forms(
+        [item["word"] for item in selected], lemma_index(wn_words), attested,
+        load_exceptions(), wordnet.morphy,
+    )
+    spelling = sum(1 for r in rows if r[2] == KIND_SPELLING)
+    log.info(f"  {len(rows)} forms ({len(rows) - spelling} inflections, {spelling} spelling variants) "
+             f"for {len({r[1] for r in rows})} words in {time.time() - start_time:.1f}s")
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Preview word forms for the selected vocabulary")
+    parser.add_argument("--count", "-n", type=int, default=2000, help="Number of words to select")
+    parser.add_argument("--word", action="append", default=[],
+                        help="Print the forms of this word, or the word this form resolves to")
+    args = parser.parse_args()
+
+    import generate_vocab_db as vocab
+
+    brown_freq, _ = vocab.compute_brown_frequencies()
+    cmu_dict = vocab.load_cmu_dict()
+    wn_words = vocab.get_wordnet_words()
+    selected = vocab.select_words(wn_words, brown_freq, cmu_dict, args.count)
+    rows = compute_word_forms(selected, wn_words, set(brown_freq) | set(cmu_dict))
+
+    words = [item["word"] for item in selected]
+    for word in args.word or words[:10]:
+        word = word.lower()
+        forms = [f"{form} ({kind})" for form, word_id, kind in rows if words[word_id - 1] == word]
+        bases = [words[word_id - 1] for form, word_id, _ in rows if form == word]
+        if forms:
+            print(f"{word}: {', '.join(forms)}")
+        if bases:
+            print(f"{word} -> {', '.join(bases)}")
+        if not forms and not bases:
+            print(f"{word}: no forms")
+
+
+if __name__ == "__main__":
+    main()